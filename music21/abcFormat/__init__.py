@@ -49,6 +49,8 @@ translates those Tokens into music21 objects.
 import unittest
 import re, codecs
 import copy
+import collections
+import os
 
 from music21 import common
 from music21 import environment
@@ -79,8 +81,20 @@ ABC_BARS = [
            (':', 'dotted'),
            ]
 
-# store a mapping of ABC representation to pitch values
-_pitchTranslationCache = {}
+# note event strings collected by the tokenizer that are not yet supported; 
+# some are the result of errors in encoded files
+_unsupportedNoteEvents = frozenset([
+    'w', 'u', 'v', 'v.', 'h', 'H', 'vk', 
+    'uk', 'U', '~',
+    '.', '=', 'V', 'v.', 'S', 's', 'i', 'I', 'ui', 'u.', 'Q', 'Hy', 'Hx', 
+    'r', 'm', 'M', 'n', 'N', 'o', 
+    'l', 'L', 'R',
+    'y', 'T', 't', 'x', 'Z'])
+
+# store a mapping of ABC representation (and key signature) to pitch values
+_pitchTranslationCache = common.TokenCache('abcFormat.pitch')
+# store a mapping of ABC note strings to duration descriptions
+_durationDescriptionCache = common.TokenCache('abcFormat.duration')
 
 
 
@@ -91,6 +105,25 @@ rePitchName = re.compile('[a-gA-Gz]')
 reChordSymbol = re.compile('"[^"]*"') # non greedy
 reChord = re.compile('[.*?]') # non greedy
 
+# master pattern for ABCHandler.tokenize(); alternatives are tried in the 
+# same priority order as the character tests of the original tokenizer. 
+# only ASCII is matched here; any other character is handed to 
+# ABCHandler._tokenizeNonAscii()
+reTokenizer = re.compile(r'''
+      (?P<comment>%[^\n]*)
+    | (?P<metadata>[A-Zw]:(?=[^|])[^\n]*)
+    | (?P<bar>''' + '|'.join(re.escape(sym) for sym, unused_name in ABC_BARS) + r''')
+    | (?P<paren>\((?=.))
+    | (?P<brokenRhythm>[<>]+)
+    | (?P<exclaim>!)
+    | (?P<single>[)\-.u{}vKkM])
+    | (?P<chordSymbol>")
+    | (?P<chord>\[)
+    | (?P<note>[a-jl-tw-zA-GIJN-RU-Z][0-9,/']*
+        | [~^=_HLTS][~=^_vHLTS0-9,/']*(?:(?P<notePitch>[a-gi-tx-zA-GIJKMO-RU-Z])[0-9,/']*)?)
+    | (?P<nonAscii>[^\x00-\x7f])
+    ''', re.VERBOSE | re.DOTALL)
+
 
 #-------------------------------------------------------------------------------
 class ABCTokenException(exceptions21.Music21Exception):
@@ -1076,6 +1109,120 @@ class ABCBrokenRhythmMarker(ABCToken):
 
 
 
+def _translatePitchName(strSrc, name, activeKeySignature=None):
+    '''
+    Translate an ABC note string without chord symbols, and its pitch letter
+    `name`, into a music21 pitch string and an accidental display status.
+    Called by :meth:`~music21.abcFormat.ABCNote._getPitchName`, which
+    caches the results.
+
+    >>> abcFormat._translatePitchName("_g''", 'g')
+    ('G-7', True)
+    '''
+    if name.islower():
+        octave = 5
+    else:
+        octave = 4
+    # look in source string for register modification
+    octave -= strSrc.count(",")
+    octave += strSrc.count("'")
+
+    # get an accidental string
+    accString = ''
+    for i in range(strSrc.count("_")):
+        accString += '-' # m21 symbols
+    for i in range(strSrc.count("^")):
+        accString += '#' # m21 symbols
+    for i in range(strSrc.count("=")):
+        accString += 'n' # m21 symbols
+
+    # if there is an explicit accidental, regardless of key, it should
+    # be shown: this will works for naturals well
+    if accString != '':
+        accidentalDisplayStatus = True
+    # if we do not have a key signature, and have accidentals, set to None
+    elif activeKeySignature == None:
+        accidentalDisplayStatus = None
+    # pitches are key dependent: accidentals are not given
+    # if we have a key and find a name, that does not have a n, must be
+    # altered
+    else:
+        alteredPitches = activeKeySignature.alteredPitches
+        # just the steps, no accientals
+        alteredPitchSteps = [p.step.lower() for p in alteredPitches]
+        # includes #, -
+        alteredPitchNames = [p.name.lower() for p in alteredPitches]
+        #environLocal.printDebug(['alteredPitches', alteredPitches])
+
+        if name.lower() in alteredPitchSteps:
+            # get the corresponding index in the name
+            name = alteredPitchNames[alteredPitchSteps.index(name.lower())]
+        # set to false, as do not need to show w/ key sig
+        accidentalDisplayStatus = False
+
+    # making upper here, but this is not relevant
+    pStr = '%s%s%s' % (name.upper(), accString, octave)
+    return pStr, accidentalDisplayStatus
+
+
+def _getDurationDescription(strSrc):
+    '''
+    Given an ABC note string, return a tuple describing how its duration
+    relates to the active default quarter length: ('default',),
+    ('multiply', factor), ('divide', divisor), or ('fixed', quarterLength).
+    Called by :meth:`~music21.abcFormat.ABCNote._getQuarterLength`, which
+    caches the results.
+
+    >>> abcFormat._getDurationDescription('^F/2')
+    ('divide', 2)
+    >>> abcFormat._getDurationDescription('A3/2')
+    ('multiply', 1.5)
+    >>> abcFormat._getDurationDescription('c')
+    ('default',)
+    '''
+    numStr = []
+    for c in strSrc:
+        if c.isdigit() or c in '/':
+            numStr.append(c)
+    numStr = ''.join(numStr)
+    numStr = numStr.strip()
+
+    #environLocal.printDebug(['numStr', numStr])
+
+    # get default
+    if numStr == '':
+        return ('default',)
+    # if only, shorthand for /2
+    elif numStr == '/':
+        return ('multiply', .5)
+    elif numStr == '//':
+        return ('multiply', .25)
+    elif numStr == '///':
+        return ('multiply', .125)
+    # if a half fraction
+    elif numStr.startswith('/'):
+        return ('divide', int(numStr.split('/')[1]))
+    # uncommon usage: 3/ short for 3/2
+    elif numStr.endswith('/'):
+        n = int(numStr.split('/')[0].strip())
+        d = 2
+        return ('multiply', float(n) / d)
+    # if we have two, this is usually an error
+    elif numStr.count('/') == 2:
+        environLocal.printDebug(['incorrectly encoded / unparsable duration:', numStr])
+        return ('fixed', 1) # provide a default
+
+    # assume we have a complete fraction
+    elif '/' in numStr:
+        n, d = numStr.split('/')
+        n = int(n.strip())
+        d = int(d.strip())
+        return ('multiply', float(n) / d)
+    # not a fraction; a multiplier
+    else: 
+        return ('multiply', int(numStr))
+
+
 class ABCNote(ABCToken):
     '''
     A model of an ABCNote.
@@ -1230,58 +1377,9 @@ class ABCNote(ABCToken):
         else: # may be None
             activeKeySignature = self.activeKeySignature
 
-        try: # returns pStr, accidentalDisplayStatus
-            return _pitchTranslationCache[(strSrc, str(activeKeySignature))] 
-        except KeyError:
-            pass
-
-        if name.islower():
-            octave = 5
-        else:
-            octave = 4
-        # look in source string for register modification
-        octave -= strSrc.count(",")
-        octave += strSrc.count("'")
-
-        # get an accidental string
-        accString = ''
-        for i in range(strSrc.count("_")):
-            accString += '-' # m21 symbols
-        for i in range(strSrc.count("^")):
-            accString += '#' # m21 symbols
-        for i in range(strSrc.count("=")):
-            accString += 'n' # m21 symbols
-
-        # if there is an explicit accidental, regardless of key, it should
-        # be shown: this will works for naturals well
-        if accString != '':
-            accidentalDisplayStatus = True
-        # if we do not have a key signature, and have accidentals, set to None
-        elif activeKeySignature == None:
-            accidentalDisplayStatus = None
-        # pitches are key dependent: accidentals are not given
-        # if we have a key and find a name, that does not have a n, must be
-        # altered
-        else:
-            alteredPitches = activeKeySignature.alteredPitches
-            # just the steps, no accientals
-            alteredPitchSteps = [p.step.lower() for p in alteredPitches]
-            # includes #, -
-            alteredPitchNames = [p.name.lower() for p in alteredPitches]
-            #environLocal.printDebug(['alteredPitches', alteredPitches])
-
-            if name.lower() in alteredPitchSteps:
-                # get the corresponding index in the name
-                name = alteredPitchNames[alteredPitchSteps.index(name.lower())]
-            # set to false, as do not need to show w/ key sig
-            accidentalDisplayStatus = False
-
-        # making upper here, but this is not relevant
-        pStr = '%s%s%s' % (name.upper(), accString, octave)
-
-        # store in global cache
-        _pitchTranslationCache[(strSrc, str(activeKeySignature))] = pStr, accidentalDisplayStatus
-        return pStr, accidentalDisplayStatus
+        # returns pStr, accidentalDisplayStatus
+        return _pitchTranslationCache.get((strSrc, str(activeKeySignature)), 
+                        _translatePitchName, strSrc, name, activeKeySignature)
 
 
     def _getQuarterLength(self, strSrc, forceDefaultQuarterLength=None):
@@ -1333,47 +1431,16 @@ class ABCNote(ABCToken):
         if activeDefaultQuarterLength == None:
             raise ABCTokenException('cannot calculate quarter length without a default quarter length')
 
-        numStr = []
-        for c in strSrc:
-            if c.isdigit() or c in '/':
-                numStr.append(c)
-        numStr = ''.join(numStr)
-        numStr = numStr.strip()
-
-        #environLocal.printDebug(['numStr', numStr])
-
-        # get default
-        if numStr == '':
+        description = _durationDescriptionCache.get(strSrc, _getDurationDescription)
+        kind = description[0]
+        if kind == 'default':
             ql = activeDefaultQuarterLength
-        # if only, shorthand for /2
-        elif numStr == '/':
-            ql = activeDefaultQuarterLength * .5
-        elif numStr == '//':
-            ql = activeDefaultQuarterLength * .25
-        elif numStr == '///':
-            ql = activeDefaultQuarterLength * .125
-        # if a half fraction
-        elif numStr.startswith('/'):
-            ql = activeDefaultQuarterLength / int(numStr.split('/')[1])
-        # uncommon usage: 3/ short for 3/2
-        elif numStr.endswith('/'):
-            n = int(numStr.split('/')[0].strip())
-            d = 2
-            ql = activeDefaultQuarterLength * (float(n) / d)
-        # if we have two, this is usually an error
-        elif numStr.count('/') == 2:
-            environLocal.printDebug(['incorrectly encoded / unparsable duration:', numStr])
-            ql = 1 # provide a default
-
-        # assume we have a complete fraction
-        elif '/' in numStr:
-            n, d = numStr.split('/')
-            n = int(n.strip())
-            d = int(d.strip())
-            ql = activeDefaultQuarterLength * (float(n) / d)
-        # not a fraction; a multiplier
-        else: 
-            ql = activeDefaultQuarterLength * int(numStr)
+        elif kind == 'multiply':
+            ql = activeDefaultQuarterLength * description[1]
+        elif kind == 'divide':
+            ql = activeDefaultQuarterLength / description[1]
+        else: # fixed
+            ql = description[1]
 
         if self.brokenRhythmMarker != None:
             symbol, direction = self.brokenRhythmMarker
@@ -1628,6 +1695,233 @@ class ABCHandler(object):
         >>> abch.tokenize('X: 1')
         >>> abch._tokens
         [<music21.abcFormat.ABCMetadata 'X: 1'>]
+
+        Tokens are found with a single compiled regular expression 
+        (`reTokenizer`) that jumps from one token to the next, rather 
+        than examining each character in turn; the resulting tokens are 
+        identical to those of the character-by-character scan.
+
+        >>> abch = abcFormat.ABCHandler()
+        >>> abch.tokenize('(3"C"^F,/2 G2 :|2 [ceg]>d')
+        >>> abch._tokens
+        [<music21.abcFormat.ABCTuplet '(3'>, <music21.abcFormat.ABCNote '"C"^F,/2'>, 
+         <music21.abcFormat.ABCNote 'G2'>, <music21.abcFormat.ABCBar ':|'>, 
+         <music21.abcFormat.ABCBar '[2'>, <music21.abcFormat.ABCChord '[ceg]'>, 
+         <music21.abcFormat.ABCBrokenRhythmMarker '>'>, <music21.abcFormat.ABCNote 'd'>]
+        '''
+        tokens = self._tokens
+        lastIndex = len(strSrc) - 1
+        activeChordSymbol = '' # accumulate, then prepend
+
+        search = reTokenizer.search
+        singleTokens = {')': ABCParenStop, 
+                        '-': ABCTie, 
+                        '.': ABCStaccato, 
+                        'u': ABCUpbow, 
+                        '{': ABCGraceStart, 
+                        '}': ABCGraceStop, 
+                        'v': ABCDownbow, 
+                        'K': ABCAccent, 
+                        'k': ABCStraccent, 
+                        'M': ABCTenuto,
+                        }
+        exclaimDict = {'!crescendo(!': ABCCrescStart,
+                        '!crescendo)!': ABCParenStop,
+                        '!diminuendo(!': ABCDimStart,
+                        '!diminuendo)!': ABCParenStop,
+                        }
+
+        currentIndex = 0
+        while currentIndex <= lastIndex:
+            m = search(strSrc, currentIndex)
+            if m is None:
+                break
+            kind = m.lastgroup
+            currentIndex = m.start()
+            # by default, continue after the matched text
+            nextIndex = m.end()
+
+            if kind == 'note':
+                # the pitch letter is found directly, or is not needed
+                # when the event starts with anything but a decorator
+                foundPitchAlpha = (m.group('notePitch') is not None or 
+                                   strSrc[currentIndex] not in '~^=_HLTS')
+                j = nextIndex
+                # rare: non-ascii characters continuing the note event
+                if j <= lastIndex and strSrc[j] > '\x7f':
+                    j = self._getNoteEventEnd(strSrc, j, foundPitchAlpha)
+                collect = strSrc[currentIndex:j]
+                if activeChordSymbol != '':
+                    collect = activeChordSymbol + collect
+                    activeChordSymbol = '' # reset
+                self._appendNoteEvent(collect)
+                nextIndex = j
+            elif kind == 'bar':
+                # filter and replace with 2 tokens if necessary
+                tokens.extend(self.barlineTokenFilter(m.group()))
+            elif kind == 'single':
+                c = m.group()
+                tokens.append(singleTokens[c](c))
+            elif kind == 'metadata':
+                tokens.append(ABCMetadata(m.group().strip()))
+            elif kind == 'comment':
+                pass
+            elif kind == 'paren':
+                # get tuplet indicators: (2, (3
+                # TODO: extended tuplets look like this: (p:q:r or (3::
+                if strSrc[currentIndex + 1].isdigit():
+                    nextIndex = currentIndex + 2 # always two characters
+                    tokens.append(ABCTuplet(strSrc[currentIndex:nextIndex]))
+                else: # a slur
+                    tokens.append(ABCSlurStart('('))
+            elif kind == 'chordSymbol':
+                # there may be more than one chord symbol: need to accumulate
+                nextIndex = self._getSpanEnd(strSrc, currentIndex, '"')
+                activeChordSymbol += strSrc[currentIndex:nextIndex]
+            elif kind == 'chord':
+                nextIndex = self._getSpanEnd(strSrc, currentIndex, ']')
+                # prepend chord symbol
+                collect = activeChordSymbol + strSrc[currentIndex:nextIndex]
+                activeChordSymbol = '' # reset
+                tokens.append(ABCChord(collect))
+            elif kind == 'brokenRhythm':
+                # the final character of the source is never collected
+                # as part of a preceding run
+                nextIndex = max(currentIndex + 1, min(nextIndex, lastIndex))
+                tokens.append(ABCBrokenRhythmMarker(
+                    strSrc[currentIndex:nextIndex]))
+            elif kind == 'exclaim':
+                #get dynamics. skip over the open paren to avoid confusion.
+                #NB: Nested crescendos are not an issue (not proper grammar).
+                j = strSrc.find('!', currentIndex + 1, currentIndex + 20)
+                if j != -1:
+                    exclaimClass = exclaimDict.get(strSrc[currentIndex:j+1])
+                    #NB: We're currently skipping over all other "!" expressions
+                    if exclaimClass is not None:
+                        tokens.append(exclaimClass('!'))
+                    nextIndex = j + 1
+            else: # nonAscii
+                nextIndex, activeChordSymbol = self._tokenizeNonAscii(
+                    strSrc, currentIndex, activeChordSymbol)
+            currentIndex = nextIndex
+
+    def _getSpanEnd(self, strSrc, i, closeChar):
+        '''
+        Return the index after the `closeChar` that closes a span (a chord 
+        symbol or chord) that opens at index i. The final character of 
+        the source is not searched; if no `closeChar` is found the end of
+        the source is returned.
+
+        >>> ah = abcFormat.ABCHandler()
+        >>> ah._getSpanEnd('"Am"c', 0, '"')
+        4
+        >>> ah._getSpanEnd('[ceg', 0, ']')
+        4
+        '''
+        j = strSrc.find(closeChar, i + 1, len(strSrc) - 1)
+        if j == -1:
+            return len(strSrc)
+        return j + 1
+
+    def _getNoteEventEnd(self, strSrc, j, foundPitchAlpha=False):
+        '''
+        Continue scanning a note event one character at a time from index j, 
+        returning the index of the first character that is not part of 
+        the event. Used by tokenize() for non-ASCII sources.
+
+        >>> ah = abcFormat.ABCHandler()
+        >>> ah._getNoteEventEnd('^^c,4 d', 1)
+        5
+        >>> ah._getNoteEventEnd('^^c,4 d', 3, foundPitchAlpha=True)
+        5
+        '''
+        lastIndex = len(strSrc) - 1
+        while j <= lastIndex:
+            # if we have not found pitch alpha
+            # ornaments may precede note names
+            # accidentals (^=_) staccato (.), up/down bow (u, v)
+            if (foundPitchAlpha == False and 
+                strSrc[j] in '~=^_vHLTS'):
+                j += 1
+                continue                    
+            # only allow one pitch alpha to be a continue condition
+            elif (foundPitchAlpha == False and strSrc[j].isalpha() 
+                and strSrc[j] not in '~wuvhHLTSN'):
+                foundPitchAlpha = True
+                j += 1
+                continue                    
+            # continue conditions after alpha: 
+            # , register modifiaciton (, ') or number, rhythm indication
+            # number, /, 
+            elif strSrc[j].isdigit() or strSrc[j] in ',/,\'':
+                j += 1
+                continue
+            else: # space, all else: break
+                break
+        return j
+
+    def _tokenizeNonAscii(self, strSrc, i, activeChordSymbol):
+        '''
+        Tokenize a non-ASCII character found at index i, which can only 
+        begin a metadata line or a note event (if it is alphabetic). 
+        Returns the index at which to resume and the (possibly consumed) 
+        active chord symbol.
+        '''
+        c = strSrc[i]
+        if (c.isalpha() and c.isupper() and strSrc[i+1:i+2] == ':' 
+                and strSrc[i+2:i+3] not in ('', '|')):
+            j = strSrc.find('\n', i + 1)
+            if j == -1:
+                j = len(strSrc)
+            self._tokens.append(ABCMetadata(strSrc[i:j].strip()))
+            return j, activeChordSymbol
+        if c.isalpha():
+            j = self._getNoteEventEnd(strSrc, i + 1, foundPitchAlpha=True)
+            self._appendNoteEvent(activeChordSymbol + strSrc[i:j])
+            return j, ''
+        return i + 1, activeChordSymbol
+
+    def _appendNoteEvent(self, collect):
+        '''
+        Append an ABCNote for the collected note event string, 
+        unless it is one of the markers or articulations that are 
+        not yet supported.
+        '''
+        #environLocal.printDebug(['got note event:', repr(collect)])
+
+        # NOTE: skipping a number of articulations and other markers
+        # not yet supported
+        # some collections here are not yet supported; others may be 
+        # the result of errors in encoded files
+        # v is up bow; might be: "^Segno"v which also should be dropped
+        # H is fermata
+        # . dot may be staccato, but should be attached to pitch
+        if collect in _unsupportedNoteEvents:
+            pass
+        # these are bad chords, or other problematic notations like
+        # "D.C."x
+        elif collect[0] == '"' and (collect[-1] in 'uvkKQ.yTwhx' 
+                                    or collect.endswith('v.')):
+            pass
+        elif collect[0] in 'xHZ':
+            pass
+        # not sure what =20 refers to
+        elif len(collect) > 1 and collect[0] == "=" and collect[1].isdigit():
+            pass    
+        # only let valid collect strings be parsed
+        else:    
+            self._tokens.append(ABCNote(collect))
+
+    def _tokenizeByCharacter(self, strSrc):
+        '''
+        The original tokenizer, which walks the abc string one character 
+        at a time. Retained as a reference for testing :meth:`tokenize`, 
+        which produces the same tokens much faster.
+
+        >>> abch = abcFormat.ABCHandler()
+        >>> abch._tokenizeByCharacter('X: 1')
+        >>> abch._tokens
+        [<music21.abcFormat.ABCMetadata 'X: 1'>]
         '''
         currentIndex = -1
         collect = []
@@ -1876,35 +2170,7 @@ class ABCHandler(object):
                     activeChordSymbol = '' # reset
                 else:
                     collect = strSrc[currentIndex:j]
-                #environLocal.printDebug(['got note event:', repr(collect)])
-
-                # NOTE: skipping a number of articulations and other markers
-                # not yet supported
-                # some collections here are not yet supported; others may be 
-                # the result of errors in encoded files
-                # v is up bow; might be: "^Segno"v which also should be dropped
-                # H is fermata
-                # . dot may be staccato, but should be attached to pitch
-                if collect in ['w', 'u', 'v', 'v.', 'h', 'H', 'vk', 
-                    'uk', 'U', '~',
-                    '.', '=', 'V', 'v.', 'S', 's', 'i', 'I', 'ui', 'u.', 'Q', 'Hy', 'Hx', 
-                    'r', 'm', 'M', 'n', 'N', 'o', 
-                    'l', 'L', 'R',
-                    'y', 'T', 't', 'x', 'Z']:
-                    pass
-                # these are bad chords, or other problematic notations like
-                # "D.C."x
-                elif collect.startswith('"') and (collect[-1] in 
-                    ['u', 'v', 'k', 'K', 'Q', '.',    'y', 'T', 'w', 'h', 'x'] or collect.endswith('v.')):
-                    pass
-                elif collect.startswith('x') or collect.startswith('H') or collect.startswith('Z'):
-                    pass
-                # not sure what =20 refers to
-                elif len(collect) > 1 and collect.startswith("=") and collect[1].isdigit():
-                    pass    
-                # only let valid collect strings be parsed
-                else:    
-                    self._tokens.append(ABCNote(collect))
+                self._appendNoteEvent(collect)
                 skipAhead = j - (currentIndex + 1)
                 continue
             # look for white space: can be used to determine beam groups
@@ -2678,13 +2944,79 @@ def mergeLeadingMetaData(barHandlers):
 
     return mergedHandlers
 
+#-------------------------------------------------------------------------------
+# a reference number line in the raw bytes of a file
+reReferenceNumberLine = re.compile(br'^[ \t\r\f\v]*X:([^\n]*)', re.MULTILINE)
+
+# file path : ((modification time, size), index)
+_referenceNumberIndexCache = {}
+
+def getReferenceNumberIndex(filePath):
+    '''
+    Return an OrderedDict mapping each reference number (X:) defined in 
+    the ABC file at `filePath` to a (start, end) pair of byte offsets 
+    delimiting that work in the file. Numbers are given as ints when 
+    possible. If a number is defined more than once, only the first 
+    work is indexed.
+
+    The index is built by a single scan of the file and is cached; 
+    it is rebuilt only if the file is modified. This lets a single work 
+    be read from a large collection without reading or 
+    tokenizing the rest of the file.
+
+    >>> import os
+    >>> fp = os.path.join(common.getSourceFilePath(), 'corpus', 'essenFolksong', 'teste.abc')
+    >>> index = abcFormat.getReferenceNumberIndex(fp)
+    >>> list(index.keys())
+    [1, 2, 3, 4, 5, 6, 7, 8]
+    >>> start, end = index[6]
+    >>> with open(fp, 'rb') as f:
+    ...     unused = f.seek(start)
+    ...     print(f.read(end - start).decode('utf-8').splitlines()[1])
+    T: Moli hua
+    >>> abcFormat.getReferenceNumberIndex(fp) is index
+    True
+    '''
+    fileStat = os.stat(filePath)
+    cacheKey = (fileStat.st_mtime, fileStat.st_size)
+    cached = _referenceNumberIndexCache.get(filePath)
+    if cached is not None and cached[0] == cacheKey:
+        return cached[1]
+
+    with open(filePath, 'rb') as f:
+        data = f.read()
+
+    starts = []
+    for m in reReferenceNumberLine.finditer(data):
+        numberStr = m.group(1).replace(b' ', b'').strip().decode('utf-8', 'ignore')
+        try:
+            number = int(numberStr)
+        except ValueError:
+            number = numberStr
+        starts.append((number, m.start()))
+
+    index = collections.OrderedDict()
+    for i, (number, start) in enumerate(starts):
+        if number in index:
+            continue
+        if i < len(starts) - 1:
+            end = starts[i + 1][1]
+        else:
+            end = len(data)
+        index[number] = (start, end)
+
+    _referenceNumberIndexCache[filePath] = (cacheKey, index)
+    return index
+
+
 #-------------------------------------------------------------------------------
 class ABCFile(object):
     '''
     ABC File or String access
     '''
     def __init__(self): 
-        pass
+        self.file = None
+        self.filename = None
 
     def open(self, filename): 
         '''
@@ -2719,9 +3051,48 @@ class ABCFile(object):
         which processes all tokens. 
 
         If `number` is given, a work number will be extracted if possible. 
+        When the file was opened by name, only that work is read from disk, 
+        using the index from :func:`~music21.abcFormat.getReferenceNumberIndex`.
         '''
+        if number is not None and self.filename is not None:
+            return self.readstr(self.extractReferenceNumberFromFile(number))
         return self.readstr(self.file.read(), number) 
 
+    def extractReferenceNumberFromFile(self, number):
+        '''
+        Return the source of a single reference number from the opened 
+        file, seeking directly to its position in the file.
+
+        >>> import os
+        >>> fp = os.path.join(common.getSourceFilePath(), 'corpus', 'essenFolksong', 'teste.abc')
+        >>> af = abcFormat.ABCFile()
+        >>> af.open(fp)
+        >>> print(af.extractReferenceNumberFromFile(6).splitlines()[1])
+        T: Moli hua
+        >>> af.extractReferenceNumberFromFile(20)
+        Traceback (most recent call last):
+        ABCFileException: cannot find requested reference number in source file: 20
+        >>> af.close()
+        '''
+        index = getReferenceNumberIndex(self.filename)
+        span = index.get(number)
+        if span is None:
+            # some numbers are like X:0490 but we may request them as 490...
+            try:
+                span = index.get(int(number))
+            except (ValueError, TypeError):
+                pass
+        if span is None:
+            span = index.get(str(number))
+        if span is None:
+            raise ABCFileException('cannot find requested reference number in source file: %s' % number)
+
+        start, end = span
+        with open(self.filename, 'rb') as f:
+            f.seek(start)
+            data = f.read(end - start)
+        return data.decode('utf-8')
+
 
     def extractReferenceNumber(self, strSrc, number):
         '''
@@ -2815,6 +3186,27 @@ class Test(unittest.TestCase):
 
             self.assertEqual(countNotes, noteTokens)
             self.assertEqual(countChords, chordTokens)
+
+    def _tokenSummary(self, tokens):
+        return [(t.__class__.__name__, t.src) for t in tokens]
+
+    def testTokenizeMatchesCharacterTokenizer(self):
+        from music21.abcFormat import testFiles
+
+        extra = ['X:1\nL:1/8\n"C"d!crescendo(!e!fermata!f!crescendo)! (3ABc|', 
+                 '(AB) {g}c- c .d ud vd Kd kd Md ~^=_e >> f>', 
+                 'X:|X: K:|\n[|:[ce]"Am"[ce "D.C."x =20 ^^', 
+                 u'T:Tr\u00e4umerei\nL:1/4\n\u00e9\u00e82 ^\u00e9, | \u00c9:foo\n', 
+                 '(', 'c>>', '"Am', '[ce', 
+                 ]
+        for tf in testFiles.ALL + extra:
+            ahFast = ABCHandler()
+            ahFast.tokenize(tf)
+            ahChar = ABCHandler()
+            ahChar._tokenizeByCharacter(tf)
+            self.assertEqual(self._tokenSummary(ahFast._tokens), 
+                             self._tokenSummary(ahChar._tokens))
+
         
 
     def testRe(self):
@@ -3109,6 +3501,23 @@ class Test(unittest.TestCase):
         ah = af.read(339) # returns a parsed handler
         af.close()
         self.assertEqual(len(ah), 101)
+
+    def testExtractReferenceNumberFromFile(self):
+        from music21 import corpus
+        fp = corpus.getWork('essenFolksong/han1')
+        index = getReferenceNumberIndex(fp)
+        self.assertEqual(len(index), len(set(index.keys())))
+
+        af = ABCFile()
+        af.open(fp)
+        strSrc = af.file.read()
+        for number in list(index.keys())[::25] + [339, '339']:
+            fromText = af.extractReferenceNumber(strSrc, number)
+            fromIndex = af.extractReferenceNumberFromFile(number)
+            # the indexed version retains the final line break
+            self.assertEqual(fromIndex.rstrip('\r\n'), fromText.rstrip('\r\n'))
+        af.close()
+        self.assertRaises(ABCFileException, af.extractReferenceNumberFromFile, 10000)
         
     def testSlurs(self):
         from music21.abcFormat import testFiles
@@ -3292,6 +3701,28 @@ class Test(unittest.TestCase):
         
         
 
+
+class TestSlow(unittest.TestCase):
+    
+    def runTest(self):
+        pass
+
+    def testTokenizeCorpusMatchesCharacterTokenizer(self):
+        from music21 import corpus
+
+        for fp in corpus.getCorePaths('abc'):
+            with codecs.open(fp, encoding='utf-8') as f:
+                strSrc = f.read()
+            ahFast = ABCHandler()
+            ahFast.tokenize(strSrc)
+            ahChar = ABCHandler()
+            ahChar._tokenizeByCharacter(strSrc)
+            self.assertEqual(len(ahFast), len(ahChar), fp)
+            for tFast, tChar in zip(ahFast.tokens, ahChar.tokens):
+                self.assertEqual(tFast.__class__, tChar.__class__, fp)
+                self.assertEqual(tFast.src, tChar.src, fp)
+
+
 #-------------------------------------------------------------------------------
 # define presented order in documentation
 _DOC_ORDER = [ABCFile, ABCHandler, ABCHandlerBar]
@@ -3300,7 +3731,7 @@ _DOC_ORDER = [ABCFile, ABCHandler, ABCHandlerBar]
 if __name__ == "__main__":
     # sys.arg test options will be used in mainTest()
     import music21
-    music21.mainTest(Test)
+    music21.mainTest(Test, TestSlow)
 
 
 #------------------------------------------------------------------------------
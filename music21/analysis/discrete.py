@@ -22,6 +22,7 @@ The :class:`music21.analysis.discrete.KrumhanslSchmuckler`
 :class:`music21.analysis.discrete.Ambitus` (for pitch range analysis) provide examples.
 '''
 
+import fractions
 import unittest
 
 from music21 import exceptions21
@@ -155,6 +156,35 @@ class DiscreteAnalysis(object):
         '''
         pass
 
+    def getWindowSummaries(self, windowStreams):
+        '''
+        Given a list of the minimum windows of a 
+        :class:`~music21.analysis.windowed.WindowedAnalysis`, return a list 
+        with a summary of each window, such that the summary of a larger 
+        window can be found with :meth:`combineWindowSummaries` and then 
+        processed with :meth:`processWindowSummary`, giving the same results 
+        as :meth:`process` on that window. 
+
+        Return None (the default) if the results cannot be found this way; 
+        each window is then given to :meth:`process`.
+        '''
+        return None
+
+    def combineWindowSummaries(self, first, second):
+        '''
+        Given the summaries of two adjacent windows, return the summary of 
+        the window that contains both. Must be associative, and must not 
+        change either summary.
+        '''
+        pass
+
+    def processWindowSummary(self, summary):
+        '''
+        Given a summary of a window, return a solution and a color value, 
+        as :meth:`process` would for that window.
+        '''
+        pass
+
 
 #------------------------------------------------------------------------------
 # alternative names
@@ -203,6 +233,8 @@ class KeyWeightKeyAnalysis(DiscreteAnalysis):
         self._majorKeyColors = {}
         self._minorKeyColors = {}
         self._fillColorDictionaries()
+        # rotated weights for each weight type, made on first use
+        self._weightRows = {}
     
     def _fillColorDictionaries(self):
         '''
@@ -326,6 +358,41 @@ class KeyWeightKeyAnalysis(DiscreteAnalysis):
         return pcDist
 
 
+    def _getWeightRows(self, weightType='major'):
+        '''
+        Return a tuple of three lists for a weight type, computed once for
+        each analysis object: the weights rotated to each of the twelve
+        tonics, the same rows less the average weight, and the sum of the
+        squares of each of those rows.
+
+        >>> a = analysis.discrete.KrumhanslSchmuckler()
+        >>> rotated, centered, sumSquares = a._getWeightRows('major')
+        >>> rotated[2][2], rotated[2][0]
+        (6.35, 2.29)
+        >>> len(centered), len(sumSquares)
+        (12, 12)
+        '''
+        if weightType in self._weightRows:
+            return self._weightRows[weightType]
+        toneWeights = self._getWeights(weightType)
+        profileAverage = float(sum(toneWeights)) / len(toneWeights)
+        rotated = []
+        centered = []
+        sumSquares = []
+        for i in range(12):
+            row = [toneWeights[(j - i) % 12] for j in range(len(toneWeights))]
+            centeredRow = [w - profileAverage for w in row]
+            # summed in the same order as a correlation of a single 
+            # distribution, so that results do not change
+            total = 0
+            for w in centeredRow:
+                total = total + (w ** 2)
+            rotated.append(row)
+            centered.append(centeredRow)
+            sumSquares.append(total)
+        self._weightRows[weightType] = (rotated, centered, sumSquares)
+        return self._weightRows[weightType]
+
     def _convoluteDistribution(self, pcDistribution, weightType='major'):
         ''' Takes in a pitch class distribution as a list and convolutes it
             over Sapp's given distribution for finding key, returning the result. 
@@ -334,11 +401,12 @@ class KeyWeightKeyAnalysis(DiscreteAnalysis):
         if pcDistribution == None:
             return None
 
-        soln = [0] * 12
-        toneWeights = self._getWeights(weightType)
-        for i in range(len(soln)):
-            for j in range(len(pcDistribution)):
-                soln[i] = soln[i] + (toneWeights[(j - i) % 12] * pcDistribution[j])
+        soln = []
+        for row in self._getWeightRows(weightType)[0]:
+            total = 0
+            for w, d in zip(row, pcDistribution):
+                total = total + (w * d)
+            soln.append(total)
         return soln  
     
     def _getLikelyKeys(self, keyResults, differences):
@@ -349,16 +417,19 @@ class KeyWeightKeyAnalysis(DiscreteAnalysis):
         if keyResults == None:
             return None
 
-        likelyKeys = [0] * 12
-        a = sorted(keyResults)
-        a.reverse()
-        
+        # as with keyResults.index(), equal results all get the first
+        # pitch class with that result
+        firstIndex = {}
+        for i, result in enumerate(keyResults):
+            if result not in firstIndex:
+                firstIndex[result] = i
+
+        likelyKeys = []
         #Return pairs, the pitch class and the correlation value, in order by point value
-        for i in range(len(a)):
+        for result in sorted(keyResults, reverse=True):
             # pitch objects created here
-            likelyKeys[i] = (pitch.Pitch(keyResults.index(a[i])),
-                             differences[keyResults.index(a[i])])
-            #environLocal.printDebug(['added likely key', likelyKeys[i]])
+            i = firstIndex[result]
+            likelyKeys.append((pitch.Pitch(i), differences[i]))
         return likelyKeys
         
         
@@ -370,32 +441,59 @@ class KeyWeightKeyAnalysis(DiscreteAnalysis):
         if keyResults == None:
             return None
  
-        soln = [0] * 12
-        top = [0] * 12
-        bottomRight = [0] * 12
-        bottomLeft = [0] * 12
-            
-        toneWeights = self._getWeights(weightType)
-        profileAverage = float(sum(toneWeights)) / len(toneWeights)
+        unused_rotated, centered, sumSquares = self._getWeightRows(weightType)
         histogramAverage = float(sum(pcDistribution)) / len(pcDistribution) 
-            
-        for i in range(len(soln)):
-            for j in range(len(toneWeights)):
-                top[i] = top[i] + ((
-                    toneWeights[(j - i) % 12]-profileAverage) * (
-                    pcDistribution[j]-histogramAverage))
-
-                bottomRight[i] = bottomRight[i] + ((
-                    toneWeights[(j-i)%12]-profileAverage)**2)
-                bottomLeft[i] = bottomLeft[i] + ((
-                    pcDistribution[j]-histogramAverage)**2)
-
-                if (bottomRight[i] == 0 or bottomLeft[i] == 0):
-                    soln[i] = 0
-                else:
-                    soln[i] = float(top[i]) / ((bottomRight[i]*bottomLeft[i])**.5)
+        centeredDistribution = [d - histogramAverage for d in pcDistribution]
+        bottomLeft = 0
+        for d in centeredDistribution:
+            bottomLeft = bottomLeft + (d ** 2)
+
+        soln = []
+        for centeredRow, bottomRight in zip(centered, sumSquares):
+            if bottomRight == 0 or bottomLeft == 0:
+                soln.append(0)
+                continue
+            top = 0
+            for w, d in zip(centeredRow, centeredDistribution):
+                top = top + (w * d)
+            soln.append(float(top) / ((bottomRight * bottomLeft) ** .5))
         return soln    
 
+    def getKeyCorrelations(self, pcDistributions):
+        '''
+        Given a list of pitch class distributions (lists of twelve values, 
+        such as those of many windows of a Stream), return for each one a 
+        list of the correlations of the distribution with the weights of all 
+        24 keys: the major keys on C, C#, D, ... B and then the minor keys on 
+        C, C#, D, ... B. The weights are rotated only once for all of the 
+        distributions. A distribution of None (an empty window) gives None.
+
+        >>> ks = analysis.discrete.KrumhanslSchmuckler()
+        >>> cMajorScale = [1, 0, 1, 0, 1, 1, 0, 1, 0, 1, 0, 1]
+        >>> correlations = ks.getKeyCorrelations([cMajorScale, None])
+        >>> len(correlations[0])
+        24
+        >>> correlations[0].index(max(correlations[0]))
+        0
+        >>> round(correlations[0][0], 4), round(correlations[0][12 + 9], 4)
+        (0.7534, 0.7121)
+        >>> correlations[1] is None
+        True
+        '''
+        post = []
+        for pcDistribution in pcDistributions:
+            if pcDistribution is None:
+                post.append(None)
+                continue
+            correlations = []
+            for weightType in ('major', 'minor'):
+                # the convolution is not needed for correlations, only 
+                # to show that this is not an empty analysis
+                correlations += self._getDifference(True, pcDistribution, 
+                                                    weightType)
+            post.append(correlations)
+        return post
+
     def solutionLegend(self, compress=False):
         ''' Returns a list of lists of possible results for the creation of a legend.
 
@@ -485,7 +583,9 @@ class KeyWeightKeyAnalysis(DiscreteAnalysis):
     def _likelyKeys(self, sStream):
         pcDistribution = self._getPitchClassDistribution(sStream)
         #environLocal.printDebug(['process(); pcDistribution', pcDistribution])
-    
+        return self._likelyKeysFromDistribution(pcDistribution)
+
+    def _likelyKeysFromDistribution(self, pcDistribution):
         keyResultsMajor = self._convoluteDistribution(pcDistribution, 'major')
         differenceMajor = self._getDifference(keyResultsMajor, 
                           pcDistribution, 'major')
@@ -571,6 +671,122 @@ class KeyWeightKeyAnalysis(DiscreteAnalysis):
         #pcDistribution = [9,0,3,0,2,5,0,2,0,2,2,0]
     
         likelyKeysMajor, likelyKeysMinor = self._likelyKeys(sStream)
+        return self._processLikelyKeys(likelyKeysMajor, likelyKeysMinor, 
+                                       storeAlternatives, sStream)
+
+    def processDistributions(self, pcDistributions, storeAlternatives=False):
+        '''
+        Like :meth:`process`, but for a list of pitch class distributions 
+        (as made by `_getPitchClassDistribution`, one for each window of a 
+        Stream) instead of a Stream, returning a list of (solution, color) 
+        pairs. The weights are rotated only once for all of the distributions.
+
+        >>> ks = analysis.discrete.KrumhanslSchmuckler()
+        >>> results = ks.processDistributions([[1, 0, 1, 0, 1, 1, 0, 1, 0, 1, 0, 1], 
+        ...                                    [0, 0, 2, 0, 0, 1, 0, 0, 0, 1, 0, 0]])
+        >>> [solution for solution, color in results]
+        [(<music21.pitch.Pitch C>, 'major', 0.753...), (<music21.pitch.Pitch D>, 'minor', 0.920...)]
+
+        Empty distributions (None) raise an exception, as with an empty Stream:
+
+        >>> ks.processDistributions([None])
+        Traceback (most recent call last):
+        DiscreteAnalysisException: failed to get likely keys for Stream component
+        '''
+        post = []
+        for pcDistribution in pcDistributions:
+            likelyKeysMajor, likelyKeysMinor = self._likelyKeysFromDistribution(
+                                                                pcDistribution)
+            post.append(self._processLikelyKeys(likelyKeysMajor, likelyKeysMinor, 
+                                                storeAlternatives))
+        return post
+
+    def getWindowSummaries(self, windowStreams):
+        '''
+        Return the pitch class distribution of each window (None for windows 
+        without notes).
+
+        >>> ks = analysis.discrete.KrumhanslSchmuckler()
+        >>> s = converter.parse('tinynotation: 4/4 c4 e g8 g c4')
+        >>> wa = analysis.windowed.WindowedAnalysis(s, ks)
+        >>> summaries = ks.getWindowSummaries(wa._windowedStream)
+        >>> summaries[2]
+        [0, 0, 0, 0, 0, 0, 0, 1.0, 0, 0, 0, 0]
+        >>> ks.combineWindowSummaries(summaries[0], summaries[2])
+        [1.0, 0, 0, 0, 0, 0, 0, 1.0, 0, 0, 0, 0]
+        >>> ks.processWindowSummary(summaries[2]) == ks.process(wa._windowedStream[2])
+        True
+
+        If any note has a duration (such as a triplet) that is not exactly a 
+        float, the distribution of a window would depend on the order in which
+        durations are added; each summary is then instead a tuple of the 
+        pitch class and duration of each pitch of the window, in order, from 
+        which the distribution is made when the summary is processed.
+        Combining and processing these summaries takes time proportional to
+        the number of pitches in the window, so such scores are analyzed no
+        faster than by analyzing each window separately.
+
+        >>> s = converter.parse('tinynotation: 4/4 trip{c8 d e} g4')
+        >>> wa = analysis.windowed.WindowedAnalysis(s, ks)
+        >>> ks.getWindowSummaries(wa._windowedStream)[0]
+        ((0, Fraction(1, 3)), (2, Fraction(1, 3)), (4, Fraction(1, 3)))
+        '''
+        notesOfWindows = [w.flat.notesAndRests.notes for w in windowStreams]
+        exact = True
+        for notes in notesOfWindows:
+            for n in notes:
+                if isinstance(n.quarterLength, fractions.Fraction):
+                    exact = False
+                    break
+            if not exact:
+                break
+        if exact:
+            return [self._getPitchClassDistribution(notes) for notes in notesOfWindows]
+
+        summaries = []
+        for notes in notesOfWindows:
+            if len(notes) == 0:
+                summaries.append(None)
+                continue
+            durations = []
+            for n in notes:
+                length = n.quarterLength
+                if n.isChord:
+                    for m in n.pitchClasses:
+                        durations.append((m, length))
+                else:
+                    durations.append((n.pitchClass, length))
+            summaries.append(tuple(durations))
+        return summaries
+
+    def combineWindowSummaries(self, first, second):
+        if first is None:
+            return second
+        elif second is None:
+            return first
+        elif isinstance(first, tuple): # durations in order
+            return first + second
+        return [a + b for a, b in zip(first, second)]
+
+    def processWindowSummary(self, summary):
+        if isinstance(summary, tuple): # durations in order
+            # adds as the stream would: exactly, until a float is involved
+            pcDistribution = [0] * 12
+            for m, length in summary:
+                total = pcDistribution[m]
+                if isinstance(total, float) or isinstance(length, float):
+                    pcDistribution[m] = float(total) + float(length)
+                else:
+                    pcDistribution[m] = total + length
+        else:
+            pcDistribution = summary
+        return self.processDistributions([pcDistribution])[0]
+
+    def _processLikelyKeys(self, likelyKeysMajor, likelyKeysMinor, 
+                           storeAlternatives=False, sStream=None):
+        '''
+        Choose a solution and color from the results of `_likelyKeys`.
+        '''
 
         #find the largest correlation value to use to select major or minor as the resulting key
         # values are the result of _getLikelyKeys
@@ -1129,6 +1345,46 @@ class Ambitus(DiscreteAnalysis):
         (<music21.interval.Interval m38>, '#665288')
         '''
         post = self.getPitchSpan(sStream)
+        return self.processWindowSummary(post)
+
+    def getWindowSummaries(self, windowStreams):
+        '''
+        Return the pitch span (as found by :meth:`getPitchSpan`) of each window.
+
+        >>> p = analysis.discrete.Ambitus()
+        >>> s = converter.parse('tinynotation: 4/4 c4 e g8 a8 c4')
+        >>> wa = analysis.windowed.WindowedAnalysis(s, p)
+        >>> summaries = p.getWindowSummaries(wa._windowedStream)
+        >>> summaries[2]
+        (<music21.pitch.Pitch G4>, <music21.pitch.Pitch A4>)
+        >>> p.combineWindowSummaries(summaries[1], summaries[2])
+        (<music21.pitch.Pitch E4>, <music21.pitch.Pitch A4>)
+        >>> p.processWindowSummary(summaries[2])
+        (<music21.interval.Interval M2>, '#16111d')
+        '''
+        return [self.getPitchSpan(w) for w in windowStreams]
+
+    def combineWindowSummaries(self, first, second):
+        # as with getPitchSpan, the first of equal pitches is kept
+        if first is None:
+            return second
+        elif second is None:
+            return first
+        if second[0].ps < first[0].ps:
+            minPitch = second[0]
+        else:
+            minPitch = first[0]
+        if second[1].ps > first[1].ps:
+            maxPitch = second[1]
+        else:
+            maxPitch = first[1]
+        return minPitch, maxPitch
+
+    def processWindowSummary(self, post):
+        '''
+        Given a pitch span from :meth:`getPitchSpan`, return a solution and 
+        a color string, as :meth:`process` does.
+        '''
         if post != None:
             solution = interval.Interval(noteStart = post[0], noteEnd = post[1])
         else:
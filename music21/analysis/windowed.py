@@ -49,8 +49,24 @@ class WindowedAnalysis(object):
         if 'Stream' not in streamObj.classes:
             raise WindowedAnalysisException('non-stream provided as argument')
         self._srcStream = streamObj
-        # store a windowed Stream, partitioned into bars of 1/4
-        self._windowedStream = self._getMinimumWindowStream() 
+        # a windowed Stream, partitioned into bars of 1/4, made on first use
+        self._windowedStreamStorage = None
+        # a hash of the notes of the source Stream, made on first use
+        self._streamHash = None
+        # summaries of each minimum window, made on first use, for 
+        # processors that can combine them; stored with the processor
+        self._windowSummaries = None
+        self._windowSummariesProcessor = None
+
+    def _getWindowedStream(self):
+        if self._windowedStreamStorage is None:
+            self._windowedStreamStorage = self._getMinimumWindowStream()
+        return self._windowedStreamStorage
+
+    _windowedStream = property(_getWindowedStream, doc='''
+        The source Stream partitioned into Measures of 1/4, as made by 
+        :meth:`_getMinimumWindowStream` the first time it is needed.
+        ''')
 
     def _getMinimumWindowStream(self, timeSignature='1/4'):
         ''' Take the loaded stream and restructure it into measures of 1 quarter note duration.
@@ -128,8 +144,19 @@ class WindowedAnalysis(object):
         color = [0] * windowCount
         # how many windows in this row
         windowCountIndices = range(windowCount)
-        
-        if windowType == 'overlap':
+
+        summaries = None
+        if windowType == 'overlap' or (windowType == 'adjacentAverage' 
+                                       and windowSize == 1):
+            summaries = self._getWindowSummaries()
+
+        if summaries is not None:
+            processWindowSummary = self.processor.processWindowSummary
+            for i, summary in enumerate(self._combineWindowSummaries(summaries, 
+                                                                     windowSize)):
+                data[i], color[i] = processWindowSummary(summary)
+
+        elif windowType == 'overlap':
             for i in windowCountIndices:
                 current = stream.Stream()
                 for j in range(i, i+windowSize):
@@ -172,17 +199,153 @@ class WindowedAnalysis(object):
             for i in range(maxWindowCount):
                 # get all participants, combine into a single 
                 current = stream.Stream()
-                for dataStream, participants in overlapped:
-                    if i in participants:
-                        for m in dataStream:
-                            current.append(m)
+                # the overlapped windows that include i, in order
+                first = max(0, i - windowSize + 1)
+                last = min(i, len(overlapped) - 1)
+                for dataStream, unused_participants in overlapped[first:last + 1]:
+                    for m in dataStream:
+                        current.append(m)
                 data[i], color[i] = self.processor.process(current)
 
         return data, color
 
+    def _analyzeInWorkers(self, windowSizes, windowType, processes):
+        '''
+        Yield the results of :meth:`_analyze` for each window size in 
+        `windowSizes`, in order, analyzing the window sizes in a pool of 
+        `processes` worker processes.
+
+        Each worker gets a copy of the processor; the solutions that the 
+        copies find are added to the solutions found by this processor in the 
+        same order as if the window sizes were analyzed here.
+        '''
+        import copy
+        import multiprocessing
+        from music21 import freezeThaw
+        summaries = None
+        if windowType in ('overlap', 'adjacentAverage'):
+            summaries = self._getWindowSummaries()
+        processor = copy.copy(self.processor)
+        if hasattr(processor, '_solutionsFound'):
+            # colors are already set up; the reference Stream need not be sent
+            processor._referenceStream = None
+            processor.clearSolutionsFound()
+        sf = freezeThaw.StreamFreezer(self._windowedStream)
+        frozenWindowedStream = sf.writeStr(fmt='pickle')
+
+        pool = multiprocessing.Pool(processes=processes,
+                                    initializer=_initializeWindowedWorker,
+                                    initargs=(processor, frozenWindowedStream, 
+                                              summaries))
+        try:
+            jobs = [(windowSize, windowType) for windowSize in windowSizes]
+            for soln, colorn, solutionsFound in pool.imap(_analyzeInWorker, jobs):
+                if solutionsFound:
+                    self.processor._solutionsFound.extend(solutionsFound)
+                yield soln, colorn
+        finally:
+            pool.terminate()
+            pool.join()
+
+    def _getStreamHash(self):
+        '''
+        Return an md5 hash of the offsets, durations, and pitches of the 
+        notes and rests of the source Stream, used to find stored results of 
+        :meth:`process`.
+
+        >>> s = converter.parse('tinynotation: 4/4 c4 d e f')
+        >>> wa = analysis.windowed.WindowedAnalysis(s, analysis.discrete.Ambitus())
+        >>> len(wa._getStreamHash())
+        32
+        >>> wa2 = analysis.windowed.WindowedAnalysis(s.transpose(2), 
+        ...                                          analysis.discrete.Ambitus())
+        >>> wa._getStreamHash() == wa2._getStreamHash()
+        False
+        '''
+        if self._streamHash is None:
+            flat = self._srcStream.flat
+            description = []
+            for n in flat.notesAndRests:
+                if n.isRest:
+                    pitches = ()
+                else:
+                    pitches = tuple((p.nameWithOctave, p.ps) for p in n.pitches)
+                description.append((n.classes[0], n.getOffsetBySite(flat),
+                                    n.duration.quarterLength, pitches))
+            self._streamHash = common.getMd5(repr(description))
+        return self._streamHash
+
+    def _getWindowSummaries(self):
+        '''
+        Return the processor's summaries of each minimum window, or None if 
+        the processor does not summarize windows. The summaries are 
+        made only once for each processor.
+
+        >>> s = corpus.parse('bach/bwv66.6')
+        >>> p = analysis.discrete.Ambitus()
+        >>> wa = analysis.windowed.WindowedAnalysis(s, p)
+        >>> len(wa._getWindowSummaries())
+        36
+        >>> wa._getWindowSummaries()[0]
+        (<music21.pitch.Pitch G#3>, <music21.pitch.Pitch C#5>)
+        '''
+        if (self._windowSummaries is None 
+                or self._windowSummariesProcessor is not self.processor):
+            getWindowSummaries = getattr(self.processor, 'getWindowSummaries', None)
+            if getWindowSummaries is None:
+                summaries = None
+            else:
+                summaries = getWindowSummaries(list(self._windowedStream))
+            self._windowSummaries = summaries
+            self._windowSummariesProcessor = self.processor
+        return self._windowSummaries
+
+    def _combineWindowSummaries(self, summaries, windowSize):
+        '''
+        Return the summary of each overlapping window of `windowSize` minimum
+        windows, combining at most two cumulative summaries for each window.
+
+        The minimum windows are divided into blocks of `windowSize`; within 
+        each block the summaries are combined from each window to the end of 
+        the block and from the start of the block to each window. A window 
+        either is a block or spans two blocks, so all the windows of a size 
+        are found with about three combinations for each minimum window.
+
+        >>> s = converter.parse('tinynotation: 4/4 c4 d e f g')
+        >>> ks = analysis.discrete.KrumhanslSchmuckler()
+        >>> wa = analysis.windowed.WindowedAnalysis(s, ks)
+        >>> windows = wa._combineWindowSummaries(wa._getWindowSummaries(), 3)
+        >>> len(windows)
+        3
+        >>> windows[1]
+        [0, 0, 1.0, 0, 1.0, 1.0, 0, 0, 0, 0, 0, 0]
+        '''
+        combine = self.processor.combineWindowSummaries
+        count = len(summaries)
+        prefixes = [None] * count
+        suffixes = [None] * count
+        for blockStart in range(0, count, windowSize):
+            blockEnd = min(blockStart + windowSize, count) - 1
+            prefixes[blockStart] = summaries[blockStart]
+            for j in range(blockStart + 1, blockEnd + 1):
+                prefixes[j] = combine(prefixes[j - 1], summaries[j])
+            suffixes[blockEnd] = summaries[blockEnd]
+            for j in range(blockEnd - 1, blockStart - 1, -1):
+                suffixes[j] = combine(summaries[j], suffixes[j + 1])
+
+        post = []
+        for i in range(count - windowSize + 1):
+            end = i + windowSize - 1
+            if i % windowSize == 0: # the window is a block
+                post.append(prefixes[end])
+            else:
+                post.append(combine(suffixes[i], prefixes[end]))
+        return post
+
         
     def process(self, minWindow=1, maxWindow=1, windowStepSize=1, 
-                windowType='overlap', includeTotalWindow=True):
+                windowType='overlap', includeTotalWindow=True, processes=None,
+                resultCache=None):
 
         ''' Main method for windowed analysis across one or more window size.
 
@@ -217,7 +380,60 @@ class WindowedAnalysis(object):
         (<music21.pitch.Pitch B>, 'major', 0.6868258874056411)
         >>> y[0][0].startswith('#') # a color is returned for each matching data position
         True
+
+        If `processes` is greater than 1, the window sizes are shared among 
+        that many worker processes; the results, and the solutions found by 
+        the processor, are in the same order as with one process.
+
+        >>> x2, y2, z2 = wa.process(1, 2, includeTotalWindow=False, processes=2)
+        >>> x2 == x and y2 == y
+        True
+
+        If `resultCache` is a dict, the results are stored in it under a 
+        hash of the notes of the Stream, the class of the processor, and the 
+        window sizes and type, and they are taken from it, rather than 
+        analyzed again, whenever the same analysis is asked for; for 
+        instance, to plot the same analysis again with other settings. 
+        (Processors of the same class with different settings, such as a 
+        different reference Stream, should not share a dict.)
+
+        >>> cache = {}
+        >>> x, y, z = wa.process(1, 2, resultCache=cache)
+        >>> len(cache)
+        1
+        >>> wa2 = analysis.windowed.WindowedAnalysis(s.parts[0], 
+        ...                                          analysis.discrete.KrumhanslSchmuckler())
+        >>> x2, y2, z2 = wa2.process(1, 2, resultCache=cache)
+        >>> x2 == x and y2 == y and z2 == z
+        True
+        >>> wa2.processor.getSolutionsUsed() == p.getSolutionsUsed()
+        True
         '''
+        if windowType == None:
+            windowType = 'overlap'
+        elif windowType.lower() in ['overlap']:
+            windowType = 'overlap'
+        elif windowType.lower() in ['nooverlap', 'nonoverlapping']:
+            windowType = 'noOverlap'
+        elif windowType.lower() in ['adjacentaverage']:
+            windowType = 'adjacentAverage'
+
+        # solutions found by the processor, stored with the results
+        solutionsFound = getattr(self.processor, '_solutionsFound', [])
+        if resultCache is not None:
+            # looked up before the Stream is windowed
+            cacheKey = (self._getStreamHash(), self.processor.__class__, 
+                        minWindow, maxWindow, windowStepSize, windowType, 
+                        includeTotalWindow)
+            if cacheKey in resultCache:
+                solutionMatrix, colorMatrix, metaMatrix, cachedSolutionsFound = \
+                    resultCache[cacheKey]
+                solutionsFound.extend(cachedSolutionsFound)
+                return ([list(soln) for soln in solutionMatrix], 
+                        [list(colorn) for colorn in colorMatrix],
+                        [dict(meta) for meta in metaMatrix])
+            solutionsFoundBefore = len(solutionsFound)
+
         if maxWindow == None:
             maxLength = len(self._windowedStream)
         else:
@@ -227,15 +443,6 @@ class WindowedAnalysis(object):
             minLength = len(self._windowedStream)
         else:
             minLength = minWindow
-        
-        if windowType == None:
-            windowType = 'overlap'
-        elif windowType.lower() in ['overlap']:
-            windowType = 'overlap'
-        elif windowType.lower() in ['nooverlap', 'nonoverlapping']:
-            windowType = 'noOverlap'
-        elif windowType.lower() in ['adjacentaverage']:
-            windowType = 'adjacentAverage'
 
         # need to create storage for the output of each row, or the processing
         # of all windows of a single size across the entire Stream
@@ -261,19 +468,59 @@ class WindowedAnalysis(object):
             if totalWindow not in windowSizes:
                 windowSizes.append(totalWindow)
 
-        for i in windowSizes:
+        if processes is not None and processes > 1 and len(windowSizes) > 1:
+            results = self._analyzeInWorkers(windowSizes, windowType, processes)
+        else:
+            results = (self._analyze(i, windowType=windowType) for i in windowSizes)
+
+        for i, (soln, colorn) in zip(windowSizes, results):
             #environLocal.printDebug(['processing window:', i])
             # each of these results are lists, where len is based on 
-            soln, colorn = self._analyze(i, windowType=windowType) 
             # store lists of results in a list of lists
             solutionMatrix.append(soln)
             colorMatrix.append(colorn)
             meta = {'windowSize': i}
             metaMatrix.append(meta)
+
+        if resultCache is not None:
+            resultCache[cacheKey] = (
+                [list(soln) for soln in solutionMatrix], 
+                [list(colorn) for colorn in colorMatrix],
+                [dict(meta) for meta in metaMatrix],
+                solutionsFound[solutionsFoundBefore:])
         
         return solutionMatrix, colorMatrix, metaMatrix
 
 
+#------------------------------------------------------------------------------
+# worker processes for WindowedAnalysis.process
+
+_windowedWorkerAnalysis = None
+
+def _initializeWindowedWorker(processor, frozenWindowedStream, summaries):
+    global _windowedWorkerAnalysis # pylint: disable=global-statement
+    from music21 import freezeThaw
+    st = freezeThaw.StreamThawer()
+    st.openStr(frozenWindowedStream)
+    # the source Stream is not needed once it has been windowed
+    wa = WindowedAnalysis.__new__(WindowedAnalysis)
+    wa.processor = processor
+    wa._srcStream = None
+    wa._windowedStreamStorage = st.stream
+    wa._streamHash = None
+    wa._windowSummaries = summaries
+    wa._windowSummariesProcessor = processor
+    _windowedWorkerAnalysis = wa
+
+def _analyzeInWorker(job):
+    windowSize, windowType = job
+    wa = _windowedWorkerAnalysis
+    if hasattr(wa.processor, '_solutionsFound'):
+        wa.processor.clearSolutionsFound()
+    soln, colorn = wa._analyze(windowSize, windowType=windowType)
+    return soln, colorn, getattr(wa.processor, '_solutionsFound', [])
+
+
 
 
 
@@ -376,6 +623,41 @@ class Test(unittest.TestCase):
 
 
 
+    def testProcessInWorkers(self):
+        from music21.analysis import discrete
+        from music21 import corpus
+        s = corpus.parse('bach/bwv324')
+        for p in [discrete.KrumhanslSchmuckler(s), discrete.Ambitus(s), 
+                  TestMockProcesor()]:
+            wa = WindowedAnalysis(s, p)
+            serial = wa.process(1, 8, includeTotalWindow=True)
+            if hasattr(p, 'clearSolutionsFound'):
+                solutionsFound = p._solutionsFound
+                p.clearSolutionsFound()
+            parallel = wa.process(1, 8, includeTotalWindow=True, processes=3)
+            self.assertEqual(serial, parallel)
+            if hasattr(p, 'clearSolutionsFound'):
+                self.assertEqual(solutionsFound, p._solutionsFound)
+
+    def testResultCache(self):
+        from music21.analysis import discrete
+        from music21 import corpus
+        s = corpus.parse('bach/bwv324')
+        cache = {}
+        p = discrete.Ambitus(s)
+        first = WindowedAnalysis(s, p).process(1, None, 'pow2', resultCache=cache)
+        p.clearSolutionsFound()
+        wa = WindowedAnalysis(s, p)
+        second = wa.process(1, None, 'pow2', resultCache=cache)
+        self.assertEqual(first, second)
+        self.assertEqual(len(p._solutionsFound), sum(len(row) for row in first[0]))
+        # nothing was windowed or analyzed again
+        self.assertEqual(wa._windowedStreamStorage, None)
+        # other window sizes and other processors are analyzed
+        wa.process(1, 2, resultCache=cache)
+        WindowedAnalysis(s, discrete.KrumhanslSchmuckler()).process(1, 2, resultCache=cache)
+        self.assertEqual(len(cache), 3)
+
     def testVariableWindowing(self):
         from music21.analysis import discrete
         from music21 import corpus, graph
@@ -48,6 +48,7 @@ from __future__ import print_function
 import collections
 import copy
 import doctest
+import itertools
 import sys
 import types
 import unittest
@@ -138,6 +139,85 @@ class ElementException(exceptions21.Music21Exception):
 # private metaclass...
 _SortTuple = collections.namedtuple('SortTuple', ['atEnd','offset','priority','classSortOrder','isNotGrace','insertIndex'])
 
+#------------------------------------------------------------------------------
+# class names and class membership sets are computed once per class; the
+# sets are shared by all instances, the names are copied into each one
+
+_classInfoCache = {}
+
+def _getClassInfo(cls):
+    '''
+    Return a tuple of (classNames, classSet, fullyQualifiedClassNames) for
+    `cls`, where classNames is a list of the names of the classes in
+    cls.mro() and classSet is a frozenset of those names and of the classes
+    themselves.  Computed once per class; the lists must be copied before
+    they are given out.
+
+    >>> classNames, classSet, fqNames = base._getClassInfo(note.Rest)
+    >>> classNames
+    ['Rest', 'GeneralNote', 'Music21Object', 'object']
+    >>> 'GeneralNote' in classSet
+    True
+    >>> note.GeneralNote in classSet
+    True
+    >>> fqNames[0]
+    'music21.note.Rest'
+    >>> base._getClassInfo(note.Rest) is base._getClassInfo(note.Rest)
+    True
+    '''
+    try:
+        return _classInfoCache[cls]
+    except KeyError:
+        pass
+    mro = cls.mro()
+    classNames = [x.__name__ for x in mro]
+    classSet = frozenset(classNames).union(mro)
+    fqNames = [x.__module__ + '.' + x.__name__ for x in mro]
+    classInfo = (classNames, classSet, fqNames)
+    _classInfoCache[cls] = classInfo
+    return classInfo
+
+
+def classFilterSet(classFilterList):
+    '''
+    Return a class filter list (or a single class name or class) as a
+    frozenset that can be passed to
+    :meth:`~music21.base.Music21Object.isClassOrSubclass` for many elements
+    without being examined again for each one.
+
+    >>> base.classFilterSet(['Note', note.Rest]) == frozenset(['Note', note.Rest])
+    True
+    >>> base.classFilterSet('Note') == frozenset(['Note'])
+    True
+
+    Tuples of classes within the list, as accepted by isinstance(), are
+    expanded:
+
+    >>> base.classFilterSet([(note.Note, chord.Chord)]) == frozenset([note.Note, chord.Chord])
+    True
+
+    If the list cannot be made into a set it is returned as a tuple, which
+    isClassOrSubclass also accepts:
+
+    >>> base.classFilterSet([[note.Note]])
+    ([<class 'music21.note.Note'>],)
+    '''
+    if isinstance(classFilterList, frozenset):
+        return classFilterList
+    if not isinstance(classFilterList, (list, tuple, set)):
+        classFilterList = (classFilterList,)
+    members = []
+    for className in classFilterList:
+        if isinstance(className, tuple):
+            members.extend(className)
+        else:
+            members.append(className)
+    try:
+        return frozenset(members)
+    except TypeError: # unhashable members
+        return tuple(classFilterList)
+
+
 #------------------------------------------------------------------------------
 # make subclass of set once that is defined properly
 
@@ -180,6 +260,23 @@ class Groups(common.SlottedObject, list):
 
     __slots__ = ()
 
+    def __deepcopy__(self, memo=None):
+        '''
+        Groups only hold strings, so copying the list is a deep copy.
+
+        >>> import copy
+        >>> g = Groups()
+        >>> g.append('flute')
+        >>> g2 = copy.deepcopy(g)
+        >>> g2
+        ['flute']
+        >>> g2 is g
+        False
+        '''
+        new = self.__class__()
+        list.extend(new, self)
+        return new
+
     def append(self, value):
         if isinstance(value, basestring):
             # do not permit the same entry more than once
@@ -291,7 +388,6 @@ class Music21Object(object):
     # documentation for all attributes (not properties or methods)
     _DOC_ATTR = {
         'id': 'A unique identification string (not to be confused with the default `.id()` method.',
-        'groups': 'An instance of a :class:`~music21.base.Group` object which describes arbitrary `Groups` that this object belongs to.',
         'isStream': 'Boolean value for quickly identifying :class:`~music21.stream.Stream` objects (False by default).',
         'isSpanner': 'Boolean value for quickly identifying :class:`~music21.spanner.Spanner` objects (False by default).',
         'isVariant': 'Boolean value for quickly identifying :class:`~music21.variant.Variant` objects (False by default).',
@@ -346,6 +442,10 @@ class Music21Object(object):
         # private duration storage; managed by property
         self._duration = None
         self._priority = 0 # default is zero
+        # Groups and Sites are created when first used, as many objects
+        # never have groups or are placed in a Stream; managed by properties
+        self._groups = None
+        self._sites = None
 
         self.hideObjectOnPrint = False
         self.xPosition = None
@@ -360,16 +460,9 @@ class Music21Object(object):
         if "duration" in keywords:
             self.duration = keywords["duration"]
         if "groups" in keywords and keywords["groups"] is not None:
-            self.groups = keywords["groups"]
-        else:
-            self.groups = Groups()
+            self._groups = keywords["groups"]
         if "sites" in keywords:
-            self.sites = keywords["sites"]
-        else:
-            self.sites = Sites(containedById=id(self))
-            # set up a default location for self at zero
-            # use None as the name of the site
-            self.sites.add(None, 0.0)
+            self._sites = keywords["sites"]
 
         if "activeSite" in keywords:
             self.activeSite = keywords["activeSite"]
@@ -393,7 +486,7 @@ class Music21Object(object):
 
         '''
         self.id = other.id
-        self.groups = copy.deepcopy(other.groups)
+        self._groups = copy.deepcopy(other._groups)
 
     def __deepcopy__(self, memo=None):
         '''
@@ -431,11 +524,13 @@ class Music21Object(object):
         '''
         #environLocal.printDebug(['calling Music21Object.__deepcopy__', self])
 
-        # call class to get a new, empty instance
-        new = self.__class__()
+        # get a new, empty instance
+        new = self._deepcopyNewInstance()
         #environLocal.printDebug(['Music21Object.__deepcopy__', self, id(self)])
         #for name in dir(self):
-        for name in self.__dict__:
+        # attributes are in __dict__ and, for Notes and others, in slots
+        for name in itertools.chain(self.__dict__,
+                                    common._getSlotNames(self.__class__)):
             if name.startswith('__'):
                 continue
 
@@ -452,12 +547,27 @@ class Music21Object(object):
                 if value != id(self):
                     newValue = copy.deepcopy(value, memo)
                     setattr(new, name, newValue)
+                else:
+                    new.id = id(new)
             # use sites own __deepcopy__, but set contained by id
-            elif name == 'sites':
-                newValue = copy.deepcopy(value, memo)
-                #environLocal.printDebug(['copied definedContexts:', newValue._locationKeys])
-                newValue.containedById = id(new)
-                setattr(new, name, newValue)
+            elif name == '_sites':
+                if value is not None: # otherwise created when needed
+                    newValue = copy.deepcopy(value, memo)
+                    #environLocal.printDebug(['copied definedContexts:', newValue._locationKeys])
+                    newValue.containedById = id(new)
+                    setattr(new, name, newValue)
+                else:
+                    new._sites = None
+            elif type(value) in common.IMMUTABLE_TYPES:
+                # numbers, strings, and None are shared, not copied
+                setattr(new, name, value)
+            elif name in ('_classes', '_fullyQualifiedClasses'):
+                # lists of strings
+                setattr(new, name, list(value))
+            elif common.isInterned(value):
+                # a Pitch or Duration shared in an immutable Stream: the copy
+                # gets its own, not one shared with other copies through memo
+                setattr(new, name, copy.deepcopy(value))
             else: # use copy.deepcopy, will call __deepcopy__ if available
                 newValue = copy.deepcopy(value, memo)
                 #setattr() will call the set method of a named property.
@@ -465,39 +575,77 @@ class Music21Object(object):
 
         # must do this after copying
         new._idLastDeepCopyOf = id(self)
-        new.purgeOrphans()
+        # as in purgeOrphans(), but as the copy is not yet in any Stream,
+        # every Stream site other than a storage Stream is an orphan;
+        # this avoids searching each of those Streams for the copy
+        if new._sites is not None:
+            for s in new._sites.getSites():
+                if (s is not None and s.isStream
+                        and 'SpannerStorage' not in s.classes
+                        and 'VariantStorage' not in s.classes):
+                    new.removeLocationBySiteId(id(s))
 
         #environLocal.printDebug([self, 'end deepcopy', 'self._activeSite', self._activeSite])
         return new
 
+    def _deepcopyNewInstance(self):
+        '''
+        Return the new, empty instance that :meth:`__deepcopy__` copies
+        attributes into.  Here this calls the class with no arguments;
+        subclasses whose attributes are all copied over may skip `__init__`.
+        '''
+        return self.__class__()
+
     def isClassOrSubclass(self, classFilterList):
         '''
         Given a class filter list (a list or tuple must be submitted),
         which may have strings or class objects, determine
         if this class is of the provided classes or a subclasses.
+
+        A frozenset from :func:`~music21.base.classFilterSet` can be given
+        instead, which avoids examining the list again for each element.
+
+        >>> n = note.Note()
+        >>> n.isClassOrSubclass(['Rest', 'NotRest'])
+        True
+        >>> n.isClassOrSubclass((note.Rest,))
+        False
+        >>> n.isClassOrSubclass(base.classFilterSet(note.GeneralNote))
+        True
         
         NOTE: this is a performance critical operation
         for performance, only accept lists or tuples
         '''
         # NOTE: this is a performance critical operation
-        # for performance, only accept lists or tuples
-
-        # in case classFilterList is a tuple of classes, can try right away
-        # do not change, as performance critical
-#         try:
-#             if isinstance(self, classFilterList):
-#                 return True
-#         except TypeError:
-#             pass
-        eClasses = self.classes # get cached from property
+        # the class set of names and classes is shared by all instances
+        try:
+            classInfo = _classInfoCache[self.__class__]
+        except KeyError:
+            classInfo = _getClassInfo(self.__class__)
+        try:
+            if not classInfo[1].isdisjoint(classFilterList):
+                return True
+            hashable = True
+        except TypeError: # unhashable members
+            hashable = False
+        classSet = classInfo[1]
+        # the .classes list of this object differs from the names of its
+        # class if it was made before __class__ was changed, or was edited;
+        # then the names in it are matched as well
+        eClasses = self._classes
+        if eClasses is not None and eClasses == classInfo[0]:
+            eClasses = None
+        if classFilterList.__class__ is frozenset: # normalized by classFilterSet
+            return eClasses is not None and not classFilterList.isdisjoint(eClasses)
+        # otherwise, check members that cannot be found in the set: tuples of
+        # classes, or everything if some members are unhashable
         for className in classFilterList:
-            # new method uses string matching of .classes attribute
-            # temporarily check to see if this is a string
-            #if className in eClasses or (not isinstance(className, str) and isinstance(e, className)):
-            if className in eClasses:
+            if eClasses is not None and className in eClasses:
                 return True
-            try: # className may be a string or a Class
-                if isinstance(self, className):
+            if hashable and className.__class__ is not tuple:
+                continue
+            try: # className may be a string, a Class, or a tuple of Classes
+                if className in classSet or isinstance(self, className):
                     return True
             # catch TypeError: isinstance() arg 2 must be a class, type, or tuple of classes and types
             except TypeError:
@@ -505,10 +653,12 @@ class Music21Object(object):
         return False
 
     def _getClasses(self):
-        #environLocal.printDebug(['calling _getClasses'])
         if self._classes is None:
-            #environLocal.printDebug(['setting self._classes', id(self), self])
-            self._classes = [x.__name__ for x in self.__class__.mro()]
+            # copied from the names computed once for each class
+            try:
+                self._classes = list(_classInfoCache[self.__class__][0])
+            except KeyError:
+                self._classes = list(_getClassInfo(self.__class__)[0])
         return self._classes
 
     classes = property(_getClasses,
@@ -541,10 +691,8 @@ class Music21Object(object):
         ''')
 
     def _getFullyQualifiedClasses(self):
-        #environLocal.printDebug(['calling _getClasses'])
         if self._fullyQualifiedClasses is None:
-            #environLocal.printDebug(['setting self._fullyQualifiedClasses', id(self), self])
-            self._fullyQualifiedClasses = [x.__module__ + '.' + x.__name__ for x in self.__class__.mro()]
+            self._fullyQualifiedClasses = list(_getClassInfo(self.__class__)[2])
         return self._fullyQualifiedClasses
 
     fullyQualifiedClasses = property(_getFullyQualifiedClasses,
@@ -571,6 +719,9 @@ class Music21Object(object):
         return self.duration.quarterLength
     
     def _setQuarterLength(self, value):
+        if common.isInterned(self._duration):
+            # shared by an immutable Stream: change a copy
+            self._duration = copy.deepcopy(self._duration)
         self.duration.quarterLength = value
 
     quarterLength = property(_getQuarterLengthRational, _setQuarterLength, doc='''
@@ -1495,6 +1646,57 @@ class Music21Object(object):
     #--------------------------------------------------------------------------
     # properties
 
+    def _getGroups(self):
+        # lazy Groups creation
+        if self._groups is None:
+            self._groups = Groups()
+        return self._groups
+
+    def _setGroups(self, groups):
+        self._groups = groups
+
+    groups = property(_getGroups, _setGroups,
+        doc='''
+        An instance of a :class:`~music21.base.Groups` object which describes
+        arbitrary `Groups` that this object belongs to.  It is created the
+        first time it is used.
+
+        >>> n = note.Note()
+        >>> n.groups
+        []
+        >>> n.groups.append('flute')
+        >>> 'flute' in n.groups
+        True
+        ''')
+
+    def _getSites(self):
+        # lazy Sites creation
+        if self._sites is None:
+            self._sites = Sites(containedById=id(self))
+            # set up a default location for self at zero
+            # use None as the name of the site
+            self._sites.add(None, 0.0)
+        return self._sites
+
+    def _setSites(self, sitesObj):
+        self._sites = sitesObj
+
+    sites = property(_getSites, _setSites,
+        doc='''
+        The :class:`~music21.sites.Sites` object that stores the Streams and
+        other objects this object is found in, and the offset of this object
+        in each.  It is created the first time it is used, with a location
+        of offset 0.0 for no site (None).
+
+        >>> n = note.Note()
+        >>> n.sites.getSites()
+        [None]
+        >>> s = stream.Stream()
+        >>> s.insert(2, n)
+        >>> n.sites.getSites() == [None, s]
+        True
+        ''')
+
     def _getActiveSite(self):
         # can be None
         if sites.WEAKREF_ACTIVE:
@@ -1606,6 +1808,8 @@ class Music21Object(object):
             return self.sites.getOffsetBySiteId(activeSiteId, returnType=returnType)
             #return self.sites.coordinates[activeSiteId]['offset']
         elif self.activeSite is None: # assume we want self
+            if self._sites is None: # never placed anywhere
+                return 0.0
             try:
                 return self.sites.getOffsetBySite(None, returnType=returnType)
             except SitesException:  # might not have a None offset
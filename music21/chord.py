@@ -179,6 +179,9 @@ class Chord(note.NotRest):
         self._notes = []
         self._chordTablesAddress = None
         self._chordTablesAddressNeedsUpdating = True # only update when needed
+        # values derived from the pitches, such as chord steps above a root;
+        # see _getAnalysisCache()
+        self._analysisCache = {}
         # here, pitch and duration data is extracted from notes
         # if provided
 
@@ -337,7 +340,9 @@ class Chord(note.NotRest):
 
         Inversion is either 0 (for symmetrical) or -1/1
 
-        NOTE: time consuming, and only should be run when necessary.
+        The address of each set of pitch classes is looked up once, and then
+        kept in a table indexed by a 12-bit mask of the pitch classes present
+        (see :func:`~music21.chordTables.pitchClassesToMask`).
 
         >>> c1 = chord.Chord(['c3'])
         >>> c1.orderedPitchClasses
@@ -369,62 +374,11 @@ class Chord(note.NotRest):
         (3, 1, 0)
 
         '''
-        pcSet = self.orderedPitchClasses
-        if len(pcSet) == 0:
-            raise ChordException(
-                'cannot access chord tables address for Chord with %s pitches' % len(pcSet))
-
-        #environLocal.printDebug(['calling seekChordTablesAddress:', pcSet])
-
-        card = len(pcSet)
-        if card == 1: # its a singleton: return
-            return (1, 1, 0)
-        elif card == 11: # its the only 11 note pcset
-            return (11, 1, 0)
-        elif card == 12: # its the aggregate
-            return (12, 1, 0)
-        # go through each rotation of pcSet
-        candidates = []
-        for rot in range(0, card):
-            testSet = pcSet[rot:] + pcSet[0:rot]
-            # transpose to lead with zero
-            testSet = [(x - testSet[0]) % 12 for x in testSet]
-            # create inversion; first take difference from 12 mod 12
-            testSetInvert = [(12 - x) % 12 for x in testSet]
-            testSetInvert.reverse() # reverse order (first steps now last)
-            # transpose all steps (were last) to zero, mod 12
-            testSetInvert = [(x + (12 - testSetInvert[0])) % 12
-                            for x in testSetInvert]
-            candidates.append([testSet, testSetInvert])
-
-        # compare sets to those in table
-        match = False
-        for indexCandidate in range(len(chordTables.FORTE[card])):
-            dataLine = chordTables.FORTE[card][indexCandidate]
-            if dataLine == None: continue # spacer lines
-            inversionsAvailable = chordTables.forteIndexToInversionsAvailable(
-                                  card, indexCandidate)
-
-            for candidate, candidateInversion in candidates:
-                #environLocal.printDebug([candidate])
-                # need to only match form
-                if dataLine[0] == tuple(candidate): # must compare to tuple
-                    if 0 in inversionsAvailable:
-                        index, inversion = indexCandidate, 0
-                    else:
-                        index, inversion = indexCandidate, 1
-                    match = True
-                    break
-                elif dataLine[0] == tuple(candidateInversion):
-                    if 0 in inversionsAvailable:
-                        index, inversion = indexCandidate, 0
-                    else:
-                        index, inversion = indexCandidate, -1
-                    match = True
-                    break
-        if not match:
-            raise ChordException('cannot find a chord table address for %s' % pcSet)
-        return (card, index, inversion)
+        mask = chordTables.pitchClassesToMask(p.pitchClass for p in self.pitches)
+        try:
+            return chordTables.maskToAddress(mask)
+        except chordTables.ChordTablesException as e:
+            raise ChordException(str(e))
 
     ### PRIVATE METHODS ###
 
@@ -469,6 +423,66 @@ class Chord(note.NotRest):
                 lowest = interval.getWrittenLowerNote(lowest, thisPitch)
         return lowest
 
+    def _getAnalysisCache(self):
+        '''
+        Return a dictionary for storing values derived from the pitches of
+        this Chord.
+
+        The dictionary is emptied whenever the pitches have changed since it
+        was last used, whether by replacing them or by altering a Pitch in
+        place.
+
+        >>> c = chord.Chord(['C4', 'E4', 'G4'])
+        >>> c.quality
+        'major'
+        >>> c.pitches[1].name = 'E-'
+        >>> c.quality
+        'minor'
+        '''
+        cache = self._analysisCache
+        pitches = tuple(d.pitch for d in self._notes)
+        pitchKey = tuple((id(p), p.nameWithOctave, p.ps) for p in pitches)
+        if cache.get('pitchKey') != pitchKey:
+            cache.clear()
+            cache['pitchKey'] = pitchKey
+            # keep the Pitches, so that their ids in pitchKey are not reused
+            cache['pitches'] = pitches
+        return cache
+
+    def _getRootAnalysisCache(self, testRoot):
+        '''
+        Return a dictionary, within the analysis cache, for storing values
+        that depend on both the pitches of this Chord and `testRoot`.
+        '''
+        byRoot = self._getAnalysisCache().setdefault('byRoot', {})
+        rootKey = (id(testRoot), testRoot.nameWithOctave, testRoot.ps)
+        if rootKey not in byRoot:
+            byRoot[rootKey] = (testRoot, {})
+        return byRoot[rootKey][1]
+
+    def _getChordStepPitches(self, testRoot):
+        '''
+        Return a dictionary mapping each chord step (1 through 7) above
+        `testRoot` to a list of the Pitches of this Chord on that step.
+
+        >>> c = chord.Chord(['E3', 'C4', 'G4', 'E-5'])
+        >>> stepPitches = c._getChordStepPitches(pitch.Pitch('C'))
+        >>> sorted(stepPitches.keys())
+        [1, 3, 5]
+        >>> stepPitches[3]
+        [<music21.pitch.Pitch E3>, <music21.pitch.Pitch E-5>]
+        '''
+        rootCache = self._getRootAnalysisCache(testRoot)
+        if 'chordSteps' not in rootCache:
+            stepPitches = {}
+            rootNum = testRoot.diatonicNoteNum
+            for d in self._notes:
+                # same as the mod7 of the generic interval from testRoot
+                chordStep = (d.pitch.diatonicNoteNum - rootNum) % 7 + 1
+                stepPitches.setdefault(chordStep, []).append(d.pitch)
+            rootCache['chordSteps'] = stepPitches
+        return rootCache['chordSteps']
+
     def _removePitchByRedundantAttribute(self, attribute, inPlace):
         '''
         Common method for stripping pitches based on redundancy of one pitch
@@ -976,9 +990,10 @@ class Chord(note.NotRest):
             return self.pitches[0]
         indexOfPitchesWithPerfectlyStackedThirds = []
         for i,p in enumerate(closedChord.pitches):
+            stepPitches = closedChord._getChordStepPitches(p)
             currentListOfThirds = []
             for chordStepTest in (3, 5, 7, 2, 4, 6):
-                if closedChord.getChordStep(chordStepTest, p):
+                if chordStepTest in stepPitches:
                     currentListOfThirds.append(True)
                 else:
                     currentListOfThirds.append(False)
@@ -1122,10 +1137,9 @@ class Chord(note.NotRest):
             testRoot = self.root()
             if (testRoot is None):
                 raise ChordException("Cannot run getChordStep without a root")
-        for thisPitch in self.pitches:
-            thisInterval = interval.notesToInterval(testRoot, thisPitch)
-            if (thisInterval.diatonic.generic.mod7 == chordStep):
-                return thisPitch
+        stepPitches = self._getChordStepPitches(testRoot)
+        if chordStep in stepPitches:
+            return stepPitches[chordStep][0]
         return None
 
     def getColor(self, pitchTarget):
@@ -1345,13 +1359,10 @@ class Chord(note.NotRest):
             if (testRoot is None):
                 raise ChordException("Cannot run hasRepeatedChordStep without a root")
 
-        first = self.intervalFromChordStep(chordStep)
-        for thisPitch in self.pitches:
-            thisInterval = interval.notesToInterval(testRoot, thisPitch)
-            if (thisInterval.diatonic.generic.mod7 == chordStep):
-                if (thisInterval.chromatic.mod12 - first.chromatic.mod12 != 0):
-                    return True
-
+        stepPitches = self._getChordStepPitches(testRoot).get(chordStep, [])
+        for thisPitch in stepPitches[1:]:
+            if (thisPitch.ps - stepPitches[0].ps) % 12 != 0:
+                return True
         return False
 
     def intervalFromChordStep(self, chordStep, testRoot=None):
@@ -1378,11 +1389,10 @@ class Chord(note.NotRest):
 
             if (testRoot is None):
                 raise ChordException("Cannot run intervalFromChordStep without a root")
-        for thisPitch in self.pitches:
-            thisInterval = interval.notesToInterval(testRoot, thisPitch)
-            if (thisInterval.diatonic.generic.mod7 == chordStep):
-                return thisInterval
-        return None
+        thisPitch = self.getChordStep(chordStep, testRoot)
+        if thisPitch is None:
+            return None
+        return interval.notesToInterval(testRoot, thisPitch)
 
     def inversion(self, newInversion=None, find=True, testRoot=None, transposeOnSet=True):
         '''
@@ -1504,14 +1514,9 @@ class Chord(note.NotRest):
             except ChordException:
                 raise ChordException("Not a normal inversion")
 
-            #bassNote = self.bass()
-            #do all interval calculations with bassNote being one octave below root note
-            tempBassPitch = copy.deepcopy(self.bass())
-            tempBassPitch.octave = 1
-            tempRootPitch = copy.deepcopy(rootPitch)
-            tempRootPitch.octave = 2
-
-            bassToRoot = interval.notesToInterval(tempBassPitch, tempRootPitch).generic.simpleDirected
+            # the simple generic interval from the bass up to the root,
+            # whatever their octaves
+            bassToRoot = (rootPitch.diatonicNoteNum - self.bass().diatonicNoteNum) % 7 + 1
             #print 'bassToRoot', bassToRoot
             if (bassToRoot == 1):
                 inv = 0
@@ -1828,12 +1833,16 @@ class Chord(note.NotRest):
 
         if (third is None or fifth is None or seventh is None):
             return False
-        for thisPitch in self.pitches:
-            thisInterval = interval.notesToInterval(self.root(), thisPitch)
-            if (thisInterval.chromatic.mod12 != 0) and (thisInterval.chromatic.mod12 != 4) and (thisInterval.chromatic.mod12 != 7) and (thisInterval.chromatic.mod12 != 10):
-                return False
-
-        return True
+        root = self.root()
+        rootCache = self._getRootAnalysisCache(root)
+        if 'isDominantSeventh' not in rootCache:
+            isDominantSeventh = True
+            for thisPitch in self.pitches:
+                if (thisPitch.ps - root.ps) % 12 not in (0, 4, 7, 10):
+                    isDominantSeventh = False
+                    break
+            rootCache['isDominantSeventh'] = isDominantSeventh
+        return rootCache['isDominantSeventh']
 
     def isFalseDiminishedSeventh(self):
         '''Returns True if chord is a Diminished Seventh, that is, if it contains only notes that are
@@ -1910,7 +1919,7 @@ class Chord(note.NotRest):
         ### The fifth of the chord must be the tonic. The fifth of the chord is the tonic if and only if
         ### there is a M3 (simple or compound) between the bass (m6 scale step) and the fifth of the chord.
         tonic = augSixthChord.getChordStep(5)
-        if tonic == False:
+        if tonic is None:
             return False
         majThirdInterval = interval.Interval(bass, tonic)
         if not (majThirdInterval.diatonic.specificName == 'Major' and majThirdInterval.generic.simpleDirected == 3):
@@ -1919,7 +1928,7 @@ class Chord(note.NotRest):
         ### there is a A4 (simple or compound) between the bass (m6 scale step) and the sixth of the chord.
         supertonic = augSixthChord.getChordStep(6)
         augFourthInterval = interval.Interval(bass, supertonic)
-        if supertonic == False:
+        if supertonic is None:
             return False
         if not (augFourthInterval.diatonic.specificName == 'Augmented' and augFourthInterval.generic.simpleDirected == 4):
             return False
@@ -1947,7 +1956,7 @@ class Chord(note.NotRest):
         ### The fifth of the chord must be the tonic. The fifth of the chord is the tonic if and only if
         ### there is a M3 (simple or compound) between the bass (m6 scale step) and the fifth of the chord.
         tonic = augSixthChord.getChordStep(5)
-        if tonic == False:
+        if tonic is None:
             return False
         majThirdInterval = interval.Interval(bass, tonic)
         if not (majThirdInterval.diatonic.specificName == 'Major' and majThirdInterval.generic.simpleDirected == 3):
@@ -1956,7 +1965,7 @@ class Chord(note.NotRest):
         ### The seventh of the chord must be the mediant. The seventh of the chord is the mediant if and only if
         ### there is a P5 (simple or compound) between the bass (m6 scale step) and the fifth of the chord.
         mediant = augSixthChord.getChordStep(7)
-        if mediant == False:
+        if mediant is None:
             return False
         perfectFifthInterval = interval.Interval(bass, mediant)
         if not (perfectFifthInterval.diatonic.specificName == 'Perfect' and perfectFifthInterval.generic.simpleDirected == 5):
@@ -2147,7 +2156,7 @@ class Chord(note.NotRest):
         ### The fifth of the chord must be the tonic. The fifth of the chord is the tonic if and only if
         ### there is a M3 (simple or compound) between the bass (m6 scale step) and the fifth of the chord.
         tonic = augSixthChord.getChordStep(5)
-        if tonic == False:
+        if tonic is None:
             return False
         majThirdInterval = interval.Interval(bass, tonic)
         if not (majThirdInterval.diatonic.specificName == 'Major' and majThirdInterval.generic.simpleDirected == 3):
@@ -2308,7 +2317,7 @@ class Chord(note.NotRest):
         ### The fifth of the chord must be the tonic. The fifth of the chord is the tonic if and only if
         ### there is a M3 (simple or compound) between the bass (m6 scale step) and the fifth of the chord.
         tonic = augSixthChord.getChordStep(5)
-        if tonic == False:
+        if tonic is None:
             return False
         majThirdInterval = interval.Interval(bass, tonic)
         if not (majThirdInterval.diatonic.specificName == 'Major' and majThirdInterval.generic.simpleDirected == 3):
@@ -2318,7 +2327,7 @@ class Chord(note.NotRest):
         ### there is a A4 (simple or compound) between the bass (m6 scale step) and the sixth of the chord.
         supertonic = augSixthChord.getChordStep(6)
         augFourthInterval = interval.Interval(bass, supertonic)
-        if supertonic == False:
+        if supertonic is None:
             return False
         if not (augFourthInterval.diatonic.specificName == 'Doubly-Augmented' and augFourthInterval.generic.simpleDirected == 4):
             return False
@@ -2641,11 +2650,22 @@ class Chord(note.NotRest):
             
 
         '''
-        tempInt = self.intervalFromChordStep(chordStep, testRoot)
-        if tempInt is None:
+        if (testRoot is None):
+            try:
+                testRoot = self.root()
+            except ChordException:
+                raise ChordException("Cannot run semitonesFromChordStep without a root")
+
+            if (testRoot is None):
+                raise ChordException("Cannot run semitonesFromChordStep without a root")
+        thisPitch = self.getChordStep(chordStep, testRoot)
+        if thisPitch is None:
             return None
-        else:
-            return tempInt.chromatic.mod12
+        # same as the mod12 of the chromatic interval from testRoot
+        semitones = thisPitch.ps - testRoot.ps
+        if semitones == int(semitones):
+            semitones = int(semitones)
+        return semitones % 12
 
     def setColor(self, value, pitchTarget=None):
         '''
@@ -3579,32 +3599,37 @@ class Chord(note.NotRest):
 
         '''
         third = self.semitonesFromChordStep(3)
+        rootCache = self._getRootAnalysisCache(self.root())
+        if 'quality' in rootCache:
+            return rootCache['quality']
         fifth = self.semitonesFromChordStep(5)
         #environLocal.printDebug(['third, fifth', third, fifth])
         if third is None:
-            return "other"
+            quality = "other"
         elif self.hasRepeatedChordStep(3):
             #environLocal.printDebug('self.hasRepeatedChordStep(3)', self.hasRepeatedChordStep(3))
-            return "other"
+            quality = "other"
         elif fifth is None:
             if third == 4:
-                return "major"
+                quality = "major"
             elif third == 3:
-                return "minor"
+                quality = "minor"
             else:
-                return "other"
+                quality = "other"
         elif self.hasRepeatedChordStep(5):
-            return "other"
+            quality = "other"
         elif fifth == 7 and third == 4:
-            return "major"
+            quality = "major"
         elif fifth == 7 and third == 3:
-            return "minor"
+            quality = "minor"
         elif fifth == 8 and third == 4:
-            return "augmented"
+            quality = "augmented"
         elif fifth == 6 and third == 3:
-            return "diminished"
+            quality = "diminished"
         else:
-            return "other"
+            quality = "other"
+        rootCache['quality'] = quality
+        return quality
 
     @property
     def scaleDegrees(self):
@@ -3941,6 +3966,69 @@ def fromIntervalVector(notation, getZRelation=False):
         return None
 
 
+def analyzeChords(chordList):
+    '''
+    Return a list with a dictionary for each Chord in `chordList` giving
+    its root, bass, inversion, quality, and commonName.
+
+    Chords with the same pitches in the same order, as are frequent in
+    the output of :meth:`~music21.stream.Stream.chordify`, are analyzed
+    only once.  The root and bass given for each Chord are its own Pitches,
+    and the Chord keeps them, with its inversion, as if found by
+    :meth:`~music21.chord.Chord.root` and :meth:`~music21.chord.Chord.bass`.
+
+    >>> cList = [chord.Chord(['E3', 'C4', 'G4']),
+    ...          chord.Chord(['D3', 'F#4', 'A4', 'C5']),
+    ...          chord.Chord(['E3', 'C4', 'G4'])]
+    >>> analysis = chord.analyzeChords(cList)
+    >>> analysis[0]['root'], analysis[0]['bass'], analysis[0]['inversion']
+    (<music21.pitch.Pitch C4>, <music21.pitch.Pitch E3>, 1)
+    >>> analysis[1]['quality'], analysis[1]['commonName']
+    ('major', 'dominant seventh chord')
+    >>> analysis[2]['root'] is cList[2].pitches[1]
+    True
+    >>> cList[2].root() is analysis[2]['root']
+    True
+
+    A Chord without pitches has none of these:
+
+    >>> sorted(chord.analyzeChords([chord.Chord()])[0].items())
+    [('bass', None), ('commonName', None), ('inversion', None), ('quality', None), ('root', None)]
+    '''
+    post = []
+    found = {} # pitch spellings to the analysis shared by their Chords
+    for c in chordList:
+        pitches = c.pitches
+        if len(pitches) == 0:
+            post.append({'root': None, 'bass': None, 'inversion': None,
+                         'quality': None, 'commonName': None})
+            continue
+        # a root, bass, or inversion that was set is not shared
+        canShare = (c._root is None and c._bass is None and c._inversion is None)
+        pitchKey = (c.__class__, tuple((p.nameWithOctave, p.ps) for p in pitches))
+        if canShare and found.get(pitchKey) is not None:
+            rootIndex, bassIndex, inversion, quality, commonName = found[pitchKey]
+            c._root = pitches[rootIndex]
+            c._bass = pitches[bassIndex]
+            c._inversion = inversion
+            c._getRootAnalysisCache(c._root)['quality'] = quality
+        else:
+            inversion = c.inversion()
+            quality = c.quality
+            commonName = c.commonName
+            if canShare:
+                rootIndices = [i for i, p in enumerate(pitches) if p is c._root]
+                bassIndices = [i for i, p in enumerate(pitches) if p is c._bass]
+                if rootIndices and bassIndices:
+                    found[pitchKey] = (rootIndices[0], bassIndices[0], inversion,
+                                       quality, commonName)
+                else:
+                    found[pitchKey] = None
+        post.append({'root': c.root(), 'bass': c.bass(), 'inversion': inversion,
+                     'quality': quality, 'commonName': commonName})
+    return post
+
+
 #-------------------------------------------------------------------------------
 
 
@@ -4658,6 +4746,48 @@ class Test(unittest.TestCase):
         self.assertEqual(s.highestOffset, 2.0)
         self.assertEqual(str(s.pitches), '[<music21.pitch.Pitch D2>, <music21.pitch.Pitch E-1>, <music21.pitch.Pitch B-6>]')
 
+    def testAnalysisCache(self):
+        from music21 import chord, corpus
+        c = chord.Chord(['E3', 'C4', 'G4'])
+        self.assertEqual(c.root().nameWithOctave, 'C4')
+        self.assertEqual(c.third.nameWithOctave, 'E3')
+        self.assertEqual(c.quality, 'major')
+        self.assertEqual(c.isDominantSeventh(), False)
+        # altering pitches in place forgets values derived from them
+        c.pitches[0].name = 'E-'
+        self.assertEqual(c.quality, 'minor')
+        c.pitches[2].name = 'G-'
+        self.assertEqual(c.quality, 'diminished')
+        c.pitches = ['B3', 'D4', 'F4', 'G4']
+        self.assertEqual(c.isDominantSeventh(), True)
+        c.pitches[3].name = 'A-'
+        self.assertEqual(c.isDominantSeventh(), False)
+        # and values derived from a root that was set
+        c.root(pitch.Pitch('G2'))
+        self.assertEqual(c.third.nameWithOctave, 'B3')
+        self.assertEqual(c.quality, 'major')
+        c.root().name = 'G#'
+        self.assertEqual(c.third.nameWithOctave, 'B3')
+        self.assertEqual(c.quality, 'diminished')
+
+        chords = list(corpus.parse('bwv66.6').chordify().flat.getElementsByClass('Chord'))
+        expected = []
+        for thisChord in chords:
+            newChord = chord.Chord(thisChord.pitches)
+            expected.append((newChord.root(), newChord.bass(), newChord.inversion(),
+                             newChord.quality, newChord.commonName))
+        analysis = chord.analyzeChords(chords)
+        self.assertEqual(len(analysis), len(chords))
+        for thisChord, result, (root, bass, inversion, quality, commonName) in zip(
+                chords, analysis, expected):
+            self.assertEqual(result['root'].nameWithOctave, root.nameWithOctave)
+            self.assertEqual(result['bass'].nameWithOctave, bass.nameWithOctave)
+            self.assertEqual(result['inversion'], inversion)
+            self.assertEqual(result['quality'], quality)
+            self.assertEqual(result['commonName'], commonName)
+            self.assertTrue(result['root'] is thisChord.root())
+            self.assertTrue(result['bass'] is thisChord.bass())
+
 
 #-------------------------------------------------------------------------------
 
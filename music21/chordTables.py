@@ -2519,6 +2519,9 @@ def forteIndexToInversionsAvailable(card, index):
     else:
         return [-1, 1]
 
+# each address already validated, and the full address returned for it
+_validAddresses = {}
+
 def _validateAddress(address):
     '''Check that an address is valid
 
@@ -2539,7 +2542,9 @@ def _validateAddress(address):
     Traceback (most recent call last):
     ChordTablesException: inversion -30 not valid
     '''
-    address = list(address)
+    address = tuple(address)
+    if address in _validAddresses:
+        return _validAddresses[address]
     card = address[0]
     index = address[1]
     if len(address) == 3:
@@ -2573,6 +2578,7 @@ def _validateAddress(address):
 #     except KeyError:
 #         raise ChordTablesException('cannot validate address: %s' % address)
 
+    _validAddresses[address] = (card, index, inversion)
     return (card, index, inversion)
 
 
@@ -2717,6 +2723,104 @@ def addressToForteName(address, classification='tn'):
     return '%s-%s%s' % (card, index, iStr)
 
 
+def pitchClassesToMask(pitchClasses):
+    '''
+    Given pitch class integers, return a 12-bit integer where bit n is set if
+    pitch class n is present. Duplicates and order do not matter, and 12 (as
+    a microtone below C can round to) is the same as 0.
+
+    >>> chordTables.pitchClassesToMask([0, 4, 7])
+    145
+    >>> chordTables.pitchClassesToMask([7, 4, 12, 0])
+    145
+    >>> chordTables.pitchClassesToMask(range(12))
+    4095
+    '''
+    mask = 0
+    for pc in pitchClasses:
+        mask |= 1 << (pc % 12)
+    return mask
+
+# the TN address of each of the 4096 pitch class sets, indexed by its mask
+# (see pitchClassesToMask()); each is found when first needed
+_addressesByMask = [None] * 4096
+
+def maskToAddress(mask):
+    '''
+    Given a pitch class mask, as returned by pitchClassesToMask(), return the
+    TN address of the pitch class set.
+
+    >>> chordTables.maskToAddress(chordTables.pitchClassesToMask([0, 4, 7]))
+    (3, 11, -1)
+    >>> chordTables.maskToAddress(chordTables.pitchClassesToMask([2, 5, 9]))
+    (3, 11, 1)
+    >>> chordTables.maskToAddress(chordTables.pitchClassesToMask([4]))
+    (1, 1, 0)
+    >>> chordTables.maskToAddress(0)
+    Traceback (most recent call last):
+    ChordTablesException: cannot access chord tables address for Chord with 0 pitches
+    '''
+    address = _addressesByMask[mask]
+    if address is None:
+        address = _seekAddress([pc for pc in range(12) if mask & (1 << pc)])
+        _addressesByMask[mask] = address
+    return address
+
+def _seekAddress(pcSet):
+    '''
+    Search the tables for the TN address of an ordered list of unique pitch
+    classes.
+
+    >>> chordTables._seekAddress([0, 1, 3, 4, 6, 8, 10])
+    (7, 34, 0)
+    '''
+    if len(pcSet) == 0:
+        raise ChordTablesException(
+            'cannot access chord tables address for Chord with %s pitches' % len(pcSet))
+
+    card = len(pcSet)
+    if card == 1: # its a singleton: return
+        return (1, 1, 0)
+    elif card == 11: # its the only 11 note pcset
+        return (11, 1, 0)
+    elif card == 12: # its the aggregate
+        return (12, 1, 0)
+    # go through each rotation of pcSet
+    candidates = []
+    for rot in range(0, card):
+        testSet = pcSet[rot:] + pcSet[0:rot]
+        # transpose to lead with zero
+        testSet = [(x - testSet[0]) % 12 for x in testSet]
+        # create inversion; first take difference from 12 mod 12
+        testSetInvert = [(12 - x) % 12 for x in testSet]
+        testSetInvert.reverse() # reverse order (first steps now last)
+        # transpose all steps (were last) to zero, mod 12
+        testSetInvert = [(x + (12 - testSetInvert[0])) % 12
+                        for x in testSetInvert]
+        candidates.append([testSet, testSetInvert])
+
+    # compare sets to those in table
+    for indexCandidate in range(len(FORTE[card])):
+        dataLine = FORTE[card][indexCandidate]
+        if dataLine == None: continue # spacer lines
+        inversionsAvailable = forteIndexToInversionsAvailable(
+                              card, indexCandidate)
+
+        for candidate, candidateInversion in candidates:
+            # need to only match form
+            if dataLine[0] == tuple(candidate): # must compare to tuple
+                if 0 in inversionsAvailable:
+                    return (card, indexCandidate, 0)
+                else:
+                    return (card, indexCandidate, 1)
+            elif dataLine[0] == tuple(candidateInversion):
+                if 0 in inversionsAvailable:
+                    return (card, indexCandidate, 0)
+                else:
+                    return (card, indexCandidate, -1)
+    raise ChordTablesException('cannot find a chord table address for %s' % pcSet)
+
+
 
 #-------------------------------------------------------------------------------
 class Test(unittest.TestCase):
@@ -2764,7 +2868,23 @@ class Test(unittest.TestCase):
             # must subtract one b/c all groups contain a zero set to pad
             # index values
             self.assertEqual(len(FORTE[setSize])-1, setCount)
-        
+
+    def testMaskToAddress(self):
+        # every transposition and inversion of each set class finds its address
+        for card in range(1, 13):
+            for index, dataLine in enumerate(FORTE[card]):
+                if dataLine is None: continue
+                for t in range(12):
+                    mask = pitchClassesToMask([(pc + t) % 12 for pc in dataLine[0]])
+                    self.assertEqual(maskToAddress(mask)[:2], (card, index))
+                    mask = pitchClassesToMask([(t - pc) % 12 for pc in dataLine[0]])
+                    self.assertEqual(maskToAddress(mask)[:2], (card, index))
+        # which together are every possible set but the empty one
+        self.assertEqual(_addressesByMask.count(None), 1)
+        self.assertEqual(maskToAddress(pitchClassesToMask([0, 4, 7])),
+                         (3, 11, -1))
+        self.assertEqual(maskToAddress(pitchClassesToMask([0, 3, 7])),
+                         (3, 11, 1))
 
 
 #-------------------------------------------------------------------------------
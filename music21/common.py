@@ -14,6 +14,7 @@ Utility constants, dictionaries, functions, and objects used throughout music21.
 '''
 
 # should NOT import music21 or anything like that, except in doctests.
+import collections
 import re
 import copy
 import math, sys, os
@@ -496,6 +497,12 @@ def cleanupFloat(floatNum, maxDenominator=defaults.limitOffsetDenominator):
 
 DENOM_LIMIT = defaults.limitOffsetDenominator
 
+# Fractions made by opFrac from floats that are not binary expressible, such as
+# the 1/3.0 of a triplet.  Fractions are immutable, so a tuplet-heavy score can
+# share one per value instead of making one for every offset and quarterLength.
+_floatToFraction = {}
+_FLOAT_TO_FRACTION_LIMIT = 4096
+
 def _preFracLimitDenominator(n, d):
     '''
     copied from fractions.limit_denominator.  Their method
@@ -607,6 +614,12 @@ def opFrac(num):
     1.0
     >>> common.opFrac(0.123456789)
     Fraction(10, 81)
+
+    Fractions made from the same float are shared, since tuplet-heavy
+    scores convert the same few values over and over:
+
+    >>> common.opFrac(1.0/3) is common.opFrac(1.0/3)
+    True
     >>> common.opFrac(None) is None
     True
     '''
@@ -624,9 +637,14 @@ def opFrac(num):
         #unused_numerator, denominator = num.as_integer_ratio() # too slow
         ir = num.as_integer_ratio()
         if ir[1] > DENOM_LIMIT: # slightly faster than hardcoding 65535!
-            return Fraction(*_preFracLimitDenominator(*ir)) # way faster!
-            #return Fraction(*ir).limit_denominator(DENOM_LIMIT) # *ir instead of float -- this happens
-                # internally in Fraction constructor, but is twice as fast...
+            f = _floatToFraction.get(num)
+            if f is None:
+                f = Fraction(*_preFracLimitDenominator(*ir)) # way faster!
+                #return Fraction(*ir).limit_denominator(DENOM_LIMIT) # *ir instead of float -- this happens
+                    # internally in Fraction constructor, but is twice as fast...
+                if len(_floatToFraction) < _FLOAT_TO_FRACTION_LIMIT:
+                    _floatToFraction[num] = f
+            return f
         else:
             return num
     elif t is int:
@@ -2314,9 +2332,49 @@ class SingletonCounter(object):
         return post
 
 #-------------------------------------------------------------------------------
+# slot names of each SlottedObject class, including those of its bases
+_slotNamesByClass = {}
+
+# values of these types can be shared by a copy rather than deepcopied
+IMMUTABLE_TYPES = set([type(None), bool, int, float, str, Fraction])
+if six.PY2:
+    IMMUTABLE_TYPES.update([long, unicode]) # @UndefinedVariable pylint: disable=undefined-variable
+
+def _getSlotNames(cls):
+    '''
+    Return a tuple of all slot names of `cls` and its bases, computed once
+    per class.
+    '''
+    try:
+        return _slotNamesByClass[cls]
+    except KeyError:
+        pass
+    slots = set()
+    for mroClass in cls.mro():
+        classSlots = getattr(mroClass, '__slots__', ())
+        if isinstance(classSlots, six.string_types):
+            classSlots = (classSlots,)
+        slots.update(classSlots)
+    slotNames = tuple(sorted(slots))
+    _slotNamesByClass[cls] = slotNames
+    return slotNames
+
+
 class SlottedObject(object):
     r'''
     Provides template for classes implementing slots.
+
+    Deepcopying copies each slot, sharing values (such as numbers and
+    strings) that cannot change:
+
+    >>> import copy
+    >>> t = tie.Tie('start')
+    >>> t.style = 'dotted'
+    >>> t2 = copy.deepcopy(t)
+    >>> t2 is t
+    False
+    >>> (t2.type, t2.style)
+    ('start', 'dotted')
     '''
     
     ### CLASS VARIABLES ###
@@ -2325,12 +2383,22 @@ class SlottedObject(object):
 
     ### SPECIAL METHODS ###
 
+    def __deepcopy__(self, memo=None):
+        if memo is None:
+            memo = {}
+        cls = self.__class__
+        new = cls.__new__(cls)
+        memo[id(self)] = new
+        for slot in _getSlotNames(cls):
+            value = getattr(self, slot, None)
+            if type(value) not in IMMUTABLE_TYPES:
+                value = copy.deepcopy(value, memo)
+            setattr(new, slot, value)
+        return new
+
     def __getstate__(self):
         state = {}
-        slots = set()
-        for cls in self.__class__.mro():
-            slots.update(getattr(cls, '__slots__', ()))
-        for slot in slots:
+        for slot in _getSlotNames(self.__class__):
             state[slot] = getattr(self, slot, None)
         return state
 
@@ -2405,6 +2473,264 @@ class Timer(object):
         return str(round(t,3))
 
 
+#-------------------------------------------------------------------------------
+_tokenCaches = collections.OrderedDict()
+
+class TokenCache(object):
+    '''
+    A bounded cache that maps tokens from a text format (such as 'c4' in
+    tinyNotation, '^F/2' in abc, or '8.dd#' in humdrum) to an immutable
+    description (generally a tuple) of what the token means.  Parsers keep
+    the description and build new music21 objects from it each time the token
+    is seen, rather than parsing the string again.
+
+    When more than `maxSize` tokens are stored, the least recently used
+    token is discarded.  Hits and misses are counted for each cache; see
+    :func:`~music21.common.getTokenCacheStatistics`.
+
+    >>> tc = common.TokenCache('test.doubled', maxSize=2)
+    >>> double = lambda token: token * 2
+    >>> tc.get('a', double)
+    'aa'
+    >>> tc.get('a', double)
+    'aa'
+    >>> tc.get('b', double)
+    'bb'
+    >>> tc.get('c', double)
+    'cc'
+    >>> len(tc)
+    2
+    >>> 'a' in tc
+    False
+    >>> (tc.hits, tc.misses, tc.hitRate)
+    (1, 3, 0.25)
+
+    If `arguments` are given, they are passed to the parse function in
+    place of the key:
+
+    >>> tc.get(('d', 3), lambda token, times: token * times, 'd', 3)
+    'ddd'
+
+    Exceptions raised by the parse function are passed on and nothing is stored:
+
+    >>> tc.get('e', int)
+    Traceback (most recent call last):
+    ValueError: invalid literal for int() with base 10: 'e'
+    >>> 'e' in tc
+    False
+
+    >>> tc.clear()
+    >>> (len(tc), tc.hits, tc.misses)
+    (0, 0, 0)
+    '''
+    def __init__(self, name, maxSize=10000):
+        self.name = name
+        self.maxSize = maxSize
+        self.hits = 0
+        self.misses = 0
+        self._data = collections.OrderedDict()
+        _tokenCaches[name] = self
+
+    def __repr__(self):
+        return '<music21.common.TokenCache %s: %d/%d>' % (self.name, len(self._data), self.maxSize)
+
+    def __len__(self):
+        return len(self._data)
+
+    def __contains__(self, key):
+        return key in self._data
+
+    def get(self, key, parseFunction, *arguments):
+        '''
+        Return the description stored for `key`, calling
+        `parseFunction(key)` (or `parseFunction(*arguments)`) and storing the
+        result if it is not already known.
+        '''
+        data = self._data
+        if key in data: # parse outside of any handler so errors are not chained
+            value = data.pop(key)
+            self.hits += 1
+        else:
+            if arguments:
+                value = parseFunction(*arguments)
+            else:
+                value = parseFunction(key)
+            self.misses += 1
+            if len(data) >= self.maxSize:
+                data.popitem(last=False)
+        data[key] = value # most recently used entries are at the end
+        return value
+
+    def clear(self):
+        '''
+        Remove all stored tokens and reset the statistics.
+        '''
+        self._data.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def _getHitRate(self):
+        total = self.hits + self.misses
+        if total == 0:
+            return 0.0
+        return self.hits / float(total)
+
+    hitRate = property(_getHitRate, doc='''
+        The fraction of calls to :meth:`~music21.common.TokenCache.get` that
+        found the token already stored, or 0.0 if the cache has not been used.
+        ''')
+
+
+def getTokenCacheStatistics():
+    '''
+    Return a dictionary mapping the name of every
+    :class:`~music21.common.TokenCache` to a dictionary of
+    its hits, misses, hitRate, size, and maxSize.
+
+    >>> tc = common.TokenCache('test.statistics', maxSize=5)
+    >>> unused = tc.get('x', str.upper)
+    >>> unused = tc.get('x', str.upper)
+    >>> stats = common.getTokenCacheStatistics()['test.statistics']
+    >>> for k in sorted(stats):
+    ...     print('%s %s' % (k, stats[k]))
+    hitRate 0.5
+    hits 1
+    maxSize 5
+    misses 1
+    size 1
+    '''
+    post = {}
+    for name, tc in _tokenCaches.items():
+        post[name] = {'hits': tc.hits,
+                      'misses': tc.misses,
+                      'hitRate': tc.hitRate,
+                      'size': len(tc),
+                      'maxSize': tc.maxSize,
+                      }
+    return post
+
+
+def clearTokenCaches():
+    '''
+    Empty every :class:`~music21.common.TokenCache` and reset its statistics.
+    '''
+    for tc in _tokenCaches.values():
+        tc.clear()
+
+
+#-------------------------------------------------------------------------------
+# the ids of the objects kept by every InternTable, each mapped to a weak
+# reference to its table; a table keeps its objects alive, so their ids are
+# not reused while it exists, and its entries are removed when it is cleared
+# or goes away
+_internedObjects = {}
+
+def isInterned(obj):
+    '''
+    Return True if `obj` is the shared instance kept by an
+    :class:`~music21.common.InternTable`.  Interned objects are shared by
+    many owners, so code that changes one should change a copy instead.
+
+    >>> common.isInterned(pitch.Pitch('C4'))
+    False
+    '''
+    return id(obj) in _internedObjects
+
+
+class InternTable(object):
+    '''
+    Keeps one shared ("interned") instance for each distinct value of
+    objects, such as :class:`~music21.pitch.Pitch` and
+    :class:`~music21.duration.Duration` objects, that have an
+    `_internKey()` method returning a hashable key describing their value,
+    or None if that object should not be shared.
+
+    The first object seen with a key becomes the shared instance.  Interned
+    objects are kept until the table is cleared or discarded, so a table
+    should only be used for values, like pitches and durations, of which
+    there are few distinct ones.
+
+    >>> it = common.InternTable()
+    >>> p1 = pitch.Pitch('C#4')
+    >>> p2 = pitch.Pitch('C#4')
+    >>> it.intern(p1) is p1
+    True
+    >>> it.intern(p2) is p1
+    True
+    >>> it.intern(pitch.Pitch('D4')) is p1
+    False
+    >>> (common.isInterned(p1), common.isInterned(p2))
+    (True, False)
+    >>> len(it)
+    2
+
+    An object shared by another table is copied rather than shared by both:
+
+    >>> it2 = common.InternTable()
+    >>> p3 = it2.intern(p1)
+    >>> p3 is p1
+    False
+    >>> p3 == p1
+    True
+
+    >>> it.clear()
+    >>> (len(it), common.isInterned(p1), common.isInterned(p3))
+    (0, False, True)
+    >>> del it2
+    >>> common.isInterned(p3)
+    False
+    '''
+    def __init__(self):
+        self._objects = {}
+        objectIds = []
+        def forgetObjects(unused_ref):
+            for objectId in objectIds:
+                _internedObjects.pop(objectId, None)
+        self._objectIds = objectIds
+        # the registry holds this reference, so its callback is called when
+        # the table goes away, even in a garbage collected cycle
+        self._ref = weakref.ref(self, forgetObjects)
+
+    def __len__(self):
+        return len(self._objects)
+
+    def __getstate__(self):
+        return list(self._objects.values())
+
+    def __setstate__(self, state):
+        self.__init__()
+        for obj in state:
+            self.intern(obj)
+
+    def intern(self, obj):
+        '''
+        Return the shared instance with the same value as `obj`, or `obj`
+        itself if it is the first of its value or cannot be shared.
+        '''
+        key = obj._internKey()
+        if key is None:
+            return obj
+        try:
+            return self._objects[key]
+        except KeyError:
+            if isInterned(obj): # kept by another table
+                obj = copy.deepcopy(obj)
+            self._objects[key] = obj
+            self._objectIds.append(id(obj))
+            _internedObjects[id(obj)] = self._ref
+            return obj
+
+    def clear(self):
+        '''
+        Stop sharing the objects of this table.  Owners of them should be
+        given copies first.
+        '''
+        for objectId in self._objectIds:
+            _internedObjects.pop(objectId, None)
+        del self._objectIds[:]
+        self._objects.clear()
+
+
 class Music21CommonException(exceptions21.Music21Exception):
     pass
 
@@ -883,6 +883,114 @@ class Converter(object):
 
 
 
+#-------------------------------------------------------------------------------
+class LazyOpus(object):
+    '''
+    An Opus-like collection of the works in a multi-work file (an ABC 
+    file with many X: reference numbers, or a Humdrum file with several 
+    pieces) that parses each Score only when it is first accessed.
+
+    The works are located with a cached index of their positions in 
+    the file (see :func:`~music21.abcFormat.getReferenceNumberIndex` and 
+    :func:`~music21.humdrum.spineParser.getWorkIndex`), so accessing 
+    one work reads and parses only that work.
+
+    >>> import os
+    >>> fp = os.path.join(common.getSourceFilePath(), 'corpus', 'essenFolksong', 'teste.abc')
+    >>> lo = converter.LazyOpus(fp)
+    >>> lo
+    <music21.converter.LazyOpus teste.abc: 0/8 parsed>
+    >>> lo.getNumbers()
+    [1, 2, 3, 4, 5, 6, 7, 8]
+    >>> s = lo.getScoreByNumber(6)
+    >>> s.metadata.title
+    'Moli hua'
+    >>> lo.getScoreByNumber(6) is s
+    True
+    >>> lo
+    <music21.converter.LazyOpus teste.abc: 1/8 parsed>
+    >>> [len(s.flat.notesAndRests) for s in lo]
+    [33, 51, 59, 33, 29, 174, 67, 88]
+
+    The complete works can be gathered into a real Opus:
+
+    >>> op = lo.toOpus()
+    >>> len(op.scores)
+    8
+    '''
+    def __init__(self, fp, format=None, forceSource=False): # @ReservedAssignment
+        self.filePath = fp
+        if format is None:
+            format = common.findFormatFile(fp) # @ReservedAssignment
+        self.fileFormat = format
+        self.forceSource = forceSource
+        if format == 'abc':
+            from music21 import abcFormat
+            self._index = abcFormat.getReferenceNumberIndex(fp)
+        elif format == 'humdrum':
+            from music21 import humdrum
+            self._index = humdrum.spineParser.getWorkIndex(fp)
+        else:
+            raise ConverterException('cannot lazily parse works in format: %s' % format)
+        self._scores = {}
+
+    def __repr__(self):
+        return '<music21.converter.LazyOpus %s: %d/%d parsed>' % (
+            os.path.basename(self.filePath), len(self._scores), len(self._index))
+
+    def __len__(self):
+        return len(self._index)
+
+    def __iter__(self):
+        for number in self._index:
+            yield self.getScoreByNumber(number)
+
+    def __getitem__(self, i):
+        return self.getScoreByNumber(self.getNumbers()[i])
+
+    def getNumbers(self):
+        '''
+        Return a list of the numbers of all works in the file, in file order.
+        No work is parsed.
+        '''
+        return list(self._index.keys())
+
+    def getScoreByNumber(self, number):
+        '''
+        Return the Score for work `number`, parsing it if it has not 
+        been accessed before.
+        '''
+        if number not in self._index:
+            try:
+                number = int(number)
+            except (ValueError, TypeError):
+                pass
+        if number not in self._index:
+            raise ConverterException('no work numbered %s in %s' % (number, self.filePath))
+        if number not in self._scores:
+            self._scores[number] = parseFile(self.filePath, number=number, 
+                format=self.fileFormat, forceSource=self.forceSource)
+        return self._scores[number]
+
+    def _getScores(self):
+        return list(self)
+
+    scores = property(_getScores, 
+        doc='''
+        Return a list of all Scores, parsing any not yet accessed.
+        ''')
+
+    def toOpus(self):
+        '''
+        Return a :class:`~music21.stream.Opus` containing all works.
+        '''
+        op = stream.Opus()
+        for sc in self:
+            op._appendCore(sc)
+        op._elementsChanged()
+        return op
+
+
 #-------------------------------------------------------------------------------
 # module level convenience methods
 
@@ -943,6 +1051,15 @@ def parse(value, *args, **keywords):
     >>> #_DOCS_SHOW s = converter.parse('http://midirepository.org/file220/file.mid') 
 
 
+    With `lazy=True`, a multi-work ABC or Humdrum file is returned as a 
+    :class:`~music21.converter.LazyOpus`, which parses each work only 
+    when it is first accessed; if a work number is also given (as a 
+    keyword or in a (path, number) pair) just that work is parsed and 
+    returned:
+
+    >>> #_DOCS_SHOW lo = converter.parse('/Users/cuthbert/Desktop/oneills1850.abc', lazy=True) 
+    >>> #_DOCS_SHOW s = lo.getScoreByNumber(12)
+
     Data is preceded by an identifier such as "tinynotation:"
 
     >>> s = converter.parse("tinyNotation: 3/4 E4 r f# g=lastG trip{b-8 a g} c")
@@ -978,14 +1095,31 @@ def parse(value, *args, **keywords):
     else:
         valueStr = value
 
+    if keywords.get('lazy', False) is True:
+        filePath = value
+        if common.isListLike(value) and len(value) == 2:
+            # a (path, number) pair, as from corpus.search
+            filePath = value[0]
+            if value[1] is not None:
+                number = value[1]
+        lo = LazyOpus(filePath, format=m21Format, forceSource=forceSource)
+        if number is not None:
+            # only the requested work is parsed
+            return lo.getScoreByNumber(number)
+        return lo
+
     if (common.isListLike(value) and len(value) == 2 and
         value[1] == None and os.path.exists(value[0])):
         # comes from corpus.search
         return parseFile(value[0], format=m21Format)
     elif (common.isListLike(value) and len(value) == 2 and
         isinstance(value[1], int) and os.path.exists(value[0])):
-        # corpus or other file with movement number
-        return parseFile(value[0], format=m21Format).getScoreByNumber(value[1])
+        # corpus or other file with movement number; formats that can 
+        # index their works return just the Score
+        post = parseFile(value[0], number=value[1], format=m21Format)
+        if 'Opus' in post.classes:
+            post = post.getScoreByNumber(value[1])
+        return post
     elif common.isListLike(value) or len(args) > 0: # tiny notation list
         if len(args) > 0: # add additional args to a list
             value = [value] + list(args)
@@ -1644,6 +1778,46 @@ class Test(unittest.TestCase):
 
 
 
+    def testConversionABCLazyOpus(self):
+        from music21 import corpus
+        fp = corpus.getWork('essenFolksong/han1')
+        lo = parse(fp, lazy=True)
+        self.assertEqual(isinstance(lo, LazyOpus), True)
+        self.assertEqual(len(lo), len(lo.getNumbers()))
+        s = lo.getScoreByNumber(6)
+        self.assertEqual(s.metadata.title, 'Yi gan hongqi kongzhong piao')
+        self.assertEqual(lo.getScoreByNumber('6') is s, True)
+        self.assertEqual(len(lo._scores), 1)
+        self.assertRaises(ConverterException, lo.getScoreByNumber, 100000)
+        # a (path, number) pair or a number returns just that work
+        s2 = parse((fp, 6), lazy=True)
+        self.assertEqual(isinstance(s2, stream.Score), True)
+        self.assertEqual(s2.metadata.title, 'Yi gan hongqi kongzhong piao')
+        s3 = parse(fp, number=6, lazy=True)
+        self.assertEqual(s3.metadata.title, 'Yi gan hongqi kongzhong piao')
+        self.assertEqual(isinstance(parse((fp, None), lazy=True), LazyOpus), True)
+
+    def testConversionHumdrumWorkFromOpus(self):
+        import tempfile
+        from music21.humdrum import testFiles as humdrumTestFiles
+        fp = os.path.join(tempfile.gettempdir(), 'm21-converter-sanctus-test.krn')
+        with open(fp, 'w') as f:
+            f.write(humdrumTestFiles.multipartSanctus)
+        try:
+            op = parse(fp, forceSource=True)
+            self.assertEqual(len(op.scores), 3)
+            s = parse(fp, number=3, forceSource=True)
+            self.assertEqual(isinstance(s, stream.Score), True)
+            self.assertEqual(s.id, 'section_3')
+            self.assertEqual(len(s.parts), len(op.scores[2].parts))
+            self.assertEqual(len(s.flat.notesAndRests), 
+                             len(op.scores[2].flat.notesAndRests))
+            lo = LazyOpus(fp, forceSource=True)
+            self.assertEqual(lo.getNumbers(), [1, 2, 3])
+            self.assertEqual(len(lo[1].parts), 3)
+        finally:
+            os.remove(fp)
+
     def testConversionMusedata(self):
         fp = os.path.join(common.getSourceFilePath(), 'musedata', 'testPrimitive', 'test01')
         s = parse(fp)
@@ -1723,7 +1897,7 @@ class Test(unittest.TestCase):
 #-------------------------------------------------------------------------------
 # define presented order in documentation
 _DOC_ORDER = [parse, parseFile, parseData, parseURL, freeze, thaw, freezeStr, thawStr, 
-              Converter, registerSubconverter, unregisterSubconverter]
+              Converter, LazyOpus, registerSubconverter, unregisterSubconverter]
 
 
 if __name__ == "__main__":
@@ -399,10 +399,11 @@ class ConverterHumdrum(SubConverter):
         
         Calls humdrum.parseFile on filepath.
         
-        Number is ignored here.
+        If `number` is given, only that piece (numbered from 1) of a 
+        multi-piece file is parsed and returned as a Score.
         '''
         from music21 import humdrum
-        self.data = humdrum.parseFile(filepath)
+        self.data = humdrum.parseFile(filepath, number=number)
         #self.data.stream.makeNotation()
 
         self.stream = self.data.stream
@@ -35,6 +35,7 @@ from music21 import metadata
 from music21.corpus import chorales
 from music21.corpus import virtual
 from music21.corpus import corpora
+from music21.corpus import pipelines
 from music21.corpus.corpora import *
 
 from music21 import environment
@@ -238,6 +239,51 @@ def search(
         )
 
 
+def pipeline(
+    query,
+    field=None,
+    corpusNames=('core', 'local'),
+    fileExtensions=None,
+    processes=None,
+    maxInFlight=None,
+    skipFailures=False,
+    ):
+    r'''
+    Return a :class:`~music21.corpus.pipelines.Pipeline` over the works found
+    by :func:`search`, for running analyses on each of them in a pool of
+    worker processes.
+
+    The virtual corpus, whose works must be downloaded, is not searched
+    unless it is named in `corpusNames`.  `query` may also be a
+    MetadataBundle or a list of corpus paths, which are used as they are.
+
+    >>> p = corpus.pipeline(['bach/bwv66.6', 'bach/bwv324'])
+    >>> p
+    <music21.corpus.pipelines.Pipeline {2 scores}>
+    >>> p.map(lambda s: len(s.parts)).reduce(lambda x, y: x + y)
+    8
+
+    For instance, to count the notes in all the works by Bach in the core
+    corpus, with a process for each CPU:
+
+    >>> bachPipeline = corpus.pipeline('bach', field='composer')
+    >>> #_DOCS_SHOW bachPipeline.map(lambda s: len(s.flat.notes)).reduce(lambda x, y: x + y)
+    '''
+    if common.isStr(query) or callable(query):
+        query = search(
+            query,
+            field=field,
+            corpusNames=corpusNames,
+            fileExtensions=fileExtensions,
+            )
+    return pipelines.Pipeline(
+        query,
+        processes=processes,
+        maxInFlight=maxInFlight,
+        skipFailures=skipFailures,
+        )
+
+
 #------------------------------------------------------------------------------
 
 
@@ -0,0 +1,317 @@
+# -*- coding: utf-8 -*-
+#-------------------------------------------------------------------------------
+# Name:         corpus/pipelines.py
+# Purpose:      Running analyses over many scores of the corpus
+#
+# Authors:      Michael Scott Cuthbert
+#
+# Copyright:    Copyright © 2026 Michael Scott Cuthbert and the music21 Project
+# License:      LGPL or BSD, see license.txt
+#-------------------------------------------------------------------------------
+'''
+A :class:`Pipeline` parses each score found by a corpus search (or in a list of
+corpus paths), runs one or more functions on it, and yields the results, so
+that a statistic over many scores can be written as one line:
+
+>>> from music21.corpus import pipelines
+>>> p = pipelines.Pipeline(['bach/bwv66.6', 'bach/bwv324'], processes=1)
+>>> p.map(lambda s: len(s.flat.notes)).reduce(lambda x, y: x + y)
+269
+
+Usually a pipeline is made with :func:`music21.corpus.pipeline`.
+
+Scores are parsed with :func:`music21.corpus.parse`, so the pickled versions
+stored by earlier parses are reused.  With more than one process, scores
+are parsed and the functions are run in a pool of worker processes; only the
+results (which must be picklable) are sent back, and no more than
+`maxInFlight` scores are given to the workers at once, so that memory use
+does not grow with the number of scores.
+'''
+import functools
+import threading
+import unittest
+
+from music21 import exceptions21
+
+from music21 import environment
+_MOD = "corpus.pipelines.py"
+environLocal = environment.Environment(_MOD)
+
+
+#------------------------------------------------------------------------------
+
+
+class PipelineException(exceptions21.Music21Exception):
+    pass
+
+
+# a reduce initial value meaning that none was given
+_NO_INITIAL = object()
+# the result of a score that failed and is skipped
+_SKIPPED = object()
+
+
+#------------------------------------------------------------------------------
+
+
+class Pipeline(object):
+    r'''
+    A sequence of functions to run on each of a group of scores.
+
+    `scores` is a :class:`~music21.metadata.bundles.MetadataBundle` (such as
+    the results of :func:`music21.corpus.search`) or a list of corpus paths or
+    :class:`~music21.metadata.bundles.MetadataEntry` objects.
+
+    If `processes` is None, there is one worker process for each CPU; if it
+    is 1, everything is done in this process.  By default twice as many
+    scores as processes are given to the workers at a time.
+
+    >>> p = corpus.pipelines.Pipeline(['bach/bwv66.6', 'bach/bwv324'])
+    >>> p
+    <music21.corpus.pipelines.Pipeline {2 scores}>
+    >>> len(p)
+    2
+
+    Each call to :meth:`map` returns a new Pipeline that runs one more
+    function, given the result of the function before it (the first is given
+    the parsed score):
+
+    >>> p2 = p.map(lambda s: s.analyze('key')).map(lambda k: k.mode)
+    >>> p2.functions == p.functions
+    False
+    >>> sorted(p2)
+    ['major', 'minor']
+
+    Worker processes get the functions when they start, so with
+    multiprocessing's default way of starting processes on Linux and OS X any
+    function, even a lambda, may be used; on Windows they must be functions
+    defined at the top level of a module.
+    '''
+    def __init__(self, scores, functions=(), processes=None, maxInFlight=None,
+                 skipFailures=False):
+        from music21 import metadata
+        self._jobs = []
+        self._entries = []
+        for entry in scores:
+            if isinstance(entry, metadata.MetadataEntry):
+                self._jobs.append((entry.sourcePath, entry.number))
+            else:
+                self._jobs.append((entry, None))
+            self._entries.append(entry)
+
+        self.functions = tuple(functions)
+        if processes is None:
+            import multiprocessing
+            processes = multiprocessing.cpu_count()
+        self.processes = processes
+        if maxInFlight is None:
+            maxInFlight = processes * 2
+        self.maxInFlight = maxInFlight
+        self.skipFailures = skipFailures
+
+    def __repr__(self):
+        if len(self) == 1:
+            status = '{1 score}'
+        else:
+            status = '{{{0} scores}}'.format(len(self))
+        return '<{0}.{1} {2}>'.format(
+            self.__class__.__module__,
+            self.__class__.__name__,
+            status,
+            )
+
+    def __len__(self):
+        return len(self._jobs)
+
+    def __iter__(self):
+        for unused_entry, result in self.iterateItems():
+            yield result
+
+    def map(self, function):
+        '''
+        Return a new Pipeline that also runs `function` on the result of the
+        functions of this one.
+        '''
+        return Pipeline(self._entries,
+                        functions=self.functions + (function,),
+                        processes=self.processes,
+                        maxInFlight=self.maxInFlight,
+                        skipFailures=self.skipFailures)
+
+    def iterateItems(self, ordered=False):
+        '''
+        Yield a tuple of the score (its MetadataEntry or corpus path) and the
+        result of the functions for each score, as each one is finished, or,
+        if `ordered` is True, in the order of the scores.
+
+        >>> p = corpus.pipelines.Pipeline(['bach/bwv66.6', 'bach/bwv324'],
+        ...                               processes=1)
+        >>> for item in p.map(lambda s: len(s.parts)).iterateItems():
+        ...     item
+        ('bach/bwv66.6', 4)
+        ('bach/bwv324', 4)
+
+        If a score cannot be parsed, or a function fails on it, a
+        PipelineException is raised, unless `skipFailures` is True, in which
+        case the score is skipped.
+
+        >>> p = corpus.pipelines.Pipeline(['bach/bwv66.6', 'bach/bwv324'],
+        ...                               processes=1)
+        >>> list(p.map(lambda s: s.parts[0].measure(15).number))
+        Traceback (most recent call last):
+        PipelineException: failed on bach/bwv66.6: AttributeError: 'NoneType' object has no attribute 'number'
+        '''
+        buffered = {}
+        nextIndex = 0
+        for index, result, failure in self._iterateResults():
+            if failure is not None:
+                if not self.skipFailures:
+                    raise PipelineException('failed on {0}: {1}'.format(
+                        self._jobs[index][0], failure))
+                result = _SKIPPED
+            if not ordered:
+                if result is not _SKIPPED:
+                    yield self._entries[index], result
+                continue
+            # keep the results that are finished early until their turn
+            buffered[index] = result
+            while nextIndex in buffered:
+                result = buffered.pop(nextIndex)
+                if result is not _SKIPPED:
+                    yield self._entries[nextIndex], result
+                nextIndex += 1
+
+    def reduce(self, function, initial=_NO_INITIAL):
+        '''
+        Combine the results with `function` as the built-in `reduce` does,
+        in the order of the scores (whichever order they are finished in),
+        starting from `initial`, if given.
+
+        >>> p = corpus.pipelines.Pipeline(['bach/bwv66.6', 'bach/bwv324'],
+        ...                               processes=1)
+        >>> p.map(lambda s: s.metadata.title).reduce(lambda x, y: x + [y], [])
+        ['bwv66.6.mxl', 'bwv324.mxl']
+
+        >>> corpus.pipelines.Pipeline([]).reduce(max)
+        Traceback (most recent call last):
+        PipelineException: cannot reduce a pipeline without results or an initial value
+        '''
+        results = (result for unused_entry, result in self.iterateItems(ordered=True))
+        if initial is _NO_INITIAL:
+            try:
+                initial = next(results)
+            except StopIteration:
+                raise PipelineException(
+                    'cannot reduce a pipeline without results or an initial value')
+        return functools.reduce(function, results, initial)
+
+    def _iterateResults(self):
+        '''
+        Yield a tuple of the index of a score, the result of the functions on
+        it (or None), and a description of how it failed (or None), as each
+        score is finished.
+        '''
+        jobs = [(i, sourcePath, number)
+                for i, (sourcePath, number) in enumerate(self._jobs)]
+        if self.processes <= 1 or len(jobs) <= 1:
+            for job in jobs:
+                yield _runJob(job, self.functions)
+            return
+
+        import multiprocessing
+        # the task handler of the pool takes jobs from boundedJobs as it can;
+        # it waits for a result to be taken before giving out another job
+        inFlight = threading.Semaphore(self.maxInFlight)
+        stopped = []
+        def boundedJobs():
+            for job in jobs:
+                inFlight.acquire()
+                if stopped:
+                    return
+                yield job
+
+        pool = multiprocessing.Pool(processes=self.processes,
+                                    initializer=_initializePipelineWorker,
+                                    initargs=(self.functions,))
+        try:
+            for jobResult in pool.imap_unordered(_runJobInWorker, boundedJobs()):
+                inFlight.release()
+                yield jobResult
+        finally:
+            stopped.append(True)
+            inFlight.release()
+            pool.terminate()
+            pool.join()
+
+
+#------------------------------------------------------------------------------
+# running jobs, here or in worker processes
+
+_pipelineWorkerFunctions = ()
+
+def _initializePipelineWorker(functions):
+    global _pipelineWorkerFunctions # pylint: disable=global-statement
+    _pipelineWorkerFunctions = functions
+
+def _runJobInWorker(job):
+    return _runJob(job, _pipelineWorkerFunctions)
+
+def _runJob(job, functions):
+    '''
+    Parse the score of `job` and run `functions` on it, returning the index
+    of the job, the result, and how the job failed, if it did.
+    '''
+    from music21 import corpus
+    index, sourcePath, number = job
+    try:
+        result = corpus.parse(sourcePath, number=number)
+        for function in functions:
+            result = function(result)
+    except Exception as e: # pylint: disable=broad-except
+        return index, None, '{0}: {1}'.format(e.__class__.__name__, e)
+    return index, result, None
+
+
+#------------------------------------------------------------------------------
+
+
+class Test(unittest.TestCase):
+
+    def runTest(self):
+        pass
+
+    def testProcesses(self):
+        from music21 import corpus
+        workList = ['bach/bwv66.6', 'bach/bwv324', 'bach/bwv1.6',
+                    'schoenberg/opus19/movement2', 'corelli/opus3no1/1grave']
+        serial = Pipeline(workList, processes=1).map(lambda s: len(s.flat.notes))
+        parallel = Pipeline(workList, processes=2, maxInFlight=2).map(
+            lambda s: len(s.flat.notes))
+        expected = [len(corpus.parse(w).flat.notes) for w in workList]
+        self.assertEqual(list(serial), expected)
+        self.assertEqual(sorted(parallel), sorted(expected))
+        self.assertEqual(list(parallel.iterateItems(ordered=True)),
+                         list(zip(workList, expected)))
+        self.assertEqual(parallel.reduce(lambda x, y: x + [y], []), expected)
+
+    def testSkipFailures(self):
+        workList = ['bach/bwv66.6', 'bach/bwv1.6', 'corelli/opus3no1/1grave']
+        for processes in (1, 2):
+            p = Pipeline(workList, processes=processes, skipFailures=True)
+            p = p.map(lambda s: s.parts[0].measure(15).number)
+            self.assertEqual(p.reduce(lambda x, y: x + [y], []), [15, 15])
+            p.skipFailures = False
+            self.assertRaises(PipelineException, p.reduce, max)
+
+
+#------------------------------------------------------------------------------
+# define presented order in documentation
+_DOC_ORDER = [Pipeline]
+
+
+if __name__ == "__main__":
+    import music21
+    music21.mainTest(Test)
+
+#------------------------------------------------------------------------------
+# eof
@@ -712,12 +712,14 @@ class ClassDocumenter(ObjectDocumenter):
             ...
             music21.base.Music21Object:
             - music21.base.Music21Object.activeSite
+            - music21.base.Music21Object.groups
             - music21.base.Music21Object.offset
             - music21.base.Music21Object.offsetFloat
             - music21.base.Music21Object.offsetRational
             - music21.base.Music21Object.priority
             - music21.base.Music21Object.quarterLength
             - music21.base.Music21Object.quarterLengthFloat
+            - music21.base.Music21Object.sites
             music21.stream.Stream:
             - music21.stream.Stream.atSoundingPitch
             - music21.stream.Stream.duration
@@ -2184,6 +2184,32 @@ class Duration(DurationCommon):
 
     ### PRIVATE METHODS ###
 
+    def _internKey(self):
+        '''
+        Return a tuple describing this Duration for a
+        :class:`~music21.common.InternTable`, or None if it is not a plain
+        Duration of one component without tuplets, and so is not shared.
+
+        ::
+
+            >>> duration.Duration(1.5)._internKey() == duration.Duration(1.5)._internKey()
+            True
+            >>> duration.Duration(1.0/3)._internKey() is None
+            True
+            >>> duration.Duration(2.5)._internKey() is None
+            True
+        '''
+        if type(self) is not Duration:
+            return None
+        components = self.components
+        if len(components) != 1:
+            return None
+        c = components[0]
+        if type(c) is not DurationUnit or c.tuplets:
+            return None
+        return (self.linkage, self.quarterLength, c.type, c.dots,
+                c.quarterLength, c.isLinked)
+
     def _updateComponents(self):
         '''
         This method will re-construct components and thus is not good if the
@@ -3025,8 +3051,13 @@ class Duration(DurationCommon):
 
 
     def _setQuarterLength(self, value):
-        if self._qtrLength != value:
-            value = opFrac(value)
+        # after opFrac, a Fraction is never binary expressible, so it cannot
+        # equal a float; this avoids Fraction's slow comparison with floats
+        value = opFrac(value)
+        if value is self._qtrLength:
+            return
+        if ((type(value) is fractions.Fraction and type(self._qtrLength) is float)
+                or self._qtrLength != value):
             if value == 0.0 and self.isLinked is True:
                 self.clear()
             self._qtrLength = value
@@ -11,8 +11,13 @@
 #-------------------------------------------------------------------------------
 from __future__ import print_function
 
+import hashlib
+import json
 import unittest
 import os
+import struct
+import time
+import zipfile
 
 from music21 import common
 from music21 import converter
@@ -20,6 +25,8 @@ from music21 import corpus
 from music21 import exceptions21
 from music21 import stream
 from music21 import text
+from music21.base import _missingImport # for optional numpy
+from music21.ext import six
 
 from music21 import environment
 _MOD = 'features/base.py'
@@ -228,17 +235,24 @@ class StreamForms(object):
     '''
     def __init__(self, streamObj, prepareStream=True):   
         self.stream = streamObj
-        if self.stream is not None:
-            if prepareStream:
-                self._base = self._prepareStream(self.stream)
-            else: # possibly make a copy?
-                self._base = self.stream
-        else:       
-            self._base = None
+        self.prepareStream = prepareStream
+        # the prepared stream is made on first use, so that a StreamForms 
+        # whose features are all cached never needs to strip ties
+        self._preparedStream = None
 
         # basic data storage is a dictionary
         self._forms = {}    
 
+    def _getBase(self):
+        if self._preparedStream is None and self.stream is not None:
+            if self.prepareStream:
+                self._preparedStream = self._prepareStream(self.stream)
+            else: # possibly make a copy?
+                self._preparedStream = self.stream
+        return self._preparedStream
+
+    _base = property(_getBase)
+
     def keys(self):
         # will only return forms that are established
         return self._forms.keys()
@@ -310,7 +324,8 @@ class StreamForms(object):
                 # options here permit getting part information out
                 # of chordified representation
                 self._forms['chordify'] = self._base.chordify(
-                    addPartIdAsGroup=True, removeRedundantPitches=False)
+                    addPartIdAsGroup=True, removeRedundantPitches=False,
+                    useTimespans=True)
             else: # for now, just return a normal Part or Stream
                 self._forms['chordify'] = self._base
             return self._forms['chordify']
@@ -382,19 +397,20 @@ class StreamForms(object):
             self._forms['noteQuarterLengthHistogram'] = histo
             return self._forms['noteQuarterLengthHistogram']
 
-        # data lists / histograms
+        # data lists / histograms; these are tuples, so that feature 
+        # extractors can share them without copying
         elif key in ['pitchClassHistogram']:
             histo = [0] * 12
             for p in self.__getitem__('flat.pitches'): # recursive call
                 histo[p.pitchClass] += 1
-            self._forms['pitchClassHistogram'] = histo
+            self._forms['pitchClassHistogram'] = tuple(histo)
             return self._forms['pitchClassHistogram']
 
         elif key in ['midiPitchHistogram']:
             histo = [0] * 128
             for p in self.__getitem__('flat.pitches'): # recursive call
                 histo[p.midi] += 1
-            self._forms['midiPitchHistogram'] = histo
+            self._forms['midiPitchHistogram'] = tuple(histo)
             return self._forms['midiPitchHistogram']
 
         # bins for all abs spans between adjacent melodic notes
@@ -426,7 +442,7 @@ class StreamForms(object):
                             histo[abs(n.midi - nNext.midi)] += 1
                         except:
                             pass # problem with not having midi
-            self._forms['midiIntervalHistogram'] = histo
+            self._forms['midiIntervalHistogram'] = tuple(histo)
             return self._forms['midiIntervalHistogram']
 
 
@@ -502,6 +518,7 @@ class StreamForms(object):
         else:
             raise AttributeError('no such attribute: %s' % key)
 
+
         
 
 
@@ -515,6 +532,8 @@ class DataInstance(object):
     '''
     def __init__(self, streamObj=None, id=None): #@ReservedAssignment
         self.stream = streamObj
+        # the file path or corpus name that the stream was parsed from, if any
+        self.sourcePath = None
 
         # perform basic operations that are performed on all
         # streams
@@ -626,17 +645,34 @@ class OutputFormat(object):
         '''
         pass # define in subclass
 
+    def getLines(self, includeClassLabel=True, includeId=True):
+        '''Yield each line of the file, as a string without a line break, one row of the DataSet at a time.
+        '''
+        pass # define in subclass
+
+    def getString(self, includeClassLabel=True, includeId=True, lineBreak=None):
+        '''Get the complete DataSet as a string with the appropriate headers.
+        '''
+        if lineBreak is None:
+            lineBreak = '\n'
+        return lineBreak.join(self.getLines(includeClassLabel=includeClassLabel, 
+                                            includeId=includeId))
+
     def write(self, fp=None, includeClassLabel=True, includeId=True):
         '''Write the file. If not file path is given, a temporary file will be written.
+
+        Lines are written as they are made, so the whole file is never held in memory.
         '''
         if fp is None:
             fp = environLocal.getTempFile(suffix=self._ext)
         if not fp.endswith(self._ext):
-            raise
-        f = open(fp, 'w')
-        f.write(self.getString(includeClassLabel=includeClassLabel, 
-                               includeId=includeId))
-        f.close()
+            raise OutputFormatException('file path %s does not end with %s' % (fp, self._ext))
+        with open(fp, 'w') as f:
+            for i, line in enumerate(self.getLines(includeClassLabel=includeClassLabel, 
+                                                   includeId=includeId)):
+                if i > 0:
+                    f.write('\n')
+                f.write(line)
         return fp
 
 
@@ -699,22 +735,14 @@ class OutputTabOrange(OutputFormat):
         post.append(row)
         return post
 
-    def getString(self, includeClassLabel=True, includeId=True, lineBreak=None):
-        '''Get the complete DataSet as a string with the appropriate headers.
-        '''
-        if lineBreak is None:
-            lineBreak = '\n'
-        msg = []
+    def getLines(self, includeClassLabel=True, includeId=True):
         header = self.getHeaderLines(includeClassLabel=includeClassLabel,
                                      includeId=includeId)
-        data = header + self._dataSet.getFeaturesAsList(
-            includeClassLabel=includeClassLabel)
-        for row in data:
-            sub = []
-            for e in row:
-                sub.append(str(e))
-            msg.append('\t'.join(sub))
-        return lineBreak.join(msg)
+        for row in header:
+            yield '\t'.join(row)
+        for row in self._dataSet.iterateFeatureRows(
+                includeClassLabel=includeClassLabel, includeId=includeId):
+            yield '\t'.join([str(e) for e in row])
 
 
 
@@ -742,20 +770,14 @@ class OutputCSV(OutputFormat):
             includeClassLabel=includeClassLabel, includeId=includeId))
         return post
 
-    def getString(self, includeClassLabel=True, includeId=True, lineBreak=None):
-        if lineBreak is None:
-            lineBreak = '\n'
-        msg = []
+    def getLines(self, includeClassLabel=True, includeId=True):
         header = self.getHeaderLines(includeClassLabel=includeClassLabel, 
                                     includeId=includeId)
-        data = header + self._dataSet.getFeaturesAsList(
-            includeClassLabel=includeClassLabel, includeId=includeId)
-        for row in data:
-            sub = []
-            for e in row:
-                sub.append(str(e))
-            msg.append(','.join(sub))
-        return lineBreak.join(msg)
+        for row in header:
+            yield ','.join(row)
+        for row in self._dataSet.iterateFeatureRows(
+                includeClassLabel=includeClassLabel, includeId=includeId):
+            yield ','.join([str(e) for e in row])
 
 
 
@@ -817,26 +839,177 @@ class OutputARFF(OutputFormat):
         post.append('@DATA')
         return post
 
-    def getString(self, includeClassLabel=True, includeId=True, lineBreak=None):
-        if lineBreak is None:
-            lineBreak = '\n'
-
-        msg = []
-
+    def getLines(self, includeClassLabel=True, includeId=True):
         header = self.getHeaderLines(includeClassLabel=includeClassLabel, 
                                     includeId=includeId)
         for row in header:
-            msg.append(row)
-
-        data = self._dataSet.getFeaturesAsList(
-                includeClassLabel=includeClassLabel)
+            yield row
         # data is separated by commas
-        for row in data:
-            sub = []
-            for e in row:
-                sub.append(str(e))
-            msg.append(','.join(sub))
-        return lineBreak.join(msg)
+        for row in self._dataSet.iterateFeatureRows(
+                includeClassLabel=includeClassLabel, includeId=includeId):
+            yield ','.join([str(e) for e in row])
+
+
+class OutputNPY(OutputFormat):
+    '''
+    A NumPy .npy file of the features as a matrix of 64-bit floats, with one
+    row for each DataInstance and one column for each feature dimension.
+    Identifiers and class values are not numbers and are not written (see
+    :class:`~music21.features.base.OutputNPZ`).
+
+    The file is written one row at a time, and NumPy is not needed to write
+    it; load it with `numpy.load`.
+
+    >>> ds = features.DataSet(classLabel='Composer')
+    >>> ds.addFeatureExtractors([features.jSymbolic.InitialTimeSignatureFeature])
+    >>> ds.addData('bwv66.6', classValue='Bach')
+    >>> ds.process()
+    >>> fp = ds.write(format='npy')
+    >>> fp.endswith('.npy')
+    True
+    >>> with open(fp, 'rb') as f:
+    ...     f.read(6)[1:] == b'NUMPY'
+    True
+    >>> import os
+    >>> os.remove(fp)
+    '''
+    def __init__(self, dataSet=None):
+        OutputFormat.__init__(self, dataSet=dataSet)
+        self._ext = '.npy'
+
+    def getString(self, includeClassLabel=True, includeId=True, lineBreak=None):
+        raise OutputFormatException('%s is a binary format; use write()' % self._ext)
+
+    def write(self, fp=None, includeClassLabel=True, includeId=True):
+        '''Write the file. If not file path is given, a temporary file will be written.
+
+        `includeClassLabel` and `includeId` are accepted for compatibility with other formats and are ignored.
+        '''
+        if fp is None:
+            fp = environLocal.getTempFile(suffix=self._ext)
+        if not fp.endswith(self._ext):
+            raise OutputFormatException('file path %s does not end with %s' % (fp, self._ext))
+        with open(fp, 'wb') as f:
+            _writeNpyFeatures(f, self._dataSet)
+        return fp
+
+
+class OutputNPZ(OutputFormat):
+    '''
+    A NumPy .npz file (a compressed zip archive of .npy files) with the
+    feature matrix (as written by :class:`~music21.features.base.OutputNPY`)
+    as 'features', the attribute label of each column as 'attributeLabels',
+    and, optionally, the identifiers as 'ids' and the class values as
+    'classValues'; all but 'features' are arrays of unicode strings.
+
+    >>> ds = features.DataSet(classLabel='Composer')
+    >>> ds.addFeatureExtractors([features.jSymbolic.InitialTimeSignatureFeature])
+    >>> ds.addData('bwv66.6', classValue='Bach')
+    >>> ds.process()
+    >>> fp = ds.write(format='npz')
+    >>> import zipfile
+    >>> sorted(zipfile.ZipFile(fp).namelist())
+    ['attributeLabels.npy', 'classValues.npy', 'features.npy', 'ids.npy']
+    >>> import os
+    >>> os.remove(fp)
+    '''
+    def __init__(self, dataSet=None):
+        OutputFormat.__init__(self, dataSet=dataSet)
+        self._ext = '.npz'
+
+    def getString(self, includeClassLabel=True, includeId=True, lineBreak=None):
+        raise OutputFormatException('%s is a binary format; use write()' % self._ext)
+
+    def write(self, fp=None, includeClassLabel=True, includeId=True):
+        '''Write the file. If not file path is given, a temporary file will be written.
+
+        The feature matrix is written one row at a time to a temporary file before it is compressed into the archive.
+        '''
+        if fp is None:
+            fp = environLocal.getTempFile(suffix=self._ext)
+        if not fp.endswith(self._ext):
+            raise OutputFormatException('file path %s does not end with %s' % (fp, self._ext))
+        dataSet = self._dataSet
+        featuresFp = environLocal.getTempFile(suffix='.npy')
+        try:
+            with open(featuresFp, 'wb') as f:
+                _writeNpyFeatures(f, dataSet)
+            with zipfile.ZipFile(fp, 'w', zipfile.ZIP_DEFLATED) as zf:
+                zf.write(featuresFp, 'features.npy')
+                zf.writestr('attributeLabels.npy', _getNpyStrings(
+                    dataSet.getAttributeLabels(includeClassLabel=False, includeId=False)))
+                if includeId:
+                    zf.writestr('ids.npy', _getNpyStrings(
+                        [di.getId() for di in dataSet.dataInstances]))
+                if includeClassLabel:
+                    zf.writestr('classValues.npy', _getNpyStrings(
+                        [di.getClassValue() for di in dataSet.dataInstances]))
+        finally:
+            os.remove(featuresFp)
+        return fp
+
+
+def _getNpyHeader(descr, shape):
+    '''
+    Return the header of a version 1.0 .npy file for a C-ordered array.
+
+    >>> h = features.base._getNpyHeader('<f8', (2, 3))
+    >>> len(h) % 64
+    0
+    >>> h[10:].strip() == b"{'descr': '<f8', 'fortran_order': False, 'shape': (2, 3), }"
+    True
+    '''
+    if len(shape) == 1:
+        shapeStr = '(%d,)' % shape[0]
+    else:
+        shapeStr = '(%s)' % ', '.join([str(x) for x in shape])
+    header = "{'descr': '%s', 'fortran_order': False, 'shape': %s, }" % (descr, shapeStr)
+    # the magic string, version, and length take 10 bytes; 
+    # pad so that the data is aligned, ending with a newline
+    header += ' ' * (63 - (10 + len(header)) % 64) + '\n'
+    return (b'\x93NUMPY\x01\x00' + struct.pack('<H', len(header)) 
+            + header.encode('latin-1'))
+
+
+def _writeNpyFeatures(f, dataSet):
+    '''
+    Write the features of `dataSet` to the open binary file `f` as a .npy
+    matrix of little-endian 64-bit floats, one row at a time.
+    '''
+    numColumns = len(dataSet.getAttributeLabels(includeClassLabel=False, includeId=False))
+    rowFormat = '<%dd' % numColumns
+    f.write(_getNpyHeader('<f8', (len(dataSet.dataInstances), numColumns)))
+    for i, row in enumerate(dataSet.iterateFeatureRows(includeClassLabel=False, 
+                                                        includeId=False)):
+        try:
+            f.write(struct.pack(rowFormat, *row))
+        except struct.error:
+            raise OutputFormatException(
+                'row %d cannot be written as %d floats: %r' % (i, numColumns, row))
+
+
+def _getNpyStrings(values):
+    '''
+    Return the contents of a .npy file of a one-dimensional array of unicode
+    strings made from `values`.
+
+    >>> b = features.base._getNpyStrings(['ab', 'c'])
+    >>> len(b)
+    144
+    >>> b[10:128].strip() == b"{'descr': '<U2', 'fortran_order': False, 'shape': (2,), }"
+    True
+    >>> b[-16:].decode('utf-32-le') == 'ab' + 'c' + chr(0)
+    True
+    '''
+    strings = []
+    for v in values:
+        if isinstance(v, six.binary_type):
+            v = v.decode('utf-8')
+        strings.append(six.text_type(v))
+    width = max([1] + [len(x) for x in strings])
+    data = u''.join([x.ljust(width, u'\x00') for x in strings])
+    return (_getNpyHeader('<U%d' % width, (len(strings),)) 
+            + data.encode('utf-32-le'))
 
 
 
@@ -874,6 +1047,8 @@ class DataSet(object):
         self._classLabel = classLabel
         # store a multidimensional storage of all features
         self._features = [] 
+        # seconds spent in each feature extractor in the last process()
+        self.extractorTimes = {}
         # set extractors
         self.addFeatureExtractors(featureExtractors)
         
@@ -965,13 +1140,10 @@ class DataSet(object):
             di = dataOrStreamOrPath
             s = di.stream
         elif common.isStr(dataOrStreamOrPath):
-            # could be corpus or file path
-            if os.path.exists(dataOrStreamOrPath) or dataOrStreamOrPath.startswith('http'):
-                s = converter.parse(dataOrStreamOrPath)
-            else: # assume corpus
-                s = corpus.parse(dataOrStreamOrPath)
+            s = _parseDataPath(dataOrStreamOrPath)
             # assume we can use this string as an id
             di = DataInstance(s, id=dataOrStreamOrPath)
+            di.sourcePath = dataOrStreamOrPath
         else:        
             # for now, assume all else are streams
             s = dataOrStreamOrPath
@@ -981,31 +1153,127 @@ class DataSet(object):
         self.dataInstances.append(di)
         self.streams.append(s)
 
-    def process(self):
+    def process(self, processes=1, cacheDirectory=None):
         '''Process all Data with all FeatureExtractors. Processed data is stored internally as numerous Feature objects. 
+
+        If `processes` is greater than 1, the DataInstances are divided among that many worker processes. DataInstances added from a file path or corpus name are parsed again in the worker; others are sent frozen.
+
+        If `cacheDirectory` is given, the vector of each feature of each DataInstance added from a file path or corpus name is stored in a .json file in that directory, keyed by a hash of the contents of the file and by the id, class name, and music21 version of the extractor. Processing again, even after adding more FeatureExtractors, only extracts the features that are not already stored.
+
+        The seconds spent in each FeatureExtractor (by class name) are stored in the `extractorTimes` dictionary.
+
+        >>> import tempfile
+        >>> cacheDir = tempfile.mkdtemp()
+        >>> ds = features.DataSet(classLabel='Composer')
+        >>> ds.addFeatureExtractors([features.jSymbolic.InitialTimeSignatureFeature])
+        >>> ds.addData('bwv66.6', classValue='Bach')
+        >>> ds.process(cacheDirectory=cacheDir)
+        >>> sorted(ds.extractorTimes.keys())
+        ['InitialTimeSignatureFeature']
+
+        Adding an extractor only extracts the new feature:
+
+        >>> ds.addFeatureExtractors([features.jSymbolic.ChangesOfMeterFeature])
+        >>> ds.process(cacheDirectory=cacheDir)
+        >>> sorted(ds.extractorTimes.keys())
+        ['ChangesOfMeterFeature']
+        >>> ds.getFeaturesAsList()
+        [['bwv66.6', 4, 4, 0, 'Bach']]
+
+        >>> import shutil
+        >>> shutil.rmtree(cacheDir)
         '''
         # clear features
         self._features = []
+        self.extractorTimes = {}
+        featureExtractors = self._featureExtractors
+        columnKeys = [_getCacheColumnKey(fe) for fe in featureExtractors]
+
+        # for each DataInstance: cache file path, stored vectors, extractors to run
+        cacheFilePaths = []
+        storedVectors = []
+        missingColumns = []
         for data in self.dataInstances:
-            row = []
-            for fe in self._featureExtractors:
-                fe.setData(data)
-                # in some cases there might be problem; to not fail 
+            cacheFilePath = _getCacheFilePath(data, cacheDirectory)
+            stored = {}
+            if cacheFilePath is not None and os.path.exists(cacheFilePath):
                 try:
-                    fReturned = fe.extract()
-                except: # for now take any error
-                    environLocal.printDebug(['failed feature extactor:', fe])
-                    # provide a blank feature extactor
-                    fReturned = fe.getBlankFeature()
+                    with open(cacheFilePath) as f:
+                        stored = json.load(f)
+                except ValueError: # a damaged cache file is recomputed
+                    stored = {}
+            cacheFilePaths.append(cacheFilePath)
+            storedVectors.append(stored)
+            missingColumns.append([j for j, key in enumerate(columnKeys) 
+                                   if key not in stored])
+
+        if processes is not None and processes > 1:
+            results = self._extractInWorkers(missingColumns, processes)
+        else:
+            results = (_extractFeatures(data, [featureExtractors[j] for j in missing])
+                       for data, missing in zip(self.dataInstances, missingColumns))
+
+        for i, extracted in enumerate(results):
+            stored = storedVectors[i]
+            newlyStored = False
+            for j, (vector, seconds) in zip(missingColumns[i], extracted):
+                feName = featureExtractors[j].__class__.__name__
+                self.extractorTimes[feName] = self.extractorTimes.get(feName, 0.0) + seconds
+                if vector is None:
+                    continue # failures are not stored
+                stored[columnKeys[j]] = vector
+                newlyStored = True
+            if newlyStored and cacheFilePaths[i] is not None:
+                _writeCacheFile(cacheFilePaths[i], stored)
 
+            row = []
+            for j, fe in enumerate(featureExtractors):
+                # in some cases there might be problem; to not fail 
+                # provide a blank feature
+                fReturned = fe.getBlankFeature()
+                if columnKeys[j] in stored:
+                    fReturned.vector = stored[columnKeys[j]]
                 row.append(fReturned) # get feature and store
             # rows will align with data the order of DataInstances
             self._features.append(row)
 
-    def getFeaturesAsList(self, includeClassLabel=True, includeId=True, concatenateLists=True):
-        '''Get processed data as a list of lists, merging any sub-lists in multi-dimensional features. 
+    def _extractInWorkers(self, missingColumns, processes):
+        '''
+        Yield the results of :func:`_extractFeatures` for each DataInstance, 
+        extracting the missing columns in a pool of worker processes.
+        '''
+        import multiprocessing
+        from music21 import freezeThaw
+        jobs = []
+        for data, missing in zip(self.dataInstances, missingColumns):
+            extractorClasses = [self._featureExtractors[j].__class__ for j in missing]
+            if not extractorClasses:
+                source = None
+            elif data.sourcePath is not None:
+                source = ('path', data.sourcePath)
+            else:
+                sf = freezeThaw.StreamFreezer(data.stream)
+                source = ('frozen', sf.writeStr(fmt='pickle'))
+            jobs.append((source, extractorClasses))
+        pool = multiprocessing.Pool(processes=processes)
+        try:
+            for extracted in pool.imap(_extractFeaturesInWorker, jobs):
+                yield extracted
+        finally:
+            pool.terminate()
+            pool.join()
+
+    def iterateFeatureRows(self, includeClassLabel=True, includeId=True, concatenateLists=True):
+        '''Yield the processed data one DataInstance at a time, as a list merging any sub-lists in multi-dimensional features.
+
+        >>> ds = features.DataSet(classLabel='Composer')
+        >>> ds.addFeatureExtractors([features.jSymbolic.InitialTimeSignatureFeature])
+        >>> ds.addData('bwv66.6', classValue='Bach')
+        >>> ds.process()
+        >>> for row in ds.iterateFeatureRows():
+        ...     row
+        ['bwv66.6', 4, 4, 'Bach']
         '''
-        post = []
         for i, row in enumerate(self._features):
             v = []
             di = self.dataInstances[i]
@@ -1019,12 +1287,34 @@ class DataSet(object):
                     v.append(f.vector)
             if includeClassLabel:
                 v.append(di.getClassValue())
-            post.append(v)
+            yield v
+
+    def getFeaturesAsList(self, includeClassLabel=True, includeId=True, concatenateLists=True):
+        '''Get processed data as a list of lists, merging any sub-lists in multi-dimensional features. 
+        '''
+        post = list(self.iterateFeatureRows(includeClassLabel=includeClassLabel, 
+                                            includeId=includeId, 
+                                            concatenateLists=concatenateLists))
         if not includeClassLabel and not includeId:
             return post[0]
         else:
             return post
 
+    def getFeaturesAsArray(self):
+        '''Get processed data as a tuple of a NumPy matrix of floats, with one row for each DataInstance and one column for each feature dimension, and a list of the attribute label of each column.
+
+        Identifiers and class values are not numbers and are not in the matrix; they are in the same order as `dataInstances`. The matrix is allocated once and filled one row at a time. NumPy is required; without it, the features can still be written as a .npy or .npz file with :meth:`write`.
+        '''
+        if 'numpy' in _missingImport:
+            raise DataSetException('could not find numpy, getFeaturesAsArray is not allowed')
+        import numpy
+        labels = self.getAttributeLabels(includeClassLabel=False, includeId=False)
+        matrix = numpy.empty((len(self._features), len(labels)), dtype=float)
+        for i, row in enumerate(self.iterateFeatureRows(includeClassLabel=False, 
+                                                         includeId=False)):
+            matrix[i] = row
+        return matrix, labels
+
     def getUniqueClassValues(self):
         '''Return a list of unique class values.
         '''
@@ -1042,6 +1332,10 @@ class DataSet(object):
             outputFormat = OutputCSV(dataSet=self)
         elif featureFormat.lower() in ['arff', 'attribute']:
             outputFormat = OutputARFF(dataSet=self)
+        elif featureFormat.lower() in ['npy', 'numpy']:
+            outputFormat = OutputNPY(dataSet=self)
+        elif featureFormat.lower() in ['npz']:
+            outputFormat = OutputNPZ(dataSet=self)
         else:
             return None
         return outputFormat
@@ -1083,11 +1377,104 @@ class DataSet(object):
             outputFormat = self._getOutputFormatFromFilePath(fp)
         else:
             outputFormat = self._getOutputFormat(format)
-        if OutputFormat is None:
+        if outputFormat is None:
             raise DataSetException('no output format could be defined from file path %s or format %s' % (fp, format))
 
-        outputFormat.write(fp=fp, includeClassLabel=includeClassLabel)
+        return outputFormat.write(fp=fp, includeClassLabel=includeClassLabel)
         
+def _parseDataPath(dataPath):
+    '''
+    Parse a file path, URL, or corpus name as DataSet.addData does.
+    '''
+    # could be corpus or file path
+    if os.path.exists(dataPath) or dataPath.startswith('http'):
+        return converter.parse(dataPath)
+    else: # assume corpus
+        return corpus.parse(dataPath)
+
+
+def _extractFeatures(dataInstance, featureExtractors):
+    '''
+    Extract each of `featureExtractors` from `dataInstance`, returning a list
+    of (vector, seconds) tuples; the vector is None if the extractor failed.
+    '''
+    post = []
+    for fe in featureExtractors:
+        start = time.time()
+        fe.setData(dataInstance)
+        # in some cases there might be problem; to not fail 
+        try:
+            vector = fe.extract().vector
+        except: # for now take any error # pylint: disable=bare-except
+            environLocal.printDebug(['failed feature extactor:', fe])
+            vector = None
+        post.append((vector, time.time() - start))
+    return post
+
+
+def _extractFeaturesInWorker(job):
+    '''
+    Extract features in a worker process from a job made by DataSet._extractInWorkers.
+    '''
+    source, extractorClasses = job
+    if source is None:
+        return []
+    sourceType, sourceData = source
+    if sourceType == 'path':
+        s = _parseDataPath(sourceData)
+    else:
+        from music21 import freezeThaw
+        st = freezeThaw.StreamThawer()
+        st.openStr(sourceData)
+        s = st.stream
+    return _extractFeatures(DataInstance(s), [fe() for fe in extractorClasses])
+
+
+def _getCacheColumnKey(fe):
+    '''
+    Return the key under which features from this extractor are cached.
+
+    >>> features.base._getCacheColumnKey(features.jSymbolic.ChangesOfMeterFeature())
+    'R35:ChangesOfMeterFeature:...'
+    '''
+    from music21 import base
+    return '%s:%s:%s' % (getattr(fe, 'id', ''), fe.__class__.__name__, 
+                         base.VERSION_STR)
+
+
+def _getCacheFilePath(dataInstance, cacheDirectory):
+    '''
+    Return the path of the feature cache file for a DataInstance added from a 
+    file path or corpus name, or None if it cannot be cached.
+    '''
+    if cacheDirectory is None or dataInstance.sourcePath is None:
+        return None
+    filePath = getattr(dataInstance.stream, 'filePath', None)
+    if filePath is None or not os.path.exists(filePath):
+        return None
+    sourceHash = hashlib.sha1()
+    with open(filePath, 'rb') as f:
+        sourceHash.update(f.read())
+    sourceHash.update(dataInstance.sourcePath.encode('utf-8'))
+    return os.path.join(cacheDirectory, sourceHash.hexdigest() + '.json')
+
+
+def _writeCacheFile(cacheFilePath, stored):
+    '''
+    Write the stored vectors of a DataInstance, leaving out any that are
+    not JSON-serializable.
+    '''
+    storable = {}
+    for key, vector in stored.items():
+        try:
+            json.dumps(vector)
+        except TypeError:
+            continue
+        storable[key] = vector
+    with open(cacheFilePath, 'w') as f:
+        json.dump(storable, f)
+
+
 def allFeaturesAsList(streamInput):
     '''
     returns a tuple containing ALL currentingly implemented feature extractors. The first
@@ -1307,10 +1694,10 @@ class Test(unittest.TestCase):
         self.assertEqual(len(di['parts'][0]['getElementsByClass.Measure']), 19)
         self.assertEqual(len(di['parts'][1]['getElementsByClass.Measure']), 19)
 
-        self.assertEqual(di['parts'][0]['pitchClassHistogram'], [9, 1, 11, 0, 9, 13, 0, 11, 0, 12, 5, 0])
+        self.assertEqual(di['parts'][0]['pitchClassHistogram'], (9, 1, 11, 0, 9, 13, 0, 11, 0, 12, 5, 0))
         # the sum of the two arrays is the pitch class histogram of the complete
         # work
-        self.assertEqual(di['pitchClassHistogram'], [47, 2, 25, 0, 25, 42, 0, 33, 0, 38, 22, 4])
+        self.assertEqual(di['pitchClassHistogram'], (47, 2, 25, 0, 25, 42, 0, 33, 0, 38, 22, 4))
 
 
     def testStreamFormsB(self):
@@ -1321,7 +1708,7 @@ class Test(unittest.TestCase):
         for p in ['c4', 'c4', 'd-4', 'd#4', 'f#4', 'a#4', 'd#5', 'a5']:
             s.append(note.Note(p))
         di = features.DataInstance(s)
-        self.assertEqual(di['midiIntervalHistogram'], [1, 1, 1, 1, 1, 1, 1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0])
+        self.assertEqual(di['midiIntervalHistogram'], (1, 1, 1, 1, 1, 1, 1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0))
 
 #         # in most cases will want to get a vector for each part
 #         s = corpus.parse('corelli/opus3no1/1grave')
@@ -1412,6 +1799,61 @@ class Test(unittest.TestCase):
 
 
 
+    def testDataSetOutputNumpy(self):
+        from music21 import features
+        featureExtractors = features.extractorsById(['ql1', 'ql2', 'ql4'], 'native')
+        ds = features.DataSet(classLabel='Composer')
+        ds.addFeatureExtractors(featureExtractors)
+        ds.addData('bwv66.6', classValue='Bach')
+        ds.addData('corelli/opus3no1/1grave', classValue='Corelli')
+        ds.process()
+        expected = [[3.0, 1.0, 1.5], [8.0, 0.5, 3.75]]
+
+        # read the .npy file without numpy
+        fp = ds.write(format='npy')
+        with open(fp, 'rb') as f:
+            contents = f.read()
+        os.remove(fp)
+        headerLength = struct.unpack('<H', contents[8:10])[0]
+        self.assertEqual((10 + headerLength) % 64, 0)
+        self.assertTrue(b"'shape': (2, 3)" in contents[10:10 + headerLength])
+        values = struct.unpack('<6d', contents[10 + headerLength:])
+        self.assertEqual([list(values[:3]), list(values[3:])], expected)
+
+        fp = ds.write(format='npz')
+        zf = zipfile.ZipFile(fp)
+        self.assertEqual(zf.read('features.npy'), contents)
+        classValues = zf.read('classValues.npy')
+        self.assertTrue(classValues.endswith(u'Bach\x00\x00\x00Corelli'.encode('utf-32-le')))
+        zf.close()
+
+        if 'numpy' not in _missingImport:
+            import numpy
+            loaded = numpy.load(fp)
+            self.assertEqual(loaded['features'].tolist(), expected)
+            self.assertEqual(list(loaded['ids']), ['bwv66.6', 'corelli/opus3no1/1grave'])
+            matrix, labels = ds.getFeaturesAsArray()
+            self.assertEqual(matrix.tolist(), expected)
+            self.assertEqual(labels, ds.getAttributeLabels(includeClassLabel=False, 
+                                                           includeId=False))
+        os.remove(fp)
+
+    def testDataSetProcessParallel(self):
+        from music21 import features
+        featureExtractors = features.extractorsById(['ql1', 'ql2', 'ql4', 'p20'])
+        dataSets = []
+        for unused_i in range(2):
+            ds = features.DataSet(classLabel='Composer')
+            ds.addFeatureExtractors(featureExtractors)
+            ds.addData('bwv66.6', classValue='Bach')
+            ds.addData(converter.parse('tinynotation: 4/4 c4 d e2'), classValue='x', id='x')
+            dataSets.append(ds)
+        dataSets[0].process()
+        dataSets[1].process(processes=2)
+        self.assertEqual(dataSets[0].getFeaturesAsList(), dataSets[1].getFeaturesAsList())
+        self.assertEqual(sorted(dataSets[1].extractorTimes.keys()),
+                         sorted(fe.__name__ for fe in featureExtractors))
+
     def testFeatureFail(self):
         from music21 import features
         from music21 import base
@@ -174,7 +174,7 @@ class DistanceBetweenMostCommonMelodicIntervalsFeature(
         '''Do processing necessary, storing result in _feature.
         '''
         # copy b/c will manipulate
-        histo = copy.deepcopy(self.data['midiIntervalHistogram'])
+        histo = list(self.data['midiIntervalHistogram'])
         maxValue = max(histo)
         maxIndex = histo.index(maxValue)
         histo[maxIndex] = 0 # set to zero
@@ -207,8 +207,7 @@ class MostCommonMelodicIntervalPrevalenceFeature(
     def _process(self):
         '''Do processing necessary, storing result in _feature.
         '''
-        # copy b/c will manipulate
-        histo = copy.deepcopy(self.data['midiIntervalHistogram'])
+        histo = self.data['midiIntervalHistogram']
         maxValue = max(histo)
         count = sum(histo)
         self._feature.vector[0] = maxValue / float(count)
@@ -238,7 +237,7 @@ class RelativeStrengthOfMostCommonIntervalsFeature(
         '''Do processing necessary, storing result in _feature.
         '''
         # copy b/c will manipulate
-        histo = copy.deepcopy(self.data['midiIntervalHistogram'])
+        histo = list(self.data['midiIntervalHistogram'])
         count = sum(histo)
         maxValue = max(histo)
         maxIndex = histo.index(maxValue)
@@ -781,7 +780,8 @@ class RelativeStrengthOfTopPitchesFeature(featuresModule.FeatureExtractor):
     def _process(self):
         '''Do processing necessary, storing result in _feature.
         '''
-        histo = copy.deepcopy(self.data['midiPitchHistogram'])
+        # copy b/c will edit
+        histo = list(self.data['midiPitchHistogram'])
         # if a tie this will return the first
         # if all zeros will return zero
         pIndexMax = histo.index(max(histo))
@@ -817,7 +817,7 @@ class RelativeStrengthOfTopPitchClassesFeature(featuresModule.FeatureExtractor):
         '''Do processing necessary, storing result in _feature.
         '''
         # copy b/c will edit
-        histo = copy.deepcopy(self.data['pitchClassHistogram'])
+        histo = list(self.data['pitchClassHistogram'])
         # if a tie this will return the first
         # if all zeros will return zero
         pIndexMax = histo.index(max(histo))
@@ -852,7 +852,8 @@ class IntervalBetweenStrongestPitchesFeature(featuresModule.FeatureExtractor):
     def _process(self):
         '''Do processing necessary, storing result in _feature.
         '''
-        histo = copy.deepcopy(self.data['midiPitchHistogram'])
+        # copy b/c will edit
+        histo = list(self.data['midiPitchHistogram'])
         # if a tie this will return the first
         # if all zeros will return zero
         pIndexMax = histo.index(max(histo))
@@ -888,7 +889,8 @@ class IntervalBetweenStrongestPitchClassesFeature(
     def _process(self):
         '''Do processing necessary, storing result in _feature.
         '''
-        histo = copy.deepcopy(self.data['pitchClassHistogram'])
+        # copy b/c will edit
+        histo = list(self.data['pitchClassHistogram'])
         # if a tie this will return the first
         # if all zeros will return zero
         pIndexMax = histo.index(max(histo))
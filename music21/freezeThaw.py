@@ -1241,6 +1241,8 @@ class JSONFreezer(JSONFreezeThawBase):
             '_classes',
             '_fullyQualifiedClasses',
             '_derivation',
+            '_groups',
+            '_sites',
             '_DOC_ATTR',
             '_DOC_ORDER',
             ]
@@ -1570,13 +1572,6 @@ class JSONFreezer(JSONFreezeThawBase):
                   }, 
                   "__class__": "music21.pitch.Accidental"
                 }, 
-                "_microtone": {
-                  "__attr__": {
-                    "_centShift": 0, 
-                    "_harmonicShift": 1
-                  }, 
-                  "__class__": "music21.pitch.Microtone"
-                }, 
                 "_octave": 5, 
                 "_step": "D"
               }, 
@@ -2487,6 +2487,18 @@ class PlotWindowedAnalysis(PlotStream):
         else:
             self.compressLegend = True
 
+        # window sizes may be analyzed in worker processes
+        if 'processes' in keywords:
+            self.processes = keywords['processes']
+        else:
+            self.processes = None
+
+        # a dict of results to reuse; see WindowedAnalysis.process
+        if 'resultCache' in keywords:
+            self.resultCache = keywords['resultCache']
+        else:
+            self.resultCache = None
+
         # create a color grid
         self.graph = GraphColorGrid(*args, **keywords)
         # uses self.processor
@@ -2513,7 +2525,8 @@ class PlotWindowedAnalysis(PlotStream):
         '''
         wa = windowed.WindowedAnalysis(self.streamObj, self.processor)
         unused_solutionMatrix, colorMatrix, metaMatrix = wa.process(self.minWindow, 
-            self.maxWindow, self.windowStep, windowType=self.windowType)
+            self.maxWindow, self.windowStep, windowType=self.windowType,
+            processes=self.processes, resultCache=self.resultCache)
                 
         # get dictionaries of meta data for each row
         pos = 0
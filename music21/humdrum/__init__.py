@@ -160,11 +160,13 @@ from music21.humdrum import spineParser
 from music21.humdrum import testFiles
 
 
-def parseFile(filename):
+def parseFile(filename, number=None):
     '''
     shortcut to :class:`~music21.humdrum.spineParser.HumdrumFile`.  Most users will call `converter.parse()` instead.
+
+    If `number` is given, only that piece of a multi-piece file is parsed.
     '''
-    return spineParser.HumdrumFile(filename)
+    return spineParser.HumdrumFile(filename, number=number)
 
 def parseData(data):
     '''
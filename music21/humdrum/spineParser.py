@@ -48,6 +48,8 @@ try:
 except:
     basestring = str # @ReservedAssignment
 
+import collections
+import locale
 import unittest
 import math
 import re
@@ -69,6 +71,7 @@ from music21 import common
 from music21 import exceptions21
 from music21.humdrum import testFiles #, canonicalOutput
 from music21.humdrum import instruments
+from music21.ext import six
 
 from music21 import environment
 _MOD = "humdrum.spineParser"
@@ -80,6 +83,24 @@ import os
 
 spinePathIndicators = ["*+", "*-", "*^", "*v", "*x", "*"]
 
+# lines beginning and ending a piece in a multi-piece file
+reOpusStart = re.compile(r'^(\*\*\w+\t)*\*\*\w+$')
+reOpusEnd = re.compile(r'^(\*\-\t)*\*\-$')
+reOpusStartBytes = re.compile(br'^(\*\*\w+\t)*\*\*\w+$')
+reOpusEndBytes = re.compile(br'^(\*\-\t)*\*\-$')
+
+# precompiled patterns for line and token parsing
+reSpineSeparator = re.compile('\t+')
+reReferenceExclaim = re.compile('^\!\!\!+')
+reGlobalCommentExclaim = re.compile('^\!\!+\s?')
+reExclusiveInterpretation = re.compile('\*\*(.*)')
+reKernNoteName = re.compile('([a-gA-G]+)')
+reKernSharp = re.compile('(\#+)')
+reKernFlat = re.compile('(\-+)')
+reKernRational = re.compile('(\d+)\%(\d+)')
+reKernNumber = re.compile('(\d+)')
+reMeasureNumber = re.compile('(\d+)([a-z]?)')
+
 
 class HumdrumDataCollection(object):
     '''
@@ -241,9 +262,9 @@ class HumdrumDataCollection(object):
         endPositions = []
         for i, line in enumerate(dataStream):
             l = line.rstrip()
-            if re.search('^(\*\-\t)*\*\-$', l):
+            if reOpusEnd.search(l):
                 endPositions.append(i)
-            elif re.search('^(\*\*\w+\t)*\*\*\w+$', l):
+            elif reOpusStart.search(l):
                 startPositions.append(i)
         if len(startPositions) < 2:
             return (False, None)
@@ -353,9 +374,9 @@ class HumdrumDataCollection(object):
             line = line.rstrip()
             if line == "":
                 continue # technically forbidden by Humdrum but the source of so many errors!
-            elif re.match('\!\!\!', line):
+            elif line.startswith('!!!'):
                 self.eventList.append(GlobalReferenceLine(self.parsePositionInStream, line))
-            elif re.match('\!\!', line): ## find global comments at the top of the line
+            elif line.startswith('!!'): ## find global comments at the top of the line
                 self.eventList.append(GlobalCommentLine(self.parsePositionInStream, line))
             else:
                 thisLine = SpineLine(self.parsePositionInStream, line)
@@ -433,56 +454,52 @@ class HumdrumDataCollection(object):
             self.parseEventListFromDataStream()
 
         ## we make two lists: one of ProtoSpines (vertical slices) and
-        ##    one of Events(horizontal slices)
-        returnProtoSpines = []
+        ##    one of Events(horizontal slices); both are filled in a single
+        ##    pass through the eventList, one line at a time.
+        maxSpines = self.maxSpines
+        protoSpineEventLists = [[] for j in range(maxSpines)]
         returnEventCollections = []
+        lastEventCollection = None
 
-        for j in range(0, self.maxSpines):
-            protoSpineEventList = []
-
-            for i in range(0, self.fileLength):
-                # get the currentEventCollection
-                if j == 0:
-                    thisEventCollection = EventCollection(self.maxSpines)
-                    returnEventCollections.append(thisEventCollection)
-                else:
-                    thisEventCollection = returnEventCollections[i]
-
-                # parse this cell
-                if self.eventList[i].isSpineLine is True:
-                    # not a global event
-                    if len(self.eventList[i].spineData) > j:
-                        ## are there actually this many spines at this point?
-                        ## thus, is there an event here? True
-                        thisEvent = SpineEvent(self.eventList[i].spineData[j])
-                        thisEvent.position = i
+        for i in range(0, self.fileLength):
+            thisLine = self.eventList[i]
+            thisEventCollection = EventCollection(maxSpines)
+            returnEventCollections.append(thisEventCollection)
+
+            if thisLine.isSpineLine is True:
+                # not a global event
+                spineData = thisLine.spineData
+                numSpines = len(spineData)
+                for j in range(0, maxSpines):
+                    if j < numSpines:
+                        ## there is an event in this tab position
+                        thisEvent = SpineEvent(spineData[j], i)
                         thisEvent.protoSpineId = j
                         if thisEvent.contents in spinePathIndicators:
                             thisEventCollection.spinePathData = True
 
-                        protoSpineEventList.append(thisEvent)
+                        protoSpineEventLists[j].append(thisEvent)
                         thisEventCollection.addSpineEvent(j, thisEvent)
-                        if thisEvent.contents == '.' and i > 0:
-                            lastEvent = returnEventCollections[i-1].events[j]
-                            if lastEvent is not None:
-                                thisEventCollection.addLastSpineEvent(j, returnEventCollections[i-1].getSpineOccurring(j))
+                        if thisEvent.contents == '.' and lastEventCollection is not None:
+                            if lastEventCollection.events[j] is not None:
+                                thisEventCollection.addLastSpineEvent(j,
+                                                lastEventCollection.getSpineOccurring(j))
                     else:  ## no data here
-                        thisEvent = SpineEvent(None)
-                        thisEvent.position = i
+                        thisEvent = SpineEvent(None, i)
                         thisEvent.protoSpineId = j
                         thisEventCollection.addSpineEvent(j, thisEvent)
-
-                        protoSpineEventList.append(None)
-                else:  ## Global event -- either GlobalCommentLine or GlobalReferenceLine
-                    if j == 0: ## adds to all spines but just runs the first time.
-                        thisEventCollection.addGlobalEvent(self.eventList[i])
-                    thisEvent = SpineEvent(None)
-                    thisEvent.position = i
+                        protoSpineEventLists[j].append(None)
+            else:  ## Global event -- either GlobalCommentLine or GlobalReferenceLine
+                thisEventCollection.addGlobalEvent(thisLine)
+                for j in range(0, maxSpines):
+                    thisEvent = SpineEvent(None, i)
                     thisEvent.protoSpineId = j
                     thisEventCollection.addSpineEvent(j, thisEvent)
-                    protoSpineEventList.append(None)
+                    protoSpineEventLists[j].append(None)
 
-            returnProtoSpines.append(ProtoSpine(protoSpineEventList))
+            lastEventCollection = thisEventCollection
+
+        returnProtoSpines = [ProtoSpine(eventList) for eventList in protoSpineEventLists]
 
         self.protoSpines = returnProtoSpines
         self.eventCollections = returnEventCollections
@@ -697,21 +714,136 @@ class HumdrumDataCollection(object):
 
     stream = property(_getStream)
 
+# file path : ((modification time, size), index)
+_workIndexCache = {}
+
+def getWorkIndex(filePath):
+    r'''
+    Return an OrderedDict mapping the number (starting at 1) of each piece 
+    in the Humdrum file at `filePath` to a (start, end) pair of byte offsets 
+    delimiting that piece in the file.  Pieces are divided just as in 
+    :meth:`~music21.humdrum.spineParser.HumdrumDataCollection.determineIfDataStreamIsOpus`;
+    a file with a single piece has a single entry.
+
+    The index is built by a single scan of the file and is cached; 
+    it is rebuilt only if the file is modified.
+
+    >>> import os, tempfile
+    >>> fp = os.path.join(tempfile.gettempdir(), 'm21-sanctus-index-test.krn')
+    >>> with open(fp, 'w') as f:
+    ...     unused = f.write(humdrum.testFiles.multipartSanctus)
+    >>> index = humdrum.spineParser.getWorkIndex(fp)
+    >>> list(index.keys())
+    [1, 2, 3]
+    >>> with open(fp, 'rb') as f:
+    ...     unused = f.seek(index[2][0])
+    ...     print(f.read(index[2][1] - index[2][0]).decode('ascii').splitlines()[0])
+    !! Pleni
+    >>> humdrum.spineParser.getWorkIndex(fp) is index
+    True
+    >>> os.remove(fp)
+    '''
+    fileStat = os.stat(filePath)
+    cacheKey = (fileStat.st_mtime, fileStat.st_size)
+    cached = _workIndexCache.get(filePath)
+    if cached is not None and cached[0] == cacheKey:
+        return cached[1]
+
+    startPositions = []
+    endPositions = []
+    lineOffsets = []
+    offset = 0
+    with open(filePath, 'rb') as f:
+        for line in f:
+            l = line.rstrip()
+            if reOpusEndBytes.search(l):
+                endPositions.append(len(lineOffsets))
+            elif reOpusStartBytes.search(l):
+                startPositions.append(len(lineOffsets))
+            lineOffsets.append(offset)
+            offset += len(line)
+    lineOffsets.append(offset) # end of file
+
+    index = collections.OrderedDict()
+    if len(startPositions) < 2:
+        index[1] = (0, offset)
+    else:
+        # divide as in determineIfDataStreamIsOpus: each piece ends 
+        # at a *- line; the last piece takes the rest of the file
+        if endPositions[-1] < startPositions[-1]:
+            endPositions.append(len(lineOffsets) - 1)
+        for i in range(len(endPositions)):
+            if i == 0:
+                start = 0
+            else:
+                start = lineOffsets[endPositions[i-1] + 1]
+            if i == len(endPositions) - 1:
+                end = offset
+            else:
+                end = lineOffsets[endPositions[i] + 1]
+            index[i + 1] = (start, end)
+
+    _workIndexCache[filePath] = (cacheKey, index)
+    return index
+
+
 class HumdrumFile(HumdrumDataCollection):
     '''
     A HumdrumFile is a HumdrumDataCollection which takes
     as a mandatory argument a filename to be opened and read.
+
+    If `number` is given and the file contains several pieces, only that 
+    piece (numbered from 1) is read from the file and parsed into a Score.
     '''
-    def __init__(self, filename = None):
+    def __init__(self, filename = None, number = None):
         self.dataStream = None
         self._storedStream = None
         if (filename is not None):
+            if number is not None:
+                self.eventList = self.parseWorkNumber(filename, number)
+                return
             try:
                 humFH = open(filename)
                 self.eventList = self.parseFH(humFH)
             except IOError:
                 raise
 
+    def parseWorkNumber(self, filename, number):
+        '''
+        Parse just the piece given by `number` from a multi-piece file, 
+        seeking to it with :func:`~music21.humdrum.spineParser.getWorkIndex`.
+
+        >>> mps = humdrum.testFiles.multipartSanctus
+        >>> import os, tempfile
+        >>> fp = os.path.join(tempfile.gettempdir(), 'm21-sanctus-test.krn')
+        >>> with open(fp, 'w') as f:
+        ...     unused = f.write(mps)
+        >>> hf = humdrum.spineParser.HumdrumFile(fp, number=2)
+        >>> hf.stream
+        <music21.stream.Score section_2>
+        >>> len(hf.stream.parts)
+        3
+        >>> os.remove(fp)
+        '''
+        index = getWorkIndex(filename)
+        try:
+            number = int(number)
+        except (ValueError, TypeError):
+            pass
+        if number not in index:
+            raise HumdrumException('cannot find piece number %s in %s' % (number, filename))
+        start, end = index[number]
+        with open(filename, 'rb') as f:
+            f.seek(start)
+            data = f.read(end - start)
+        if six.PY3:
+            data = data.decode(locale.getpreferredencoding(False))
+        self.dataStream = data.splitlines()
+        self.parseLines(self.dataStream)
+        if len(index) > 1:
+            self.stream.id = 'section_' + str(number)
+        return self.eventList
+
     def parseFH(self, fileHandle):
         '''
         parseFH takes a fileHandle and returns a HumdrumCollection
@@ -767,7 +899,7 @@ class SpineLine(HumdrumLine):
     def __init__(self, position = 0, contents = ""):
         self.position = position
         contents = contents.rstrip()
-        returnList = re.split("\t+", contents)
+        returnList = reSpineSeparator.split(contents)
         self.numSpines = len(returnList)
         self.contents = contents
         self.spineData = returnList
@@ -819,7 +951,7 @@ class GlobalReferenceLine(HumdrumLine):
 
     def __init__(self, position = 0, contents = "!!! NUL: None"):
         self.position = position
-        noExclaim = re.sub('^\!\!\!+','',contents)
+        noExclaim = reReferenceExclaim.sub('', contents)
         try:
             (code, value) = noExclaim.split(":", 1)
             value = value.strip()
@@ -867,7 +999,7 @@ class GlobalCommentLine(HumdrumLine):
 
     def __init__(self, position = 0, contents = ""):
         self.position = position
-        value = re.sub('^\!\!+\s?','',contents)
+        value = reGlobalCommentExclaim.sub('', contents)
         self.contents = contents
         self.value    = value
 
@@ -1014,7 +1146,7 @@ class HumdrumSpine(object):
             return self._spineType
         else:
             for thisEvent in self.eventList:
-                m1 = re.match("\*\*(.*)", thisEvent.contents)
+                m1 = reExclusiveInterpretation.match(thisEvent.contents)
                 if m1:
                     self._spineType = m1.group(1)
                     return self._spineType
@@ -1192,6 +1324,8 @@ class KernSpine(HumdrumSpine):
         inTuplet = False
         lastNote = None
         currentBeamNumbers = 0
+        # (Measure, Barline) pairs; see below
+        rightBarlines = []
 
         for event in self.eventList:
             # event is a SpineEvent object
@@ -1206,7 +1340,13 @@ class KernSpine(HumdrumSpine):
                     if tempObject is not None:
                         thisObject = tempObject
                 elif eventC.startswith('='):
-                    lastContainer  = hdStringToMeasure(eventC, lastContainer)
+                    # the barline is the right barline of the previous Measure;
+                    # setting it now would clear the caches of this spine's
+                    # stream for every Measure, so it is set after all events
+                    # are appended.
+                    thisMeasure, barline = _hdStringToMeasureAndBarline(eventC)
+                    rightBarlines.append((lastContainer, barline))
+                    lastContainer = thisMeasure
                     thisObject = lastContainer
                 elif eventC.startswith('!'):
                     thisObject = SpineComment(eventC)
@@ -1305,6 +1445,8 @@ class KernSpine(HumdrumSpine):
                 environLocal.printDebug("Traceback for the exeception: \n%s" % (tb))
                 # traceback... environLocal.printDebug()
 
+        for measure, barline in rightBarlines:
+            measure.rightBarline = barline
         self.stream._elementsChanged()
         ## still to be done later... move things before first measure to first measure!
 
@@ -1979,13 +2121,109 @@ def hdStringToNote(contents):
 
     '''
 
+    JRP = flavors['JRP']
+    # raises a HumdrumException (and caches nothing) if contents cannot be parsed
+    description = _kernNoteDescriptionCache.get((contents, JRP),
+                                    _kernNoteDescription, contents, JRP)
+
+    (step, octave, accidental, tieType, expressionNames, articulationNames,
+        stemDirection, durationInfo, grace, beamsInfo) = description
+
+    if step is None:
+        thisObject = note.Rest()
+    else:
+        thisObject = note.Note(octave = octave)
+        thisObject.step = step
+
+    if accidental is not None:
+        thisObject.accidental = accidental
+
+    if tieType is not None:
+        thisObject.tie = tie.Tie(tieType)
+
+    for expressionName in expressionNames:
+        if expressionName == 'ConnectedTurn':
+            t1 = expressions.Turn()
+            t1.connectedToPrevious = True  ## true by default, but explicitly
+            thisObject.expressions.append(t1)
+        else:
+            thisObject.expressions.append(getattr(expressions, expressionName)())
+
+    for articulationName in articulationNames:
+        thisObject.articulations.append(getattr(articulations, articulationName)())
+
+    if stemDirection is not None:
+        thisObject.stemDirection = stemDirection
+
+    if durationInfo is not None:
+        durationKind = durationInfo[0]
+        if durationKind == 'quarterLength':
+            unused_kind, quarterLength, dots = durationInfo
+            thisObject.duration.quarterLength = quarterLength
+            if dots:
+                thisObject.duration.dots = dots
+        elif durationKind == 'type':
+            unused_kind, durationType, dots = durationInfo
+            thisObject.duration.type = durationType
+            if dots:
+                thisObject.duration.dots = dots
+        else: # tuplet
+            (unused_kind, durationType, numberNotesActual, numberNotesNormal,
+                normalDots, dots) = durationInfo
+            thisObject.duration.type = durationType
+            newTup = duration.Tuplet()
+            newTup.durationActual.type = durationType
+            newTup.durationNormal.type = durationType
+            newTup.numberNotesActual = numberNotesActual
+            newTup.numberNotesNormal = numberNotesNormal
+            if normalDots:
+                newTup.durationNormal.dots = normalDots
+            thisObject.duration.appendTuplet(newTup)
+            if dots:
+                thisObject.duration.dots = dots
+            # call Duration.TupletFixer after to correct this.
+
+    # 3.2.9 Grace Notes and Groupettos
+    if grace == 'q':
+        thisObject = thisObject.getGrace()
+        thisObject.duration.type = 'eighth'
+    elif grace == 'Q':
+        thisObject = thisObject.getGrace()
+        thisObject.duration.slash = False
+        thisObject.duration.type = 'eighth'
+    elif grace == 'P':
+        thisObject = thisObject.getGrace(appogiatura=True)
+
+    # 3.2.10 Beaming
+    for beamType, beamDirection in beamsInfo:
+        thisObject.beams.append(beamType, beamDirection)
+
+    return thisObject
+
+# kern note strings already parsed by _kernNoteDescription
+_kernNoteDescriptionCache = common.TokenCache('humdrum.kernNote')
+
+def _kernNoteDescription(contents, JRP = False):
+    '''
+    Does the string parsing for :func:`~music21.humdrum.spineParser.hdStringToNote`
+    without creating any music21 objects, returning a tuple of
+    (step, octave, accidental, tieType, expressionNames, articulationNames,
+    stemDirection, durationInfo, grace, beamsInfo) which can be
+    safely cached and reused.  step is None for a rest.
+
+    >>> humdrum.spineParser._kernNoteDescription('8.ee-L')
+    ('e', 5, '-', None, (), (), None, ('type', 'eighth', 1), None, (('start', None),))
+    >>> humdrum.spineParser._kernNoteDescription('12r')
+    (None, None, None, None, (), (), None, ('tuplet', 'eighth', 3, 2, 0, 0), None, ())
+    '''
     # http://www.lib.virginia.edu/artsandmedia/dmmc/Music/Humdrum/kern_hlp.html#kern
 
     # 3.2.1 -- pitch
 
-    matchedNote = re.search("([a-gA-G]+)", contents)
+    matchedNote = reKernNoteName.search(contents)
 
-    thisObject = None
+    step = None
+    octave = None
     if matchedNote:
         kernNoteName = matchedNote.group(1)
         step = kernNoteName[0].lower()
@@ -1993,199 +2231,178 @@ def hdStringToNote(contents):
             octave = 3 + len(kernNoteName)
         else: # below middle C
             octave = 4 - len(kernNoteName)
-        thisObject = note.Note(octave = octave)
-        thisObject.step = step
 
     # 3.3 -- Rests
-    elif contents.count("r"):
-        thisObject = note.Rest()
+    elif 'r' in contents:
+        pass
     else:
         raise HumdrumException("Could not parse %s for note information" % contents)
 
-    matchedSharp = re.search("(\#+)", contents)
-    matchedFlat  = re.search("(\-+)", contents)
+    matchedSharp = reKernSharp.search(contents)
+    matchedFlat  = reKernFlat.search(contents)
 
+    accidental = None
     if matchedSharp:
-        thisObject.accidental = matchedSharp.group(0)
+        accidental = matchedSharp.group(0)
     elif matchedFlat:
-        thisObject.accidental = matchedFlat.group(0)
-    elif contents.count("n"):
-        thisObject.accidental = "n"
+        accidental = matchedFlat.group(0)
+    elif 'n' in contents:
+        accidental = "n"
 
     # 3.2.2 -- Slurs, Ties, Phrases
-    # TODO: add music21 phrase information
-    if contents.count('{'):
-        for i in range(0, contents.count('{')):
-            pass # phraseMark start
-    if contents.count('}'):
-        for i in range(0, contents.count('}')):
-            pass # phraseMark end
-    if contents.count('('):
-        for i in range(0, contents.count('(')):
-            pass # slur start
-    if contents.count(')'):
-        for i in range(0, contents.count(')')):
-            pass # slur end
-    if contents.count('['):
-        thisObject.tie = tie.Tie("start")
-    elif contents.count(']'):
-        thisObject.tie = tie.Tie("stop")
-    elif contents.count('_'):
-        thisObject.tie = tie.Tie("continue")
+    # TODO: add music21 phrase information and slurs: {} and ()
+    tieType = None
+    if '[' in contents:
+        tieType = "start"
+    elif ']' in contents:
+        tieType = "stop"
+    elif '_' in contents:
+        tieType = "continue"
 
     ## 3.2.3 Ornaments
-    if contents.count('t'):
-        thisObject.expressions.append(expressions.HalfStepTrill())
-    elif contents.count('T'):
-        thisObject.expressions.append(expressions.WholeStepTrill())
-
-    if contents.count('w'):
-        thisObject.expressions.append(expressions.HalfStepInvertedMordent())
-    elif contents.count('W'):
-        thisObject.expressions.append(expressions.WholeStepInvertedMordent())
-    elif contents.count('m'):
-        thisObject.expressions.append(expressions.HalfStepMordent())
-    elif contents.count('M'):
-        thisObject.expressions.append(expressions.WholeStepMordent())
-
-    if contents.count('S'):
-        thisObject.expressions.append(expressions.Turn())
-    elif contents.count('$'):
-        thisObject.expressions.append(expressions.InvertedTurn())
-    elif contents.count('R'):
-        t1 = expressions.Turn()
-        t1.connectedToPrevious = True  ## true by default, but explicitly
-        thisObject.expressions.append(t1)
-
-    if contents.count(':'):
-        ## TODO: deal with arpeggiation -- should have been in a
-        ##  chord structure
-        pass
-
-    if contents.count("O"):
-        thisObject.expressions.append(expressions.Ornament())
+    expressionNames = []
+    if 't' in contents:
+        expressionNames.append('HalfStepTrill')
+    elif 'T' in contents:
+        expressionNames.append('WholeStepTrill')
+
+    if 'w' in contents:
+        expressionNames.append('HalfStepInvertedMordent')
+    elif 'W' in contents:
+        expressionNames.append('WholeStepInvertedMordent')
+    elif 'm' in contents:
+        expressionNames.append('HalfStepMordent')
+    elif 'M' in contents:
+        expressionNames.append('WholeStepMordent')
+
+    if 'S' in contents:
+        expressionNames.append('Turn')
+    elif '$' in contents:
+        expressionNames.append('InvertedTurn')
+    elif 'R' in contents:
+        expressionNames.append('ConnectedTurn')
+
+    ## TODO: deal with arpeggiation (':') -- should have been in a
+    ##  chord structure
+
+    if "O" in contents:
+        expressionNames.append('Ornament')
         # generic ornament
 
     # 3.2.4 Articulation Marks
-    if contents.count('\''):
-        thisObject.articulations.append(articulations.Staccato())
-    if contents.count('"'):
-        thisObject.articulations.append(articulations.Pizzicato())
-    if contents.count('`'):
+    articulationNames = []
+    if '\'' in contents:
+        articulationNames.append('Staccato')
+    if '"' in contents:
+        articulationNames.append('Pizzicato')
+    if '`' in contents:
         # called 'attacca' mark but means staccatissimo:
         # http://www.music-cog.ohio-state.edu/Humdrum/representations/kern.rep.html
-        thisObject.articulations.append(articulations.Staccatissimo())
-    if contents.count('~'):
-        thisObject.articulations.append(articulations.Tenuto())
-    if contents.count('^'):
-        thisObject.articulations.append(articulations.Accent())
-    if contents.count(';'):
-        thisObject.expressions.append(expressions.Fermata())
-
+        articulationNames.append('Staccatissimo')
+    if '~' in contents:
+        articulationNames.append('Tenuto')
+    if '^' in contents:
+        articulationNames.append('Accent')
+    if ';' in contents:
+        expressionNames.append('Fermata')
 
     # 3.2.5 Up & Down Bows
-    if contents.count('v'):
-        thisObject.articulations.append(articulations.UpBow())
-    elif contents.count('u'):
-        thisObject.articulations.append(articulations.DownBow())
+    if 'v' in contents:
+        articulationNames.append('UpBow')
+    elif 'u' in contents:
+        articulationNames.append('DownBow')
 
     # 3.2.6 Stem Directions
-    if contents.count('/'):
-        thisObject.stemDirection = "up"
-    elif contents.count('\\'):
-        thisObject.stemDirection = "down"
+    stemDirection = None
+    if '/' in contents:
+        stemDirection = "up"
+    elif '\\' in contents:
+        stemDirection = "down"
 
     # 3.2.7 Duration +
     # 3.2.8 N-Tuplets
-
-    ## TODO: SPEEDUP -- only search for rational after foundNumber...
-    foundRational = re.search("(\d+)\%(\d+)", contents)
-    foundNumber = re.search("(\d+)", contents)
+    durationInfo = None
+    dots = contents.count('.')
+    foundNumber = reKernNumber.search(contents)
+    foundRational = None
+    if foundNumber:
+        foundRational = reKernRational.search(contents)
     if foundRational:
         durationFirst = int(foundRational.group(1))
         durationSecond = float(foundRational.group(2))
-        thisObject.duration.quarterLength = 4*durationSecond/durationFirst
-        if contents.count('.'):
-            thisObject.duration.dots = contents.count('.')
+        durationInfo = ('quarterLength', 4*durationSecond/durationFirst, dots)
 
     elif foundNumber:
         durationType = int(foundNumber.group(1))
         if durationType == 0:
             durationString = foundNumber.group(1)
             if durationString == '000': # for larger values, see http://wiki.humdrum.org/index.php/Rational_rhythms
-                thisObject.duration.type = 'maxima'
-                if contents.count('.'):
-                    thisObject.duration.dots = contents.count('.')
+                durationInfo = ('type', 'maxima', dots)
             elif durationString == '00': # for larger values, see http://wiki.humdrum.org/index.php/Rational_rhythms
-                thisObject.duration.type = 'longa'
-                if contents.count('.'):
-                    thisObject.duration.dots = contents.count('.')
+                durationInfo = ('type', 'longa', dots)
             else:
-                thisObject.duration.type = 'breve'
-                if contents.count('.'):
-                    thisObject.duration.dots = contents.count('.')
+                durationInfo = ('type', 'breve', dots)
         elif durationType in duration.typeFromNumDict:
-            thisObject.duration.type = duration.typeFromNumDict[durationType]
-            if contents.count('.'):
-                thisObject.duration.dots = contents.count('.')
+            durationInfo = ('type', duration.typeFromNumDict[durationType], dots)
         else:
             dT = int(durationType) + 0.0
             (unused_remainder, exponents) = math.modf(math.log(dT, 2))
             basevalue = 2**exponents
-            thisObject.duration.type = duration.typeFromNumDict[int(basevalue)]
-            newTup = duration.Tuplet()
-            newTup.durationActual.type = thisObject.duration.type
-            newTup.durationNormal.type = thisObject.duration.type
+            tupletType = duration.typeFromNumDict[int(basevalue)]
 
             gcd = common.euclidGCD(int(dT), basevalue)
-            newTup.numberNotesActual = int(dT/gcd)
-            newTup.numberNotesNormal = int(float(basevalue)/gcd)
+            numberNotesActual = int(dT/gcd)
+            numberNotesNormal = int(float(basevalue)/gcd)
 
             # The Josquin Research Project uses an incorrect definition of
-            # humdrum tuplets that breaks normal usage.  TODO: Refactor adding a Flavor = "JRP"
-            # code that uses this other method...
-            JRP = flavors['JRP']
-            if JRP is False and contents.count('.'):
-                newTup.durationNormal.dots = contents.count('.')
-
-            thisObject.duration.appendTuplet(newTup)
-            if JRP is True and contents.count('.'):
-                thisObject.duration.dots = contents.count('.')
-            # call Duration.TupletFixer after to correct this.
+            # humdrum tuplets that breaks normal usage.
+            if JRP is False:
+                durationInfo = ('tuplet', tupletType, numberNotesActual, numberNotesNormal,
+                                dots, 0)
+            else:
+                durationInfo = ('tuplet', tupletType, numberNotesActual, numberNotesNormal,
+                                0, dots)
 
     # 3.2.9 Grace Notes and Groupettos
-    if contents.count('q'):
-        thisObject = thisObject.getGrace()
-        thisObject.duration.type = 'eighth'
-    elif contents.count('Q'):
-        thisObject = thisObject.getGrace()
-        thisObject.duration.slash = False
-        thisObject.duration.type = 'eighth'
-    elif contents.count('P'):
-        thisObject = thisObject.getGrace(appogiatura=True)
-    elif contents.count('p'):
-        pass # end appogiatura duration -- not needed in music21...
+    grace = None
+    if 'q' in contents:
+        grace = 'q'
+    elif 'Q' in contents:
+        grace = 'Q'
+    elif 'P' in contents:
+        grace = 'P'
+    # 'p' ends appogiatura duration -- not needed in music21...
 
     # 3.2.10 Beaming
     # TODO: Support really complex beams
-    for i in range(0, contents.count('L')):
-        thisObject.beams.append('start')
-    for i in range(0, contents.count('J')):
-        thisObject.beams.append('stop')
-    for i in range(0, contents.count('k')):
-        thisObject.beams.append('partial', 'right')
-    for i in range(0, contents.count('K')):
-        thisObject.beams.append('partial', 'right')
+    beamsInfo = ((('start', None),) * contents.count('L') +
+                 (('stop', None),) * contents.count('J') +
+                 (('partial', 'right'),) * contents.count('k') +
+                 (('partial', 'right'),) * contents.count('K'))
 
-    return thisObject
+    return (step, octave, accidental, tieType, tuple(expressionNames),
+            tuple(articulationNames), stemDirection, durationInfo, grace, beamsInfo)
 
 def hdStringToMeasure(contents, previousMeasure = None):
     '''
     kern uses an equals sign followed by processing instructions to
     create new measures.  Here is how...
     '''
+    m1, barline = _hdStringToMeasureAndBarline(contents)
+    if previousMeasure is not None:
+        previousMeasure.rightBarline = barline
+    else:
+        m1.leftBarline = barline
+    return m1
+
+def _hdStringToMeasureAndBarline(contents):
+    '''
+    Does the work of :func:`~music21.humdrum.spineParser.hdStringToMeasure`,
+    returning the new Measure and the Barline without placing the Barline
+    in any Measure.
+    '''
     m1 = stream.Measure()
-    rematchMN = re.search("(\d+)([a-z]?)", contents)
+    rematchMN = reMeasureNumber.search(contents)
 
 
     if rematchMN:
@@ -2254,14 +2471,7 @@ def hdStringToMeasure(contents, previousMeasure = None):
     if contents.count(';'):
         barline.pause = expressions.Fermata()
 
-
-    if previousMeasure is not None:
-        previousMeasure.rightBarline = barline
-    else:
-        m1.leftBarline = barline
-
-
-    return m1
+    return m1, barline
 
 
 def kernTandemToObject(tandem):
@@ -90,6 +90,14 @@ semitonesAdjustPerfect = {"P":0, "A":1, "AA":2, "AAA":3, 'AAAA': 4,
 semitonesAdjustImperf = {"M":0, "m":-1, "A":1, "AA":2, "AAA":3, "AAAA": 4, 
                          "d":-2, "dd":-3, "ddd":-4, 'dddd': -5} #offset from Major
 
+# attributes computed by the GenericInterval, DiatonicInterval, and
+# ChromaticInterval constructors, keyed by the arguments they were computed
+# from; see _storeComputedAttributes()
+_genericIntervalAttributes = {}
+_diatonicIntervalAttributes = {}
+_chromaticIntervalAttributes = {}
+_music21ObjectAttributes = frozenset(base.Music21Object().__dict__)
+
 
 #-------------------------------------------------------------------------------
 class IntervalException(exceptions21.Music21Exception):
@@ -99,6 +107,24 @@ class IntervalException(exceptions21.Music21Exception):
 #-------------------------------------------------------------------------------
 # some utility functions
 
+def _storeComputedAttributes(cache, key, obj):
+    '''
+    Store in `cache` under `key` the attributes that the constructor of
+    `obj`, a GenericInterval, DiatonicInterval, or ChromaticInterval, computed
+    from its arguments. Another object made from the same arguments then
+    copies them instead of computing them again. All are numbers, strings,
+    or booleans; the GenericInterval of a DiatonicInterval is not stored.
+
+    >>> cache = {}
+    >>> interval._storeComputedAttributes(cache, 3, interval.GenericInterval(3))
+    >>> cache[3]['niceName']
+    'Third'
+    >>> 'activeSite' in cache[3] or '_sites' in cache[3]
+    False
+    '''
+    cache[key] = dict((k, v) for k, v in obj.__dict__.items()
+                      if k not in _music21ObjectAttributes and k != 'generic')
+
 
 
 def convertStaffDistanceToInterval(staffDist):
@@ -534,6 +560,10 @@ class GenericInterval(base.Music21Object):
         '23'
         '''
         base.Music21Object.__init__(self)
+        computed = _genericIntervalAttributes.get(value)
+        if computed is not None:
+            self.__dict__.update(computed)
+            return
 
         self.value = convertGeneric(value)
         self.directed = self.value
@@ -630,6 +660,7 @@ class GenericInterval(base.Music21Object):
             self.mod7 = self.mod7inversion  ## see chord.semitonesFromChordStep for usage...
         else:
             self.mod7 = self.simpleDirected
+        _storeComputedAttributes(_genericIntervalAttributes, value, self)
 
 
     def __repr__(self):
@@ -859,6 +890,12 @@ class DiatonicInterval(base.Music21Object):
             else:
                 raise IntervalException('incorrect generic argument: %s' % generic)
 
+        computedKey = (specifier, self.generic.directed)
+        computed = _diatonicIntervalAttributes.get(computedKey)
+        if computed is not None:
+            self.__dict__.update(computed)
+            return
+
         self.name = ""
         # translate strings, if provided, to integers
         # specifier here is the index number in the prefixSpecs list
@@ -927,6 +964,7 @@ class DiatonicInterval(base.Music21Object):
                 self.mod7 = self.mod7inversion
             else:
                 self.mod7 = self.simpleName
+        _storeComputedAttributes(_diatonicIntervalAttributes, computedKey, self)
 
     def __repr__(self):
         return "<music21.interval.DiatonicInterval %s>" % self.name
@@ -1110,6 +1148,10 @@ class ChromaticInterval(base.Music21Object):
 
         if value == int(value):
             value = int(value)
+            computed = _chromaticIntervalAttributes.get(value)
+            if computed is not None:
+                self.__dict__.update(computed)
+                return
 
         self.semitones = value
         self.cents = round(value * 100.0, 5)
@@ -1140,6 +1182,9 @@ class ChromaticInterval(base.Music21Object):
             self.isChromaticStep = False
 
         self.isStep = self.isChromaticStep
+        # microtonal intervals are not stored, as they are seldom repeated
+        if isinstance(value, int):
+            _storeComputedAttributes(_chromaticIntervalAttributes, value, self)
 
     def __repr__(self):
         return "<music21.interval.ChromaticInterval %s>" % self.directed
@@ -1941,15 +1986,14 @@ class Interval(base.Music21Object):
         pitch2.accidental = None
         pitch2.microtone = None
 
-        # have right note name but not accidental
-        interval2 = notesToInterval(pitch1, pitch2)
+        # have right note name but not accidental; no need to create an
+        # Interval between the two just to find how far apart they are
+        semitonesMoved = pitch2.ps - pitch1.ps
         # halfStepsToFix already has any microtones
         if not reverse:
-            halfStepsToFix = (self.chromatic.semitones -
-                          interval2.chromatic.semitones)
+            halfStepsToFix = (self.chromatic.semitones - semitonesMoved)
         else:
-            halfStepsToFix = (-self.chromatic.semitones -
-                          interval2.chromatic.semitones)
+            halfStepsToFix = (-self.chromatic.semitones - semitonesMoved)
 
         #environLocal.printDebug(['self', self, 'halfStepsToFix', halfStepsToFix, 'centsOrigin', centsOrigin, 'interval2', interval2])
 
@@ -2268,9 +2312,8 @@ def transposePitch(pitch1, interval1):
     pitch2.accidental = None
     # at this point note2 has the right note name (step), but possibly
     # the wrong accidental.  We fix that below
-    interval2 = notesToInterval(pitch1, pitch2)    
     halfStepsToFix = (interval1.chromatic.semitones -
-                      interval2.chromatic.semitones)
+                      (pitch2.ps - pitch1.ps))
     pitch2.accidental = halfStepsToFix
     
     if useImplicitOctave is True:
@@ -2821,6 +2864,45 @@ class Test(unittest.TestCase):
         directedNiceName = i.directedNiceName
         self.assertEqual(directedNiceName, "Descending Diminished Unison")
 
+    def testComputedAttributesShared(self):
+        from music21 import interval, pitch
+
+        # objects made from the same arguments are equal but separate
+        i1 = interval.Interval('M-10')
+        i2 = interval.Interval('M-10')
+        self.assertEqual(i1.directedNiceName, 'Descending Major Tenth')
+        self.assertEqual(i2.directedNiceName, 'Descending Major Tenth')
+        self.assertFalse(i1.diatonic is i2.diatonic)
+        self.assertFalse(i1.diatonic.generic is i2.diatonic.generic)
+        self.assertFalse(i1.chromatic is i2.chromatic)
+        i1.diatonic.niceName = 'changed'
+        self.assertEqual(interval.DiatonicInterval('M', -10).niceName, 'Major Tenth')
+
+        # a given GenericInterval is kept, not replaced by a stored one
+        g = interval.GenericInterval(-10)
+        d = interval.DiatonicInterval('M', g)
+        self.assertTrue(d.generic is g)
+        self.assertEqual(d.directedName, 'M-10')
+
+        # unisons depend on how the specifier was given
+        self.assertEqual(interval.DiatonicInterval('augmented', 1).direction,
+                         interval.ASCENDING)
+        self.assertEqual(interval.DiatonicInterval(interval.PERFECT, 1).direction,
+                         interval.OBLIQUE)
+
+        # microtonal ChromaticIntervals are computed each time
+        c = interval.ChromaticInterval(2.5)
+        self.assertEqual((c.semitones, c.cents, c.intervalClass), (2.5, 250.0, 2.5))
+        self.assertEqual(interval.ChromaticInterval(2.0).semitones, 2)
+
+        # transposition with the same Interval objects many times
+        i = interval.Interval('d-5')
+        for unused in range(3):
+            self.assertEqual(i.transposePitch(pitch.Pitch('C4')).nameWithOctave, 'F#3')
+            self.assertEqual(i.transposePitch(pitch.Pitch('G`4')).nameWithOctave, 'C~4')
+            self.assertEqual(interval.transposePitch(pitch.Pitch('E-'), 'A4').nameWithOctave,
+                             'A')
+
 #-------------------------------------------------------------------------------
 # define presented order in documentation
 _DOC_ORDER = [notesToChromatic, intervalsToDiatonic, 
@@ -330,6 +330,9 @@ class MetadataBundle(object):
     def __getitem__(self, i):
         return list(self._metadataEntries.values())[i]
 
+    def __iter__(self):
+        return iter(self._metadataEntries.values())
+
     def __gt__(self, metadataBundle):
         '''
         True when one metadata bundle is either a subset or an identical set to
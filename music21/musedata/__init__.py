@@ -260,7 +260,7 @@ class MuseDataRecord(object):
                 # are given with an acc parameter
                 p.accidental.displayStatus = False
             if acc is not None:
-                p._accidental = self._getAccidentalObject()
+                p.accidental = self._getAccidentalObject()
 
             if p.accidental is not None and self.hasCautionaryAccidental():
                 p.accidental.displayStatus = True
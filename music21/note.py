@@ -307,6 +307,14 @@ class GeneralNote(base.Music21Object):
     '''
     isChord = False
 
+    # the data of every note; other attributes still go in a __dict__
+    __slots__ = (
+        '_editorial',
+        'articulations',
+        'expressions',
+        'lyrics',
+        )
+
     # define order to present names in documentation; use strings
     _DOC_ORDER = ['duration', 'quarterLength']
     # documentation for all attributes (not properties or methods)
@@ -347,6 +355,36 @@ class GeneralNote(base.Music21Object):
         # note: Chords handle ties differently
         self.tie = None # store a Tie object
 
+    def _deepcopyNewInstance(self):
+        # every attribute set in __init__ is copied by __deepcopy__, so do
+        # not build a Duration (and a Pitch, Beams...) only to replace them
+        return self.__class__.__new__(self.__class__)
+
+    def __getstate__(self):
+        '''
+        Return the attributes in the __dict__ and the slots of this note, for
+        pickling and the JSON freezer.
+
+        >>> n = note.Note('E-4')
+        >>> n.lyric = 'la'
+        >>> state = n.__getstate__()
+        >>> (state['pitch'], state['lyrics'], 'tie' in state)
+        (<music21.pitch.Pitch E-4>, [<music21.note.Lyric number=1 syllabic=single text="la">], True)
+        '''
+        state = self.__dict__.copy()
+        for slot in common._getSlotNames(self.__class__):
+            if hasattr(self, slot):
+                state[slot] = getattr(self, slot)
+        return state
+
+    def __setstate__(self, state):
+        slots = common._getSlotNames(self.__class__)
+        for name, value in state.items():
+            if name in slots:
+                setattr(self, name, value)
+            else:
+                self.__dict__[name] = value
+
     #---------------------------------------------------------------------------
     def _getEditorial(self):
         if (self._editorial is None):
@@ -653,6 +691,15 @@ class NotRest(GeneralNote):
     `Unpitched` object for now.
     '''
 
+    __slots__ = (
+        '_notehead',
+        '_noteheadFill',
+        '_noteheadParenthesis',
+        '_stemDirection',
+        '_volume',
+        'beams',
+        )
+
     # unspecified means that there may be a stem, but its orientation
     # has not been declared.
     _DOC_ATTR = {
@@ -871,6 +918,11 @@ class Note(NotRest):
     isUnpitched = False
     isRest = False
 
+    __slots__ = (
+        'pitch',
+        'tie', # not in GeneralNote, as Chord has a tie property
+        )
+
     # define order to present names in documentation; use strings
     _DOC_ORDER = ['duration', 'quarterLength', 'nameWithOctave', 'pitchClass']
     # documentation for all attributes (not properties or methods)
@@ -989,11 +1041,20 @@ class Note(NotRest):
     #---------------------------------------------------------------------------
     # property access
 
+    def _unsharePitch(self):
+        '''
+        Give this Note its own copy of its Pitch if the Pitch is shared
+        with other Notes (see :meth:`~music21.stream.Stream.makeImmutable`),
+        before the Pitch is changed.
+        '''
+        if common.isInterned(self.pitch):
+            self.pitch = copy.deepcopy(self.pitch)
 
     def _getName(self):
         return self.pitch.name
 
     def _setName(self, value):
+        self._unsharePitch()
         self.pitch.name = value
 
     name = property(_getName, _setName,
@@ -1004,6 +1065,7 @@ class Note(NotRest):
     def _getNameWithOctave(self):
         return self.pitch.nameWithOctave
     def _setNameWithOctave(self, value):
+        self._unsharePitch()
         self.pitch.nameWithOctave = value
 
     nameWithOctave = property(_getNameWithOctave, _setNameWithOctave,
@@ -1034,6 +1096,7 @@ class Note(NotRest):
             accidental = pitch.Accidental(value)
         else:
             accidental = value
+        self._unsharePitch()
         self.pitch.accidental = accidental
 
 
@@ -1050,6 +1113,7 @@ class Note(NotRest):
         return self.pitch.step
 
     def _setStep(self, value):
+        self._unsharePitch()
         self.pitch.step = value
 
     step = property(_getStep, _setStep,
@@ -1060,6 +1124,7 @@ class Note(NotRest):
         return self.pitch.frequency
 
     def _setFrequency(self, value):
+        self._unsharePitch()
         self.pitch.frequency = value
 
     frequency = property(_getFrequency, _setFrequency,
@@ -1076,6 +1141,7 @@ class Note(NotRest):
         return self.pitch.octave
 
     def _setOctave(self, value):
+        self._unsharePitch()
         self.pitch.octave = value
 
     octave = property(_getOctave, _setOctave,
@@ -1096,6 +1162,7 @@ class Note(NotRest):
         return self.pitch.midi
 
     def _setMidi(self, value):
+        self._unsharePitch()
         self.pitch.midi = value
 
     midi = property(_getMidi, _setMidi,
@@ -1127,6 +1194,7 @@ class Note(NotRest):
         return self.pitch.ps
 
     def _setPs(self, value):
+        self._unsharePitch()
         self.pitch.ps = value
 
     ps = property(_getPs, _setPs,
@@ -1146,6 +1214,7 @@ class Note(NotRest):
         return self.pitch.microtone
 
     def _setMicrotone(self, value):
+        self._unsharePitch()
         self.pitch.microtone = value
 
     microtone = property(_getMicrotone, _setMicrotone,
@@ -1171,6 +1240,7 @@ class Note(NotRest):
         return self.pitch.pitchClass
 
     def _setPitchClass(self, value):
+        self._unsharePitch()
         self.pitch.pitchClass = value
 
     pitchClass = property(_getPitchClass, _setPitchClass,
@@ -1200,6 +1270,7 @@ class Note(NotRest):
         >>> d.pitchClass
         10
         '''
+        self._unsharePitch()
         self.pitch.pitchClassString = value
 
     pitchClassString = property(_getPitchClassString, _setPitchClassString,
@@ -1298,6 +1369,7 @@ class Note(NotRest):
 
         # use inPlace, b/c if we are inPlace, we operate on self;
         # if we are not inPlace, post is a copy
+        post._unsharePitch()
         post.pitch.transpose(intervalObj, inPlace=True)
 
         if not inPlace:
@@ -1965,6 +2037,32 @@ class Test(unittest.TestCase):
         self.assertEqual(n1Copy.volume.velocity, 100)
         self.assertEqual(n1Copy.volume.parent, n1Copy)
 
+    def testSlotsCopyAndPickle(self):
+        import pickle
+        from music21 import articulations, tie
+        n1 = Note('G#5', quarterLength=1.5)
+        n1.tie = tie.Tie('start')
+        n1.stemDirection = 'down'
+        n1.articulations.append(articulations.Staccato())
+        n1.lyric = 'la'
+        n1.editorial.comment.text = 'sic'
+        # attributes of notes are kept in slots, not in the __dict__
+        for name in ('pitch', 'tie', 'beams', 'lyrics', '_stemDirection'):
+            self.assertFalse(name in n1.__dict__)
+
+        for n2 in (copy.deepcopy(n1),
+                   pickle.loads(pickle.dumps(n1, protocol=-1)),
+                   pickle.loads(pickle.dumps(n1, protocol=0))):
+            self.assertEqual(n2.nameWithOctave, 'G#5')
+            self.assertFalse(n2.pitch is n1.pitch)
+            self.assertEqual(n2.quarterLength, 1.5)
+            self.assertEqual(n2.tie.type, 'start')
+            self.assertEqual(n2.stemDirection, 'down')
+            self.assertEqual(len(n2.articulations), 1)
+            self.assertEqual(n2.lyric, 'la')
+            self.assertEqual(n2.editorial.comment.text, 'sic')
+            self.assertEqual(sorted(n2.__dict__), sorted(n1.__dict__))
+
 #-------------------------------------------------------------------------------
 # define presented order in documentation
 _DOC_ORDER = [Note, Rest, SpacerRest, Unpitched, NotRest, GeneralNote, Lyric]
@@ -80,6 +80,14 @@ for i in (4, 3, 2, 1):
         if len(sym) == i:
             accidentalModifiersSorted.append(sym)
 
+# counts changes made to existing Accidental and Microtone objects; values
+# cached on a Pitch (ps, name, midi, etc.) are only used while it is unchanged
+_alterationChanges = 0
+
+def _alterationChanged():
+    global _alterationChanges
+    _alterationChanges += 1
+
 
 #-------------------------------------------------------------------------------
 # utility functions
@@ -519,6 +527,7 @@ class Microtone(SlottedObject):
     @harmonicShift.setter
     def harmonicShift(self, value):
         self._harmonicShift = value
+        _alterationChanged()
 
 
 class Accidental(SlottedObject):
@@ -762,6 +771,8 @@ class Accidental(SlottedObject):
         >>> a.alter
         -2.0
         '''
+        if self._name is not None: # not when called from __init__
+            _alterationChanged()
         if common.isStr(name):
             name = name.lower() # sometimes args get capitalized
         if name in ['natural', "n", 0]:
@@ -850,6 +861,7 @@ class Accidental(SlottedObject):
     def _setName(self, value):
         # can alternatively call set()
         self._name = value
+        _alterationChanged()
 
     name = property(_getName, _setName,
         doc = '''Get or set the name of the Accidental, like 'sharp' or 'double-flat'
@@ -861,6 +873,7 @@ class Accidental(SlottedObject):
     def _setAlter(self, value):
         # can alternatively call set()
         self._alter = value
+        _alterationChanged()
 
     alter = property(_getAlter, _setAlter,
         doc = '''Get or set the alter of the Accidental, or the semitone shift caused by the Accidental.'
@@ -872,6 +885,7 @@ class Accidental(SlottedObject):
     def _setModifier(self, value):
         # can alternatively call set()
         self._modifier = value
+        _alterationChanged()
 
     modifier = property(_getModifier, _setModifier,
         doc = '''Get or set the alter of the modifier, or the string representation.'
@@ -1005,7 +1019,7 @@ class Accidental(SlottedObject):
 
 
 #-------------------------------------------------------------------------------
-class Pitch(object):
+class Pitch(SlottedObject):
     '''
     A fundamental object that represents a single pitch.
 
@@ -1186,18 +1200,43 @@ class Pitch(object):
     Pitches used to be `Music21Object` subclasses, so they retain some of the attributes there
     such as .classes and .groups, but they don't have Duration or Sites objects
     '''
-    # define order to present names in documentation; use strings
-    _DOC_ORDER = ['name', 'nameWithOctave', 'step', 'pitchClass', 'octave', 'midi', 'german', 'french', 'spanish', 'italian','dutch']
+    # define order to present names in documentation; use strings
+    _DOC_ORDER = ['name', 'nameWithOctave', 'step', 'pitchClass', 'octave', 'midi', 'german', 'french', 'spanish', 'italian','dutch']
     # documentation for all attributes (not properties or methods)
     _DOC_ATTR = {
     }
 
+    ### CLASS VARIABLES ###
+
+    # '__dict__' is only created if something stores an attribute that is not
+    # listed here (as audioSearch does with .inputFrequency)
+    __slots__ = (
+        '__dict__',
+        '_accidental',
+        '_cacheGeneration',
+        '_cachedFrequency',
+        '_cachedMidi',
+        '_cachedName',
+        '_cachedNameWithOctave',
+        '_cachedPitchClass',
+        '_cachedPs',
+        '_defaultOctave',
+        '_groups',
+        '_microtone',
+        '_octave',
+        '_overridden_freq440',
+        '_step',
+        'fundamental',
+        'implicitAccidental',
+        )
+
     # constants shared by all classes
     _twelfth_root_of_two = TWELFTH_ROOT_OF_TWO
 
     def __init__(self, name=None, **keywords):
-        self.classes = [x.__name__ for x in self.__class__.mro()] 
-        self.groups = base.Groups()
+        self._groups = None # created when first used
+        # ps, name, midi, etc. are cached once computed; see _clearCachedValues()
+        self._cacheGeneration = None
 
         if isinstance(name, type(self)):
             name = name.nameWithOctave
@@ -1212,14 +1251,15 @@ class Pitch(object):
 
         # store an Accidental and Microtone objects
         # note that creating an Accidental objects is much more time consuming
-        # than a microtone
+        # than a microtone; a Microtone is created only when first used, and
+        # None is treated as a Microtone of zero cents
         self._accidental = None
-        self._microtone = Microtone()
+        self._microtone = None
 
         # CA, Q: should this remain an attribute or only refer to value in defaults?
         # MSC A: no, it's a useful attribute for cases such as scales where if there are
         #        no octaves we give a defaultOctave higher than the previous
-        self.defaultOctave = defaults.pitchOctave
+        self._defaultOctave = defaults.pitchOctave
         self._octave = None
 
         # if True, accidental is not known; is determined algorithmically
@@ -1267,12 +1307,42 @@ class Pitch(object):
             if 'ps' in keywords:
                 self.ps = keywords['ps']
 
+    def _getClasses(self):
+        return list(base._getClassInfo(self.__class__)[0])
+
+    def _getGroups(self):
+        if self._groups is None:
+            self._groups = base.Groups()
+        return self._groups
+
+    def _setGroups(self, groups):
+        self._groups = groups
+
+    groups = property(_getGroups, _setGroups,
+        doc='''
+        A :class:`~music21.base.Groups` object, created when first used.
+
+        >>> p = pitch.Pitch('D4')
+        >>> p.groups.append('cantus')
+        >>> p.groups
+        ['cantus']
+        ''')
+
+    classes = property(_getClasses,
+        doc='''
+        Returns a list of the names of the classes this Pitch belongs to,
+        as in :attr:`~music21.base.Music21Object.classes`.
+
+        >>> pitch.Pitch('C#4').classes
+        ['Pitch', 'SlottedObject', 'object']
+        ''')
+
     def __repr__(self):
         return '<music21.pitch.Pitch %s>' % self.__str__()
 
     def __str__(self):
         name = self.nameWithOctave
-        if self.microtone.cents != 0:
+        if self._microtone is not None and self._microtone.cents != 0:
             return name + self._microtone.__repr__()
         else:
             return name
@@ -1310,8 +1380,11 @@ class Pitch(object):
               hasattr(other, 'step') is False):
             return False
         elif (self.octave == other.octave and self.step == other.step and
-            self.accidental == other.accidental and self.microtone == other.microtone):
-            return True
+            self.accidental == other.accidental):
+            if (self._microtone is None and isinstance(other, Pitch) and
+                other._microtone is None):
+                return True # avoid creating Microtones to compare
+            return self.microtone == other.microtone
         else:
             return False
 
@@ -1330,6 +1403,75 @@ class Pitch(object):
     def __ne__(self, other):
         return not self.__eq__(other)
 
+    def __getstate__(self):
+        # cached values are checked against a count kept in this process only
+        state = SlottedObject.__getstate__(self)
+        state['_cacheGeneration'] = None
+        return state
+
+    def _internKey(self):
+        '''
+        Return a tuple of everything that describes this Pitch, including
+        how its accidental is displayed, for a
+        :class:`~music21.common.InternTable`; or None if this Pitch has
+        groups, a fundamental, an overridden frequency, or other attributes
+        of its own and so should not be shared.
+
+        >>> pitch.Pitch('C#4')._internKey() == pitch.Pitch('C#4')._internKey()
+        True
+        >>> pitch.Pitch('C#4')._internKey() == pitch.Pitch('D-4')._internKey()
+        False
+        >>> p = pitch.Pitch('C#4')
+        >>> p.accidental.displayStatus = True
+        >>> p._internKey() == pitch.Pitch('C#4')._internKey()
+        False
+        >>> p.groups.append('ossia')
+        >>> p._internKey() is None
+        True
+        '''
+        if (self._groups or self.fundamental is not None
+                or self._overridden_freq440 is not None or self.__dict__):
+            return None
+        a = self._accidental
+        if a is not None:
+            a = (a._name, a._alter, a._modifier, a._displayType,
+                 a._displayStatus, a.displayLocation, a.displaySize,
+                 a.displayStyle)
+        m = self._microtone
+        if m is not None:
+            m = (m._centShift, m._harmonicShift)
+        return (self._step, a, m, self._octave, self._defaultOctave,
+                self.implicitAccidental)
+
+    def _clearCachedValues(self):
+        '''
+        Forget the cached values of ps, name, nameWithOctave, midi,
+        pitchClass, and frequency, and start caching them again.
+
+        The cached values are forgotten whenever the step, accidental,
+        microtone, octave, or defaultOctave of the Pitch is set, and whenever
+        any Accidental or Microtone object is changed in place:
+
+        >>> p = pitch.Pitch('C#4')
+        >>> p.ps
+        61.0
+        >>> p.accidental.set('flat')
+        >>> p.ps
+        59.0
+        >>> p.name
+        'C-'
+        >>> p.accidental.alter = -2.0
+        >>> p.ps
+        58.0
+        '''
+        self._cachedFrequency = None
+        self._cachedMidi = None
+        self._cachedName = None
+        self._cachedNameWithOctave = None
+        self._cachedPitchClass = None
+        self._cachedPs = None
+        self._cacheGeneration = _alterationChanges
+
     def __lt__(self, other):
         '''Accepts enharmonic equivalence. Based entirely on pitch space
         representation.
@@ -1420,6 +1562,7 @@ class Pitch(object):
         return self._accidental
 
     def _setAccidental(self, value):
+        self._cacheGeneration = None
         if isinstance(value, basestring):
             self._accidental = Accidental(value)
         elif common.isNum(value):
@@ -1468,13 +1611,17 @@ class Pitch(object):
 
 
     def _getMicrotone(self):
+        # lazy Microtone creation
+        if self._microtone is None:
+            self._microtone = Microtone()
         return self._microtone
 
     def _setMicrotone(self, value):
+        self._cacheGeneration = None
         if (isinstance(value, basestring) or common.isNum(value)):
             self._microtone = Microtone(value)
-        elif value is None: # set to zero
-            self._microtone = Microtone(0)
+        elif value is None: # set to zero; created again when needed
+            self._microtone = None
         elif isinstance(value, Microtone):
             self._microtone = value
         else:
@@ -1533,7 +1680,7 @@ class Pitch(object):
         if self.accidental is not None:
             if not self.accidental.isTwelveTone():
                 return False
-        if self.microtone.cents != 0:
+        if self._microtone is not None and self._microtone.cents != 0:
             return False
         return True
 
@@ -1578,13 +1725,16 @@ class Pitch(object):
                 shift = 50
             elif self.accidental.name in ['half-flat', 'one-and-a-half-flat']:
                 shift = -50
-        return int(round(shift + self.microtone.cents))
+        if self._microtone is not None:
+            shift += self._microtone.cents
+        return int(round(shift))
 
     def _getAlter(self):
         post = 0
         if self.accidental is not None:
             post += self.accidental.alter
-        post += self.microtone.alter
+        if self._microtone is not None:
+            post += self._microtone.alter
         return post
 
     alter = property(_getAlter,
@@ -1726,12 +1876,17 @@ class Pitch(object):
         >>> pitch.Pitch('c`4')._getPs()
         59.5
         '''
+        if self._cacheGeneration != _alterationChanges:
+            self._clearCachedValues()
+        elif self._cachedPs is not None:
+            return self._cachedPs
         step = self._step.upper()
         ps = float(((self.implicitOctave + 1) * 12) + STEPREF[step])
-        if self.accidental is not None:
-            ps = ps + self.accidental.alter
-        if self.microtone is not None:
-            ps = ps + self.microtone.alter
+        if self._accidental is not None:
+            ps = ps + self._accidental._alter
+        if self._microtone is not None:
+            ps = ps + self._microtone.alter
+        self._cachedPs = ps
         return ps
 
     def _setPs(self, value):
@@ -1844,11 +1999,15 @@ class Pitch(object):
         '''
         see docs below, under property midi
         '''
+        ps = self._getPs() # also makes the cached values current
+        if self._cachedMidi is not None:
+            return self._cachedMidi
+
         def schoolYardRounding(x, d=0):
             p = 10 ** d
             return float(math.floor((x * p) + math.copysign(0.5, x)))/p
         
-        roundedPS = int(schoolYardRounding(self.ps))
+        roundedPS = int(schoolYardRounding(ps))
         if roundedPS > 127:
             value = (12 * 9) + (roundedPS % 12)
             if value < (127-12):
@@ -1857,6 +2016,7 @@ class Pitch(object):
             value = 0 + (roundedPS % 12)
         else:
             value = roundedPS
+        self._cachedMidi = value
         return value
 
     def getMidiPreCentShift(self):
@@ -1962,10 +2122,16 @@ class Pitch(object):
         >>> a.name
         'G#'
         '''
-        if self.accidental is not None:
-            return self.step + self.accidental.modifier
+        if self._cacheGeneration != _alterationChanges:
+            self._clearCachedValues()
+        elif self._cachedName is not None:
+            return self._cachedName
+        if self._accidental is not None:
+            name = self._step + self._accidental._modifier
         else:
-            return self.step
+            name = self._step
+        self._cachedName = name
+        return name
 
     def _setName(self, usrStr):
         '''
@@ -2053,10 +2219,13 @@ class Pitch(object):
     def _getNameWithOctave(self):
         '''Returns pitch name with octave
         '''
-        if self.octave is None:
-            return self.name
-        else:
-            return self.name + str(self.octave)
+        name = self._getName() # also makes the cached values current
+        if self._cachedNameWithOctave is not None:
+            return self._cachedNameWithOctave
+        if self._octave is not None:
+            name = name + str(self._octave)
+        self._cachedNameWithOctave = name
+        return name
 
     def _setNameWithOctave(self, value):
         '''
@@ -2146,7 +2315,7 @@ class Pitch(object):
         if self.octave is not None:
             name += ' in octave %s' % self.octave
 
-        if self.microtone.cents != 0:
+        if self._microtone is not None and self._microtone.cents != 0:
             name += ' ' + self._microtone.__repr__()
 
         return name
@@ -2185,6 +2354,7 @@ class Pitch(object):
         usrStr = usrStr.strip().upper()
         if len(usrStr) == 1 and usrStr in STEPNAMES:
             self._step = usrStr
+            self._cacheGeneration = None
         else:
             raise PitchException("Cannot make a step out of '%s'" % usrStr)
 
@@ -2237,7 +2407,10 @@ class Pitch(object):
             return self.step + str(self.octave)
 
     def _getPitchClass(self):
-        return int(round(self.ps % 12))
+        ps = self._getPs() # also makes the cached values current
+        if self._cachedPitchClass is None:
+            self._cachedPitchClass = int(round(ps % 12))
+        return self._cachedPitchClass
 
     def _setPitchClass(self, value):
         '''Set the pitchClass.
@@ -2257,6 +2430,7 @@ class Pitch(object):
         value = _convertPitchClassToNumber(value)
         # get step and accidental w/o octave
         self._step, self._accidental, self._microtone, unused_octShift = _convertPsToStep(value)
+        self._cacheGeneration = None
 
         # do not know what accidental is
         self.implicitAccidental = True
@@ -2337,6 +2511,7 @@ class Pitch(object):
             self._octave = int(value)
         else:
             self._octave = None
+        self._cacheGeneration = None
 
     octave = property(_getOctave, _setOctave, doc='''
         Returns or sets the octave of the note.
@@ -2366,11 +2541,35 @@ class Pitch(object):
         187.0
     ''')
 
+    def _getDefaultOctave(self):
+        return self._defaultOctave
+
+    def _setDefaultOctave(self, value):
+        self._defaultOctave = value
+        self._cacheGeneration = None
+
+    defaultOctave = property(_getDefaultOctave, _setDefaultOctave, doc='''
+        Returns or sets the octave used in place of
+        :attr:`~music21.pitch.Pitch.octave` when the octave is None.
+
+
+        >>> a = pitch.Pitch('g')
+        >>> a.ps
+        67.0
+        >>> a.defaultOctave = 5
+        >>> a.implicitOctave
+        5
+        >>> a.ps
+        79.0
+        >>> a.octave is None
+        True
+    ''')
+
     def _getImplicitOctave(self):
-        if self.octave is None:
-            return self.defaultOctave
+        if self._octave is None:
+            return self._defaultOctave
         else:
-            return self.octave
+            return self._octave
 
     implicitOctave = property(_getImplicitOctave, doc='''
     Returns the octave of the Pitch, or defaultOctave if
@@ -2745,8 +2944,10 @@ class Pitch(object):
             return self._overridden_freq440
         else:
             # works off of .ps values and thus will capture microtones
-            A4offset = self.ps - 69
-            return 440.0 * (self._twelfth_root_of_two ** A4offset)
+            A4offset = self._getPs() - 69 # also makes the cached values current
+            if self._cachedFrequency is None:
+                self._cachedFrequency = 440.0 * (self._twelfth_root_of_two ** A4offset)
+            return self._cachedFrequency
 
     def _setFreq440(self, value):
         post = 12 * (math.log(value/ 440.0) / math.log(2)) + 69
@@ -4781,6 +4982,62 @@ class Test(unittest.TestCase):
             pList.append(str(p))
         self.assertEqual(str(pList), "['A4', 'A~4(+21c)', 'B`4(-11c)', 'B4(+4c)', 'B~4(+17c)', 'C~5(-22c)', 'C#5(-14c)', 'C#~5(-7c)', 'C##5(-2c)', 'D~5(+1c)', 'E-5(+3c)', 'E`5(+3c)', 'E5(+2c)', 'E~5(-1c)', 'F5(-4c)', 'F~5(-9c)', 'F#5(-16c)', 'F#~5(-23c)', 'F#~5(+19c)', 'G5(+10c)', 'G~5(-1c)', 'G#5(-12c)', 'G#~5(-24c)', 'G#~5(+14c)']")
 
+    def testCachedValues(self):
+        import copy
+        import pickle
+        from music21 import pitch
+
+        def values(p):
+            return (p.ps, p.midi, p.pitchClass, p.name, p.nameWithOctave,
+                    round(p.frequency, 3))
+
+        p = pitch.Pitch('C#4')
+        self.assertEqual(values(p), (61.0, 61, 1, 'C#', 'C#4', 277.183))
+        p.step = 'D'
+        self.assertEqual(values(p), (63.0, 63, 3, 'D#', 'D#4', 311.127))
+        p.octave = 5
+        self.assertEqual(values(p), (75.0, 75, 3, 'D#', 'D#5', 622.254))
+        p.accidental = '-'
+        self.assertEqual(values(p), (73.0, 73, 1, 'D-', 'D-5', 554.365))
+        p.microtone = 50
+        self.assertEqual(values(p)[:3], (73.5, 74, 2))
+        p.microtone = None
+        p.octave = None
+        p.defaultOctave = 3
+        self.assertEqual(values(p), (49.0, 49, 1, 'D-', 'D-', 138.591))
+        p.ps = 62
+        self.assertEqual(values(p), (62.0, 62, 2, 'D', 'D4', 293.665))
+        p.midi = 70
+        self.assertEqual(values(p), (70.0, 70, 10, 'B-', 'B-4', 466.164))
+        p.name = 'E'
+        self.assertEqual(values(p), (64.0, 64, 4, 'E', 'E4', 329.628))
+        p.pitchClass = 9
+        self.assertEqual(values(p), (69.0, 69, 9, 'A', 'A4', 440.0))
+        p.nameWithOctave = 'F##2'
+        self.assertEqual(values(p), (43.0, 43, 7, 'F##', 'F##2', 97.999))
+
+        # changing an Accidental or Microtone in place
+        p.accidental.modifier = '#'
+        p.accidental.alter = 1.0
+        self.assertEqual(values(p), (42.0, 42, 6, 'F#', 'F#2', 92.499))
+        p.accidental.set('natural')
+        self.assertEqual(values(p), (41.0, 41, 5, 'F', 'F2', 87.307))
+        p.microtone.harmonicShift = 3
+        self.assertAlmostEqual(p.ps, 41 + p.microtone.alter)
+
+        # copies keep their own values
+        p = pitch.Pitch('E-4')
+        self.assertEqual(p.name, 'E-')
+        p2 = copy.deepcopy(p)
+        p2.octave = 6
+        self.assertEqual(p.nameWithOctave, 'E-4')
+        self.assertEqual(p2.nameWithOctave, 'E-6')
+        p3 = pickle.loads(pickle.dumps(p, protocol=-1))
+        self.assertEqual(values(p3), values(p))
+        p3.accidental.set('sharp')
+        self.assertEqual(p3.nameWithOctave, 'E#4')
+        self.assertEqual(p.nameWithOctave, 'E-4')
+
 
 #-------------------------------------------------------------------------------
 # define presented order in documentation
@@ -44,6 +44,10 @@ ENDWITHFLAT_RE = re.compile('[b\-]$')
 _scaleCache = {}
 _keyCache = {}
 
+# parsed figures, pitches, and scale degrees for each (figure, key, caseMatters);
+# new RomanNumeral objects copy from here instead of parsing again
+_figureCache = common.TokenCache('roman.figure')
+
 
 figureShorthands = {
     '53': '',
@@ -1157,8 +1161,16 @@ class RomanNumeral(harmony.Harmony):
         self._parsingComplete = False
         self.key = keyOrScale
 
-        harmony.Harmony.__init__(self, figure)
-        self._correctBracketedPitches()
+        cacheKey = self._getFigureCacheKey()
+        if cacheKey is None:
+            self._parseFigureAndPitches()
+        elif cacheKey in _figureCache: # copy from the cache
+            description = _figureCache.get(cacheKey, self._parseFigureDescription)
+            harmony.Harmony.__init__(self, None)
+            self._figure = figure
+            self._setFromFigureDescription(description)
+        else: # parse this RomanNumeral and store the description
+            _figureCache.get(cacheKey, self._parseFigureDescription)
         self._parsingComplete = True
         self._functionalityScore = None
         # It is sometimes helpful to know if this is the first chord after a
@@ -1174,6 +1186,147 @@ class RomanNumeral(harmony.Harmony):
             return '<music21.roman.RomanNumeral %s>' % (self.figure)
 
     ### PRIVATE METHODS ###
+    def _getFigureCacheKey(self):
+        '''
+        Return a key for storing this RomanNumeral's parsed figure and pitches 
+        in the module-level cache, or None if it should not be cached.  Only
+        string figures in a Key, a diatonic scale, or no key at all are cached,
+        and subclasses are not cached.
+
+        >>> roman.RomanNumeral('V7', key.Key('e'))._getFigureCacheKey()
+        ('V7', 'Key', 'E minor', True)
+        >>> roman.RomanNumeral('V7', scale.OctatonicScale('C'))._getFigureCacheKey() is None
+        True
+        '''
+        figure = self._figure
+        if not common.isStr(figure) or self.__class__ is not RomanNumeral:
+            return None
+        keyOrScale = self._scale
+        if keyOrScale is None:
+            return (figure, None, None, self.caseMatters)
+        keyClasses = keyOrScale.classes
+        if 'Key' in keyClasses or 'DiatonicScale' in keyClasses:
+            return (figure, keyOrScale.__class__.__name__, keyOrScale.name, 
+                    self.caseMatters)
+        return None
+
+    def _parseFigureAndPitches(self):
+        '''
+        Parse the figure and find the pitches without consulting the cache.
+        '''
+        harmony.Harmony.__init__(self, self._figure)
+        self._correctBracketedPitches()
+
+    def _parseFigureDescription(self, unused_cacheKey=None):
+        '''
+        Parse the figure and find the pitches, returning a tuple describing
+        the result for :meth:`~music21.roman.RomanNumeral._setFromFigureDescription`.
+        '''
+        keyImpliedScale = self.impliedScale
+        self._parseFigureAndPitches()
+
+        pitches = self.pitches
+        def pitchIndex(p):
+            for i, thisPitch in enumerate(pitches):
+                if thisPitch is p:
+                    return i
+            return None
+
+        if self.secondaryRomanNumeral is not None:
+            secondaryInfo = (self.secondaryRomanNumeral.figure, 
+                             copy.deepcopy(self.secondaryRomanNumeralKey))
+        else:
+            secondaryInfo = None
+        bracketedAlterations = self.bracketedAlterations
+        if bracketedAlterations is not None:
+            bracketedAlterations = tuple(bracketedAlterations)
+        # the implied scale made for the key is made again for each instance
+        if self.impliedScale is keyImpliedScale:
+            impliedScale = None
+        else: # changed by the figure, as for an augmented sixth in major
+            impliedScale = copy.deepcopy(self.impliedScale)
+        return (self.primaryFigure, secondaryInfo, tuple(self.omittedSteps), 
+                bracketedAlterations, self.frontAlterationString,
+                copy.deepcopy(self.frontAlterationTransposeInterval), 
+                copy.deepcopy(self.frontAlterationAccidental),
+                self.romanNumeralAlone, self.scaleDegree, self.impliedQuality,
+                impliedScale, self.useImpliedScale, self.figuresWritten, 
+                self.figuresNotationObj.notationColumn, self.scaleCardinality, tuple(copy.deepcopy(p) for p in pitches),
+                pitchIndex(self._root), pitchIndex(self._bass), self._inversion)
+
+    def _setFromFigureDescription(self, description):
+        '''
+        Set the attributes and pitches of this RomanNumeral from a
+        tuple returned by :meth:`~music21.roman.RomanNumeral._parseFigureDescription`,
+        copying anything that might be changed later.
+
+        >>> rn = roman.RomanNumeral('V65/V', 'e')
+        >>> rn2 = roman.RomanNumeral('V65/V', 'e') # copied from the cache
+        >>> rn2.pitches
+        (<music21.pitch.Pitch A#5>, <music21.pitch.Pitch C#6>, <music21.pitch.Pitch E6>, <music21.pitch.Pitch F#6>)
+        >>> rn2.pitches[0] is rn.pitches[0]
+        False
+        >>> rn2.secondaryRomanNumeral
+        <music21.roman.RomanNumeral V in e minor>
+        >>> rn2.secondaryRomanNumeral.key is rn2.key
+        True
+        >>> rn2.secondaryRomanNumeralKey
+        <music21.key.Key of B major>
+        >>> rn2.secondaryRomanNumeralKey is rn.secondaryRomanNumeralKey
+        False
+        >>> rn2.inversion()
+        1
+
+        Intervals, scales, and figured bass notations are copied as well:
+
+        >>> rn = roman.RomanNumeral('bII6', 'e')
+        >>> rn2 = roman.RomanNumeral('bII6', 'e')
+        >>> rn2.scaleOffset is rn.scaleOffset
+        False
+        >>> rn2.scaleOffset is rn2.frontAlterationTransposeInterval
+        True
+        >>> rn2.figuresNotationObj is rn.figuresNotationObj
+        False
+        >>> rn = roman.RomanNumeral('V7')
+        >>> rn2 = roman.RomanNumeral('V7')
+        >>> rn2.impliedScale is rn.impliedScale
+        False
+        '''
+        (self.primaryFigure, secondaryInfo, omittedSteps, bracketedAlterations, 
+            self.frontAlterationString, frontAlterationTransposeInterval,
+            frontAlterationAccidental, self.romanNumeralAlone, self.scaleDegree,
+            self.impliedQuality, impliedScale, self.useImpliedScale,
+            self.figuresWritten, notationColumn, self.scaleCardinality,
+            pitches, rootIndex, bassIndex, inversion) = description
+
+        if impliedScale is not None:
+            self.impliedScale = copy.deepcopy(impliedScale)
+        if secondaryInfo is not None:
+            secondaryFigure, secondaryKey = secondaryInfo
+            if self.useImpliedScale:
+                secondaryScale = self.impliedScale
+            else:
+                secondaryScale = self._scale
+            self.secondaryRomanNumeralKey = copy.deepcopy(secondaryKey)
+            self.secondaryRomanNumeral = RomanNumeral(secondaryFigure, 
+                                                      secondaryScale, self.caseMatters)
+        self.omittedSteps = list(omittedSteps)
+        if bracketedAlterations is not None:
+            self.bracketedAlterations = list(bracketedAlterations)
+        self.frontAlterationTransposeInterval = copy.deepcopy(
+            frontAlterationTransposeInterval)
+        self.frontAlterationAccidental = copy.deepcopy(frontAlterationAccidental)
+        self.figuresNotationObj = fbNotation.Notation(notationColumn)
+        self.scaleOffset = self.frontAlterationTransposeInterval
+
+        newPitches = [copy.deepcopy(p) for p in pitches]
+        self.pitches = newPitches
+        if rootIndex is not None:
+            self._root = newPitches[rootIndex]
+        if bassIndex is not None:
+            self._bass = newPitches[bassIndex]
+        self._inversion = inversion
+
     def _correctBracketedPitches(self):
         # correct bracketed figures
         if (self.bracketedAlterations is not None):
@@ -50,6 +50,9 @@ reRepeatStartAtom = re.compile('\|\|\:')
 reRepeatStopAtom = re.compile('\:\|\|')
 reNoChordAtom = re.compile('NC')
 
+# beat atoms already parsed by _getBeatFromSource
+_beatCache = common.TokenCache('romanText.beat')
+
 
 #-------------------------------------------------------------------------------
 
@@ -601,6 +604,46 @@ class RTNoChord(RTAtom):
         return '<RTNoChord %r>' % self.src
 
 
+def _getBeatFromSource(src):
+    '''
+    Given the source of a beat atom, return the beat as a number. 
+    Called by :meth:`~music21.romanText.RTBeat.getOffset`, which 
+    caches the results.
+
+    >>> romanText._getBeatFromSource('b2')
+    2
+    >>> romanText._getBeatFromSource('b1.5')
+    1.5
+    >>> romanText._getBeatFromSource('b2.66.5')
+    2.833...
+    '''
+    beatStr = src.replace('b', '')
+    # there may be more than one decimal in the number, such as
+    # 1.66.5, to show halfway through 2/3rd of a beat
+    if '.' in beatStr:
+        parts = beatStr.split('.')
+        if len(parts) == 2:
+            beat = int(parts[0]) + common.nearestCommonFraction(
+                                '.' + parts[1])
+        # assume not more than 2 decimals are given
+        elif len(parts) == 3:
+            if parts[1] == '66' and parts[2] == '5':
+                add = 5./6
+            elif parts[1] == '0' and parts[2] == '5':
+                add = 1./6
+            else: 
+                raise RTTokenException('cannot handle specification: %s' %  src)
+            beat = int(parts[0]) + add
+            # TODO: need to treat the third part as a fraction of the beat division that has just been specified
+            environLocal.printDebug(['discarding beat specification for beat indication: %s' % src])
+        else:
+            environLocal.printDebug(['got unexpected beat: %s' % src])
+            raise RTTokenException('cannot handle specification: %s' %  src)
+    else: # assume it is an integer
+        beat = int(beatStr)
+    return beat
+
+
 class RTBeat(RTAtom):
     r'''An RTAtom subclass that defines a beat definition.  Also contains a
     reference to the container.
@@ -641,30 +684,7 @@ class RTBeat(RTAtom):
         1.25
         '''
         from music21 import meter
-        beatStr = self.src.replace('b', '')
-        # there may be more than one decimal in the number, such as
-        # 1.66.5, to show halfway through 2/3rd of a beat
-        if '.' in beatStr:
-            parts = beatStr.split('.')
-            if len(parts) == 2:
-                beat = int(parts[0]) + common.nearestCommonFraction(
-                                    '.' + parts[1])
-            # assume not more than 2 decimals are given
-            elif len(parts) == 3:
-                if parts[1] == '66' and parts[2] == '5':
-                    add = 5./6
-                elif parts[1] == '0' and parts[2] == '5':
-                    add = 1./6
-                else: 
-                    raise RTTokenException('cannot handle specification: %s' %  self.src)
-                beat = int(parts[0]) + add
-                # TODO: need to treat the third part as a fraction of the beat division that has just been specified
-                environLocal.printDebug(['discarding beat specification for beat indication: %s' % self.src])
-            else:
-                environLocal.printDebug(['got unexpected beat: %s' % self.src])
-                raise RTTokenException('cannot handle specification: %s' %  self.src)
-        else: # assume it is an integer
-            beat = int(beatStr)
+        beat = _beatCache.get(self.src, _getBeatFromSource)
         #environLocal.printDebug(['using beat value:', beat])
         # TODO: check for exceptions/errors if this beat is bad
         try:
@@ -18,9 +18,10 @@ For searching a group of scores see the search functions within
 
 
 ### __init__.py ######
-__all__ = ['segment']
+__all__ = ['segment', 'ngram']
 
 from music21.search import segment
+from music21.search import ngram
 
 ### end __init__.py #####
 
@@ -431,6 +432,99 @@ def translateDiatonicStreamToString(inputStream, previousRest=False, previousTie
         joined = ''.join(b)
         return (joined, (previousRest, previousTie, previousQL))
 
+def translateIntervalsAndSpeeds(inputStream, returnIndices=False):
+    r'''
+    translates a stream of Notes (or Chords) into a transposition-invariant
+    string, one byte for each melodic motion from one note to the next, encoding
+    the interval in semitones (clamped to fifteen semitones up or down) and
+    whether the second note is the same speed, slower, or faster than the first.
+    
+    Rests and grace notes are skipped.  Tied notes count as one note, as long
+    as all of them together.  Chords are searched on their first pitch.
+    
+    Each motion gets one printable ASCII byte:
+    
+    !-? = motion to a note of the same length as the previous (unison is 0)
+    @-^ = motion to a note of longer length than the previous (unison is O)
+    _-} = motion to a note of shorter length than the previous (unison is n)
+    
+    >>> s = converter.parse("tinynotation: 4/4 c4 d8 e8 r4 c4")
+    >>> search.translateIntervalsAndSpeeds(s.flat.notesAndRests)
+    'p2K'
+    
+    Transposing the stream gives the same string:
+    
+    >>> sT = s.transpose(5)
+    >>> search.translateIntervalsAndSpeeds(sT.flat.notesAndRests)
+    'p2K'
+    
+    If returnIndices is True, returns a tuple of the string and a list of
+    the indices in inputStream of the first and the second note of each
+    motion, which can be used to find where a match begins:
+    
+    >>> dataString, indices = search.translateIntervalsAndSpeeds(
+    ...     s.flat.notesAndRests, returnIndices=True)
+    >>> indices
+    [(0, 1), (1, 2), (2, 4)]
+    
+    The motion from a tied note is found at the first note of the tie, and
+    the D, as long as a half note, is slower than the quarter notes around it:
+    
+    >>> s = converter.parse("tinynotation: 2/4 c4 d4~ d4 e4")
+    >>> search.translateIntervalsAndSpeeds(s.flat.notes, returnIndices=True)
+    ('Qp', [(0, 1), (1, 3)])
+    '''
+    # the index, pitch space, and quarterLength (of the whole tie) of each note
+    noteInfo = []
+    inTie = False
+    for i, n in enumerate(inputStream):
+        if n.isRest:
+            continue
+        ql = n.duration.quarterLength
+        if inTie is True:
+            noteInfo[-1][2] += ql
+            if n.tie is None or n.tie.type == 'stop':
+                inTie = False
+            continue
+        if ql == 0:
+            continue
+        if n.isChord:
+            if len(n.pitches) == 0:
+                continue
+            ps = n.pitches[0].ps
+        elif hasattr(n, 'pitch'):
+            ps = n.pitch.ps
+        else:
+            continue
+        noteInfo.append([i, ps, ql])
+        if n.tie is not None and n.tie.type != 'stop':
+            inTie = True
+
+    b = []
+    indexList = []
+    for j in range(1, len(noteInfo)):
+        previousIndex, previousPs, previousQL = noteInfo[j - 1]
+        i, ps, ql = noteInfo[j]
+        semitones = int(round(ps - previousPs))
+        if semitones > 15:
+            semitones = 15
+        elif semitones < -15:
+            semitones = -15
+        if previousQL == ql:
+            ascShift = 0
+        elif previousQL < ql:
+            ascShift = 31
+        else:
+            ascShift = 62
+        b.append(chr(48 + semitones + ascShift))
+        if returnIndices is True:
+            indexList.append((previousIndex, i))
+
+    if returnIndices is False:
+        return ''.join(b)
+    else:
+        return (''.join(b), indexList)
+
 def translateStreamToStringNoRhythm(inputStream):
     '''
     takes a stream of notesAndRests only and returns
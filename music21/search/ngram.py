@@ -0,0 +1,353 @@
+# -*- coding: utf-8 -*-
+#-------------------------------------------------------------------------------
+# Name:         search/ngram.py
+# Purpose:      music21 classes for indexed melodic searching across many scores
+#
+# Authors:      Michael Scott Cuthbert
+#
+# Copyright:    Copyright © 2026 Michael Scott Cuthbert and the music21 Project
+# License:      LGPL or BSD, see license.txt
+#-------------------------------------------------------------------------------
+'''
+An inverted index of melodic n-grams for quickly finding approximate matches
+to a short melody across a large number of scores.
+
+Each part of each indexed score is translated with
+:func:`~music21.search.translateIntervalsAndSpeeds` into a string of
+transposition-invariant bytes (one per melodic motion), and every substring of
+length `n` is recorded with the places where it occurs.  A query is translated
+the same way; only places that share at least one n-gram with the query are
+scored exactly (with the same matchers as :mod:`~music21.search.segment`),
+so a search does not need to look at every part of every score.
+
+An index can be written to disk as a .json file and read back later, so the
+(slow) parsing of the scores only needs to be done once.
+'''
+import bisect
+import difflib
+import heapq
+import json
+import os
+import unittest
+
+from music21 import common
+from music21 import converter
+from music21 import corpus
+from music21 import environment
+from music21 import exceptions21
+
+_MOD = 'search.ngram.py'
+environLocal = environment.Environment(_MOD)
+
+
+class NGramIndexException(exceptions21.Music21Exception):
+    pass
+
+
+class NGramIndex(object):
+    r'''
+    An index of the melodic n-grams of the parts of many streams.
+
+    >>> ngi = search.ngram.NGramIndex(n=4)
+    >>> ngi.addStream('bwv66.6', corpus.parse('bwv66.6'))
+    >>> ngi.addStream('bwv1.6', corpus.parse('bwv1.6'))
+    >>> ngi
+    <music21.search.ngram.NGramIndex n=4 {9 parts}>
+
+    Search for the first three measures of the bwv66.6 soprano, transposed up a
+    fourth, with one note changed:
+
+    >>> query = corpus.parse('bwv66.6').parts[0].measures(1, 3).transpose('P4')
+    >>> query.flat.notes[2].pitch.transpose('M2', inPlace=True)
+    >>> ngi.search(query, maxResults=3)
+    [('bwv66.6', 0, 1, 2, 0.833...)]
+
+    Each result is a tuple of the key of the score, the part number, the
+    measure number where the match begins, the position of the match in the
+    translated part, and the similarity (0 to 1) of the query to that place.
+    Places that share no n-grams with the query are never found, so there may
+    be fewer than `maxResults` results.
+
+    A query that is shorter than `n` motions cannot be searched:
+
+    >>> ngi.search(converter.parse("tinynotation: 4/4 c4 d e"))
+    Traceback (most recent call last):
+    NGramIndexException: a query needs at least 4 melodic motions; got 2
+    '''
+    def __init__(self, n=4):
+        self.n = n
+        self.documents = []
+        self._postings = {}
+
+    def __repr__(self):
+        return '<music21.search.ngram.NGramIndex n=%d {%d parts}>' % (
+            self.n, len(self.documents))
+
+    def __len__(self):
+        return len(self.documents)
+
+    def addStream(self, key, inputStream):
+        '''
+        Index each part of `inputStream` (or the stream itself, if it has no
+        parts) under `key`.
+
+        >>> ngi = search.ngram.NGramIndex()
+        >>> s = converter.parse("tinynotation: 2/4 c4 d e f g a b c'").makeMeasures()
+        >>> ngi.addStream('scale', s)
+        >>> ngi.documents[0]['key'], ngi.documents[0]['partNumber']
+        ('scale', 0)
+        >>> ngi.documents[0]['data']
+        '2212221'
+        >>> ngi.documents[0]['measureList']
+        [1, 1, 2, 2, 3, 3, 4]
+
+        A match is found at the measure of the first note of its first
+        motion, even if that note is tied into the next measure:
+
+        >>> s = converter.parse("tinynotation: 2/4 c4 d4~ d4 e4 f4 g4").makeMeasures()
+        >>> s.makeTies(inPlace=True)
+        >>> ngi.addStream('tied', s)
+        >>> ngi.documents[1]['measureList']
+        [1, 1, 2, 3]
+
+        Streams without measures are indexed with measure numbers of None.
+        '''
+        from music21 import search
+        if inputStream.hasPartLikeStreams():
+            parts = inputStream.parts
+        else:
+            parts = [inputStream]
+        for partNumber, p in enumerate(parts):
+            pFlat = p.flat
+            notes = list(pFlat.notes)
+            data, indices = search.translateIntervalsAndSpeeds(notes,
+                                                               returnIndices=True)
+            # a match is reported at the measure of the first note of its
+            # first motion; measures are found by offset, flattening once
+            measureOffsets = []
+            measureNumbers = []
+            for m in p.getElementsByClass('Measure'):
+                measureOffsets.append(m.getOffsetBySite(p))
+                measureNumbers.append(m.number)
+            measureList = []
+            for firstIndex, unused_secondIndex in indices:
+                mIndex = bisect.bisect_right(measureOffsets,
+                                             notes[firstIndex].getOffsetBySite(pFlat)) - 1
+                if mIndex < 0:
+                    measureList.append(None)
+                else:
+                    measureList.append(measureNumbers[mIndex])
+            self._addDocument({'key': key,
+                               'partNumber': partNumber,
+                               'data': data,
+                               'measureList': measureList,
+                               })
+
+    def addFilePaths(self, filePaths, giveUpdates=False):
+        '''
+        Parse and index each score in `filePaths` (paths relative to the corpus
+        or absolute paths), using the file name as the key, as
+        :func:`~music21.search.segment.indexScoreFilePaths` does.
+
+        >>> ngi = search.ngram.NGramIndex()
+        >>> ngi.addFilePaths(['bach/bwv66.6', 'bach/bwv1.6.mxl'])
+        >>> len(ngi)
+        9
+        >>> ngi.documents[0]['key']
+        'bwv66.6'
+        >>> ngi.documents[-1]['key']
+        'bwv1.6.mxl'
+        '''
+        totalScores = len(filePaths)
+        for scoreIndex, filePath in enumerate(filePaths):
+            shortfp = filePath.split(os.sep)[-1]
+            if giveUpdates is True:
+                print("Indexing %s (%d/%d)" % (shortfp, scoreIndex, totalScores))
+            try:
+                if not os.path.isabs(filePath):
+                    scoreObj = corpus.parse(filePath)
+                else:
+                    scoreObj = converter.parse(filePath)
+            except Exception: # pylint: disable=broad-except
+                print("Failed on parse for: %s" % filePath)
+                continue
+            self.addStream(shortfp, scoreObj)
+
+    def _addDocument(self, document):
+        docIndex = len(self.documents)
+        self.documents.append(document)
+        n = self.n
+        data = document['data']
+        postings = self._postings
+        for position in range(len(data) - n + 1):
+            gram = data[position:position + n]
+            if gram in postings:
+                postings[gram].append((docIndex, position))
+            else:
+                postings[gram] = [(docIndex, position)]
+
+    def search(self, query, maxResults=10, maxCandidates=None, forceDifflib=False):
+        '''
+        Return up to `maxResults` tuples of (key, partNumber, measureNumber,
+        position, similarity) for the places in the index most similar to
+        `query`, a Stream (or a string already translated with
+        :func:`~music21.search.translateIntervalsAndSpeeds`), sorted
+        from most to least similar.
+
+        Places are found by counting, for each alignment of the query against
+        an indexed part, the n-grams that they share; only the `maxCandidates`
+        alignments that share the most n-grams (by default, twenty times
+        `maxResults`) are compared exactly. Overlapping matches in the same
+        part are reported only once.
+
+        >>> ngi = search.ngram.NGramIndex(n=3)
+        >>> a = converter.parse("tinynotation: 4/4 c4 d e f g f e d c1").makeMeasures()
+        >>> ngi.addStream('a', a)
+        >>> b = converter.parse("tinynotation: 4/4 g4 a b- c' d' c' b- a g1").makeMeasures()
+        >>> ngi.addStream('b', b)
+        >>> ngi.documents[1]['data']
+        '2122../M'
+        >>> ngi.search('2212')
+        [('a', 0, 1, 0, 1.0), ('b', 0, 1, 0, 0.75)]
+        >>> ngi.search('2212', maxResults=1)
+        [('a', 0, 1, 0, 1.0)]
+
+        If `forceDifflib` is True then difflib is used for the exact comparison
+        even if pyLevenshtein is installed.
+        '''
+        from music21 import search
+        from music21.search import segment
+        if common.isStr(query):
+            queryData = query
+        else:
+            queryData = search.translateIntervalsAndSpeeds(query.flat.notes)
+        n = self.n
+        lenQuery = len(queryData)
+        if lenQuery < n:
+            raise NGramIndexException(
+                'a query needs at least %d melodic motions; got %d' % (n, lenQuery))
+        if maxCandidates is None:
+            maxCandidates = maxResults * 20
+
+        votes = {}
+        postings = self._postings
+        for queryPosition in range(lenQuery - n + 1):
+            gram = queryData[queryPosition:queryPosition + n]
+            for docIndex, position in postings.get(gram, ()):
+                alignment = (docIndex, position - queryPosition)
+                votes[alignment] = votes.get(alignment, 0) + 1
+
+        candidates = heapq.nsmallest(maxCandidates, votes,
+                                     key=lambda a: (-votes[a], a))
+        matcher = segment.getDifflibOrPyLev(queryData, forceDifflib=forceDifflib)
+        scored = []
+        for alignment in candidates:
+            docIndex, start = alignment
+            if start < 0:
+                start = 0
+            matcher.set_seq1(self.documents[docIndex]['data'][start:start + lenQuery])
+            scored.append((-matcher.ratio(), -votes[alignment], docIndex, start))
+        scored.sort()
+
+        results = []
+        found = {}
+        for negativeRatio, unused_votes, docIndex, start in scored:
+            previousStarts = found.setdefault(docIndex, [])
+            if any(abs(start - s) < lenQuery for s in previousStarts):
+                continue
+            previousStarts.append(start)
+            document = self.documents[docIndex]
+            results.append((document['key'],
+                            document['partNumber'],
+                            document['measureList'][start],
+                            start,
+                            -negativeRatio))
+            if len(results) >= maxResults:
+                break
+        return results
+
+    def write(self, filePath=None):
+        '''
+        Write the index to disk as a .json file (the n-gram postings are not
+        written; they are rebuilt by :meth:`read`).
+
+        Returns the filepath (if `filePath` is None, a temporary file is used).
+
+        >>> ngi = search.ngram.NGramIndex(n=3)
+        >>> a = converter.parse("tinynotation: 4/4 c4 d e f g f e d c1").makeMeasures()
+        >>> ngi.addStream('a', a)
+        >>> fp = ngi.write()
+        >>> ngi2 = search.ngram.NGramIndex().read(fp)
+        >>> ngi2
+        <music21.search.ngram.NGramIndex n=3 {1 parts}>
+        >>> ngi2.search('2212')
+        [('a', 0, 1, 0, 1.0)]
+        >>> import os
+        >>> os.remove(fp)
+        '''
+        if filePath is None:
+            filePath = environLocal.getTempFile('.json')
+        with open(filePath, 'w') as f:
+            json.dump({'n': self.n, 'documents': self.documents}, f)
+        return filePath
+
+    def read(self, filePath):
+        '''
+        Replace the contents of this index with the index written to `filePath`
+        by :meth:`write`.  Returns the index.
+        '''
+        with open(filePath) as f:
+            stored = json.load(f)
+        self.n = stored['n']
+        self.documents = []
+        self._postings = {}
+        for document in stored['documents']:
+            document['key'] = str(document['key'])
+            document['data'] = str(document['data'])
+            self._addDocument(document)
+        return self
+
+
+#-------------------------------------------------------------------------------
+class Test(unittest.TestCase):
+
+    def runTest(self):
+        pass
+
+    def testSearchMatchesLinearScan(self):
+        from music21 import search
+        ngi = NGramIndex(n=3)
+        for workName in ('bwv66.6', 'bwv1.6', 'bwv164.6'):
+            ngi.addStream(workName, corpus.parse(workName))
+        query = corpus.parse('bwv1.6').parts[2].measures(3, 5)
+        queryData = search.translateIntervalsAndSpeeds(query.flat.notes)
+        results = ngi.search(query, maxResults=1, forceDifflib=True)
+        self.assertEqual(results[0][0:3], ('bwv1.6', 2, 3))
+        self.assertEqual(results[0][4], 1.0)
+
+        # the best candidate must be as good as the best of all exact comparisons
+        best = 0.0
+        for document in ngi.documents:
+            data = document['data']
+            for start in range(max(1, len(data) - len(queryData) + 1)):
+                sm = difflib.SequenceMatcher(None, data[start:start + len(queryData)],
+                                             queryData)
+                best = max(best, sm.ratio())
+        self.assertEqual(best, results[0][4])
+
+        # transposition does not change the results
+        resultsT = ngi.search(query.transpose(3), maxResults=1, forceDifflib=True)
+        self.assertEqual(results, resultsT)
+
+
+#-------------------------------------------------------------------------------
+# define presented order in documentation
+_DOC_ORDER = [NGramIndex]
+
+
+if __name__ == "__main__":
+    import music21
+    music21.mainTest(Test)
+
+#------------------------------------------------------------------------------
+# eof
@@ -30,6 +30,7 @@ from music21 import environment
 
 _MOD = 'search.segment.py'
 environLocal = environment.Environment(_MOD)
+import collections
 import os
 import math
 import json
@@ -267,12 +268,16 @@ def scoreSimilarity(
     giveUpdates=False, 
     includeReverse=False,
     forceDifflib=False,
+    minimumSimilarity=0.0,
+    processes=1,
+    ratioCache=None,
     ):
     r'''
     Find the level of similarity between each pair of segments in a scoreDict.
     
-    This takes twice as long as it should because it does not cache the
-    pairwise similarity.
+    Returns a list of the results of :func:`iterateScoreSimilarity`; for large
+    scoreDicts, iterate over those results (or write them with
+    :func:`saveScoreSimilarity`) instead of holding them all in memory.
     
     ::
  
@@ -302,62 +307,282 @@ def scoreSimilarity(
         
     Return tuple.
     '''
-    similarityScores = []
-    scoreIndex = 0
-    totalScores = len(scoreDict)
+    return list(iterateScoreSimilarity(
+        scoreDict,
+        minimumLength=minimumLength,
+        giveUpdates=giveUpdates,
+        includeReverse=includeReverse,
+        forceDifflib=forceDifflib,
+        minimumSimilarity=minimumSimilarity,
+        processes=processes,
+        ratioCache=ratioCache,
+        ))
+
+
+def iterateScoreSimilarity(
+    scoreDict, 
+    minimumLength=20, 
+    giveUpdates=False, 
+    includeReverse=False,
+    forceDifflib=False,
+    minimumSimilarity=0.0,
+    processes=1,
+    ratioCache=None,
+    ):
+    r'''
+    A generator of the similarity tuples of :func:`scoreSimilarity`, for each
+    pair of segments (of at least `minimumLength`) in different scores of a
+    scoreDict, yielded in the same order.  All the comparisons of one score
+    with the scores after it are made before any of them is yielded.
+    
+    If `minimumSimilarity` is greater than 0, only pairs at least that similar
+    are yielded, and pairs whose lengths or whose counts of each symbol show
+    that they cannot be that similar are skipped without being compared.
+    
+    If `processes` is greater than 1, the comparisons of each score with the
+    scores after it are shared among that many worker processes; results are
+    yielded in the same order as with one process.
+    
+    Each ordered pair of segments is compared only once: the ratio is stored
+    in `ratioCache` (a new dict for each call, or each worker process, if None)
+    and reused wherever else the first segment is compared with the second.
+    The two segments in the other order are compared again, since difflib's
+    ratio can depend on the order.  Pass a dict to reuse the ratios across
+    calls with the same `forceDifflib`, or False to store nothing, which bounds
+    memory use on very large scoreDicts.  With more than one process, each
+    worker starts with a copy of the dict, and the ratios the workers find are
+    added to it as their results come back.
+    
+    >>> from collections import OrderedDict
+    >>> scoreDict = OrderedDict()
+    >>> scoreDict['a'] = [{'segmentList': ['ABCDEF', 'ABCXYZ'], 'measureList': [1, 3]}]
+    >>> scoreDict['b'] = [{'segmentList': ['ABCDEF', 'UVWXYZ'], 'measureList': [1, 4]}]
+    >>> for result in search.segment.iterateScoreSimilarity(scoreDict,
+    ...         minimumLength=6, minimumSimilarity=0.5, forceDifflib=True):
+    ...     result
+    ('a', 0, 0, 1, 'b', 0, 0, 1, 1.0)
+    ('a', 0, 1, 3, 'b', 0, 0, 1, 0.5)
+    ('a', 0, 1, 3, 'b', 0, 1, 4, 0.5)
+    
+    >>> results = search.segment.iterateScoreSimilarity(scoreDict,
+    ...     minimumLength=6, minimumSimilarity=0.5, forceDifflib=True, processes=2)
+    >>> len(list(results))
+    3
+    
+    The results do not depend on the cache or on the number of processes, even
+    where the ratio of two segments depends on which one is compared with the
+    other:
+    
+    >>> scoreDict = OrderedDict()
+    >>> scoreDict['a'] = [{'segmentList': ['BBCABAC'], 'measureList': [1]}]
+    >>> scoreDict['b'] = [{'segmentList': ['BBABCCA'], 'measureList': [1]}]
+    >>> scoreDict['c'] = [{'segmentList': ['BBCABAC'], 'measureList': [1]}]
+    >>> cached = list(search.segment.iterateScoreSimilarity(scoreDict,
+    ...     minimumLength=6, forceDifflib=True))
+    >>> [(result[0], result[4], round(result[-1], 3)) for result in cached]
+    [('a', 'b', 0.714), ('a', 'c', 1.0), ('b', 'c', 0.571)]
+    >>> uncached = list(search.segment.iterateScoreSimilarity(scoreDict,
+    ...     minimumLength=6, forceDifflib=True, ratioCache=False))
+    >>> cached == uncached
+    True
+    >>> cached == list(search.segment.iterateScoreSimilarity(scoreDict,
+    ...     minimumLength=6, forceDifflib=True, processes=2))
+    True
+
+    >>> ratioCache = {}
+    >>> results = list(search.segment.iterateScoreSimilarity(scoreDict,
+    ...     minimumLength=6, forceDifflib=True, processes=2, ratioCache=ratioCache))
+    >>> for cacheKey in sorted(ratioCache):
+    ...     cacheKey, round(ratioCache[cacheKey], 3)
+    (('BBABCCA', 'BBCABAC'), 0.571)
+    (('BBCABAC', 'BBABCCA'), 0.714)
+    (('BBCABAC', 'BBCABAC'), 1.0)
+    '''
     scoreDictKeys = list(scoreDict.keys())
-    for thisScoreNumber in range(totalScores):
-        thisScoreKey = scoreDictKeys[thisScoreNumber]
-        thisScore = scoreDict[thisScoreKey]
-        scoreIndex += 1 
-        if giveUpdates is True:
-            print("Comparing {0} ({1}/{2})".format(
-                thisScoreKey, scoreIndex, totalScores))
-        for pNum in range(len(thisScore)):
-            for segmentNumber, thisSegment in enumerate(thisScore[pNum]['segmentList']):
-                if len(thisSegment) < minimumLength:
-                    continue
-                thisMeasureNumber = thisScore[pNum]['measureList'][segmentNumber]
-                dl = getDifflibOrPyLev(thisSegment, forceDifflib = forceDifflib)
-                #dl = difflib.SequenceMatcher(None, '', thisSegment)
-                for thatScoreNumber in range(scoreIndex, totalScores):
-                    thatScoreKey = scoreDictKeys[thatScoreNumber]
-                    thatScore = scoreDict[thatScoreKey]
-                    for pNum2 in range(len(thatScore)):
-                        for thatSegmentNumber, thatSegment in enumerate(thatScore[pNum2]['segmentList']):
-                            if len(thatSegment) < minimumLength:
-                                continue
+    totalScores = len(scoreDictKeys)
+    compareArguments = (scoreDict, scoreDictKeys, minimumLength, includeReverse,
+                        forceDifflib, minimumSimilarity)
+    if processes is not None and processes > 1 and totalScores > 1:
+        import multiprocessing
+        pool = multiprocessing.Pool(processes=processes,
+                                    initializer=_initializeSimilarityWorker,
+                                    initargs=compareArguments + (ratioCache,))
+        try:
+            scoreResults = pool.imap(_compareScoreInWorker, range(totalScores))
+            for scoreIndex, (similarityScores, newRatios) in enumerate(scoreResults):
+                if newRatios:
+                    ratioCache.update(newRatios)
+                if giveUpdates is True:
+                    print("Compared {0} ({1}/{2})".format(
+                        scoreDictKeys[scoreIndex], scoreIndex + 1, totalScores))
+                for similarityTuple in similarityScores:
+                    yield similarityTuple
+        finally:
+            pool.terminate()
+            pool.join()
+    else:
+        if ratioCache is None:
+            ratioCache = {}
+        for thisScoreNumber in range(totalScores):
+            if giveUpdates is True:
+                print("Comparing {0} ({1}/{2})".format(
+                    scoreDictKeys[thisScoreNumber], thisScoreNumber + 1, totalScores))
+            for similarityTuple in _compareScoreToLaterScores(
+                    thisScoreNumber, ratioCache, *compareArguments):
+                yield similarityTuple
+
+
+def saveScoreSimilarity(similarityResults, filePath=None):
+    r'''
+    Write the tuples from :func:`iterateScoreSimilarity` (or
+    :func:`scoreSimilarity`) to a tab-separated text file as they are
+    produced, one tuple per line.
+
+    Returns the filepath (assumes you'll probably be using a temporary file)
+
+    >>> from collections import OrderedDict
+    >>> scoreDict = OrderedDict()
+    >>> scoreDict['a'] = [{'segmentList': ['ABCDEF'], 'measureList': [1]}]
+    >>> scoreDict['b'] = [{'segmentList': ['ABCXYZ'], 'measureList': [2]}]
+    >>> results = search.segment.iterateScoreSimilarity(scoreDict,
+    ...     minimumLength=6, forceDifflib=True)
+    >>> fp = search.segment.saveScoreSimilarity(results)
+    >>> with open(fp) as f:
+    ...     print(f.read().strip())
+    a   0   0   1   b   0   0   2   0.5
+    >>> import os
+    >>> os.remove(fp)
+    '''
+    if filePath is None:
+        filePath = environLocal.getTempFile('.txt')
+    with open(filePath, 'w') as f:
+        for similarityTuple in similarityResults:
+            f.write('\t'.join(repr(x) if isinstance(x, float) else str(x)
+                              for x in similarityTuple))
+            f.write('\n')
+    return filePath
+
+
+_similarityWorkerArguments = None
+# whether the ratios found are sent back to a ratioCache given by the caller
+_similarityWorkerReturnsRatios = False
+
+def _initializeSimilarityWorker(*compareArguments):
+    global _similarityWorkerArguments # pylint: disable=global-statement
+    global _similarityWorkerReturnsRatios # pylint: disable=global-statement
+    ratioCache = compareArguments[-1]
+    _similarityWorkerReturnsRatios = ratioCache is not None and ratioCache is not False
+    if ratioCache is None:
+        ratioCache = {}
+    _similarityWorkerArguments = (ratioCache,) + compareArguments[:-1]
+
+def _compareScoreInWorker(thisScoreNumber):
+    '''
+    Return the similarity tuples of one score and a dict of the ratios newly
+    stored in the ratioCache (or None if they are not sent back).
+    '''
+    if _similarityWorkerReturnsRatios:
+        newRatios = {}
+    else:
+        newRatios = None
+    similarityScores = _compareScoreToLaterScores(thisScoreNumber, 
+        *_similarityWorkerArguments, newRatios=newRatios)
+    return similarityScores, newRatios
+
+def _compareScoreToLaterScores(
+    thisScoreNumber,
+    ratioCache,
+    scoreDict,
+    scoreDictKeys,
+    minimumLength,
+    includeReverse,
+    forceDifflib,
+    minimumSimilarity,
+    newRatios=None,
+    ):
+    '''
+    Return a list of the similarity tuples of the segments of one score against
+    the segments of all the scores after it in scoreDictKeys.  Ratios stored
+    in the ratioCache are also stored in `newRatios`, if it is a dict.
+    '''
+    similarityScores = []
+    totalScores = len(scoreDictKeys)
+    thisScoreKey = scoreDictKeys[thisScoreNumber]
+    thisScore = scoreDict[thisScoreKey]
+    histograms = {}
+    
+    def histogram(segment):
+        if segment not in histograms:
+            histograms[segment] = collections.Counter(segment)
+        return histograms[segment]
+
+    for pNum in range(len(thisScore)):
+        for segmentNumber, thisSegment in enumerate(thisScore[pNum]['segmentList']):
+            lenThisSegment = len(thisSegment)
+            if lenThisSegment < minimumLength:
+                continue
+            thisMeasureNumber = thisScore[pNum]['measureList'][segmentNumber]
+            dl = None
+            for thatScoreNumber in range(thisScoreNumber + 1, totalScores):
+                thatScoreKey = scoreDictKeys[thatScoreNumber]
+                thatScore = scoreDict[thatScoreKey]
+                for pNum2 in range(len(thatScore)):
+                    for thatSegmentNumber, thatSegment in enumerate(
+                            thatScore[pNum2]['segmentList']):
+                        lenThatSegment = len(thatSegment)
+                        if lenThatSegment < minimumLength:
+                            continue
+                        ratio = None
+                        if ratioCache is not False:
+                            cacheKey = (thisSegment, thatSegment)
+                            ratio = ratioCache.get(cacheKey)
+                        if ratio is None:
+                            if minimumSimilarity > 0:
+                                # both difflib and Levenshtein ratios are at most
+                                # twice the common symbols over the total length
+                                totalLength = float(lenThisSegment + lenThatSegment)
+                                if (2 * min(lenThisSegment, lenThatSegment) / totalLength
+                                        < minimumSimilarity):
+                                    continue
+                                shared = histogram(thisSegment) & histogram(thatSegment)
+                                if 2 * sum(shared.values()) / totalLength < minimumSimilarity:
+                                    continue
+                            if dl is None:
+                                dl = getDifflibOrPyLev(thisSegment, forceDifflib=forceDifflib)
                             dl.set_seq1(thatSegment)
                             ratio = dl.ratio()
-                            thatMeasureNumber = thatScore[pNum2]['measureList'][thatSegmentNumber]
-                            similarityTuple = (
-                                thisScoreKey, 
-                                pNum, 
-                                segmentNumber, 
-                                thisMeasureNumber, 
+                            if ratioCache is not False:
+                                ratioCache[cacheKey] = ratio
+                                if newRatios is not None:
+                                    newRatios[cacheKey] = ratio
+                        if ratio < minimumSimilarity:
+                            continue
+                        thatMeasureNumber = thatScore[pNum2]['measureList'][thatSegmentNumber]
+                        similarityTuple = (
+                            thisScoreKey, 
+                            pNum, 
+                            segmentNumber, 
+                            thisMeasureNumber, 
+                            thatScoreKey, 
+                            pNum2, 
+                            thatSegmentNumber, 
+                            thatMeasureNumber, 
+                            ratio,
+                            )
+                        similarityScores.append(similarityTuple)
+                        if includeReverse is True:
+                            similarityTupleReversed = (
                                 thatScoreKey, 
                                 pNum2, 
                                 thatSegmentNumber, 
                                 thatMeasureNumber, 
+                                thisScoreKey, 
+                                pNum, 
+                                segmentNumber, 
+                                thisMeasureNumber, 
                                 ratio,
                                 )
-                            similarityScores.append(similarityTuple)
-                            if includeReverse is True:
-                                similarityTupleReversed = (
-                                    thatScoreKey, 
-                                    pNum2, 
-                                    thatSegmentNumber, 
-                                    thatMeasureNumber, 
-                                    thisScoreKey, 
-                                    pNum, 
-                                    segmentNumber, 
-                                    thisMeasureNumber, 
-                                    ratio,
-                                    )
-                                similarityScores.append(similarityTupleReversed)
-
-    #import pprint
-    #pprint.pprint(similarityScores)
+                            similarityScores.append(similarityTupleReversed)
     return similarityScores
     
 #-------------------------------------------------------------------------------
@@ -296,10 +296,11 @@ class Spanner(base.Music21Object):
                 #environLocal.printDebug(['creating parent reference'])
                 # keep a reference, not a deepcopy
                 setattr(new, name, self.activeSite)
-            elif name == 'sites':
-                newValue = copy.deepcopy(part, memo)
-                newValue.containedById = id(new)
-                setattr(new, name, newValue)
+            elif name == '_sites':
+                if part is not None: # otherwise created when needed
+                    newValue = copy.deepcopy(part, memo)
+                    newValue.containedById = id(new)
+                    setattr(new, name, newValue)
 
             # do not deepcopy spannerStorage, as this will copy the 
             # contained objects
@@ -1814,6 +1815,34 @@ class Test(unittest.TestCase):
         # spanners stored within are not the same objects
         self.assertEqual(id(sb2[0]) != id(sb1[0]), True)
 
+    def testDeepcopySpannerInNestedStreams(self):
+        from music21 import note, stream
+
+        # a slur across two measures, stored in the Part
+        p = stream.Part()
+        m1 = stream.Measure()
+        m2 = stream.Measure()
+        n1 = note.Note('C4', type='whole')
+        n2 = note.Note('D4', type='whole')
+        m1.append(n1)
+        m2.append(n2)
+        p.append([m1, m2])
+        su1 = Slur(n1, n2)
+        p.insert(0, su1)
+        s = stream.Score()
+        s.insert(0, p)
+
+        s2 = copy.deepcopy(s)
+        su2 = s2.parts[0].spanners[0]
+        self.assertFalse(su2 is su1)
+        n1Copy = s2.parts[0].getElementsByClass('Measure')[0].notes[0]
+        n2Copy = s2.parts[0].getElementsByClass('Measure')[1].notes[0]
+        self.assertEqual(su2.getSpannedElements(), [n1Copy, n2Copy])
+        self.assertEqual(n1Copy.getSpannerSites(), [su2])
+        # the original is unchanged
+        self.assertEqual(su1.getSpannedElements(), [n1, n2])
+        self.assertEqual(n1.getSpannerSites(), [su1])
+
 
 
     def testReplaceSpannedElement(self):
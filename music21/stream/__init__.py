@@ -20,6 +20,7 @@ as the :class:`~music21.stream.Measure`
 and :class:`~music21.stream.Score` objects, are defined in
 this module.
 '''
+import bisect
 import collections
 import copy
 import unittest
@@ -60,6 +61,9 @@ from music21 import environment
 _MOD = "stream.py"
 environLocal = environment.Environment(_MOD)
 
+# key placed in a deepcopy memo while a Stream is being copied
+_DEEPCOPY_SPANNER_MARKER = 'music21.stream.deepcopySpanners'
+
 #------------------------------------------------------------------------------
 # Metaclass
 _OffsetMap = collections.namedtuple('OffsetMap', ['element','offset', 'endTime', 'voiceIndex'])
@@ -166,6 +170,155 @@ class StreamIterator(object):
         return self.srcStream.__getitem__(key)
 
 
+class _ChordifyPieces(object):
+    '''
+    Used by Stream._chordifyTimespans: stands for a Note or Chord that
+    `sliceAtOffsets` would have cut at `cuts`, and makes what each piece
+    would have given to chordify without copying or splitting the element.
+
+    >>> n = note.Note('F#4', quarterLength=3)
+    >>> n.tie = tie.Tie('stop')
+    >>> n.articulations.append(articulations.Staccato())
+    >>> pieces = stream._ChordifyPieces(n, 0.0, 3.0, (0, 20, True, 0, 0, 0), ['alto'])
+    >>> pieces.setCuts([1.0, 2.0], addTies=True)
+    >>> pieces.pieceIndexAt(2.0), pieces.pieceIndexAt(1.5)
+    (2, None)
+    >>> for i in range(3):
+    ...     pieces.components(i, False, True)
+    [(<music21.pitch.Pitch F#4>, 'continue')]
+    [(<music21.pitch.Pitch F#4>, 'continue')]
+    [(<music21.pitch.Pitch F#4>, 'stop')]
+    >>> pieces.components(1, False, True)[0][0].accidental.displayStatus
+    False
+    >>> pieces.components(1, False, True)[0][0].groups
+    ['alto']
+    >>> pieces.articulations(0), pieces.articulations(1)
+    ([<music21.articulations.Staccato>], [])
+    '''
+    def __init__(self, element, start, end, sortKey, groups, inVoice=False):
+        self.element = element
+        self.start = start
+        self.end = end
+        self._sortKey = sortKey
+        # groups the pieces have; the first piece of a note in a Voice
+        # does not get groups[-1], the part id, as it stays in the Voice
+        self.groups = groups
+        self.inVoice = inVoice
+        self.cuts = []
+        self._cutIndices = {}
+        self._tieTypes = None
+        self._expressions = None
+
+    def setCuts(self, cuts, addTies=True):
+        '''
+        Set the sorted offsets inside the element where it is cut, and work
+        out the tie type of each component in each piece the way
+        `splitAtQuarterLength` would.
+        '''
+        self.cuts = cuts
+        self._cutIndices = dict((o, i + 1) for i, o in enumerate(cuts))
+        if self.element.isChord:
+            components = self.element._notes
+        else:
+            components = [self.element]
+        self._tieTypes = []
+        for comp in components:
+            tieType = None
+            if comp.tie is not None:
+                tieType = comp.tie.type
+            tieTypes = []
+            for unused in cuts:
+                if not addTies:
+                    tieTypes.append(tieType)
+                    continue
+                if tieType is None:
+                    tieTypes.append('start')
+                elif tieType == 'stop':
+                    tieTypes.append('continue')
+                else:
+                    tieTypes.append(tieType)
+                if tieType in ('start', 'continue'):
+                    tieType = 'continue'
+                else:
+                    tieType = 'stop'
+            tieTypes.append(tieType)
+            self._tieTypes.append(tieTypes)
+
+    def pieceIndexAt(self, offset):
+        '''
+        Return the index of the piece starting at `offset`, or None
+        if no piece starts there.
+        '''
+        if offset == self.start:
+            return 0
+        return self._cutIndices.get(offset)
+
+    def sortKey(self, pieceIndex):
+        '''
+        Return a key that puts the pieces starting at the same offset in
+        the order a flat Stream of the sliced Parts has them: by priority,
+        class and grace, then Part, then original notes before inserted
+        pieces.
+        '''
+        return self._sortKey[:-1] + (pieceIndex > 0, self._sortKey[-1])
+
+    def components(self, pieceIndex, displayTiedAccidentals=False,
+        transferGroups=False):
+        '''
+        Return a list of (Pitch, tie type or None) pairs, one for each
+        component of the piece.  The pitches are new copies.
+        '''
+        if self.element.isChord:
+            components = self.element._notes
+        else:
+            components = [self.element]
+        groups = self.groups
+        if self.inVoice and pieceIndex == 0:
+            groups = groups[:-1]
+        post = []
+        for comp, tieTypes in zip(components, self._tieTypes):
+            p = copy.deepcopy(comp.pitch)
+            if (pieceIndex > 0 and not self.element.isChord and
+                    p.accidental is not None):
+                if not displayTiedAccidentals:
+                    if p.accidental.displayType not in ['even-tied']:
+                        p.accidental.displayStatus = False
+                else:
+                    p.accidental.displayType = 'even-tied'
+                    p.accidental.displayStatus = True
+            if transferGroups:
+                for g in groups:
+                    p.groups.append(g)
+            post.append((p, tieTypes[pieceIndex]))
+        return post
+
+    def articulations(self, pieceIndex):
+        '''
+        Only the first piece keeps the articulations.
+        '''
+        if pieceIndex > 0:
+            return []
+        return copy.deepcopy(self.element.articulations)
+
+    def expressions(self, pieceIndex):
+        '''
+        Expressions go to the first piece, the last piece, or all of
+        them, depending on their `tieAttach`.  The pieces share copies.
+        '''
+        if self._expressions is None:
+            self._expressions = copy.deepcopy(self.element.expressions)
+        if len(self.cuts) == 0:
+            skip = ()
+        elif pieceIndex == 0:
+            skip = ('last',)
+        elif pieceIndex == len(self.cuts):
+            skip = ('first',)
+        else:
+            skip = ('first', 'last')
+        return [x for x in self._expressions
+            if getattr(x, 'tieAttach', 'all') not in skip]
+
+
 #------------------------------------------------------------------------------
 
 
@@ -314,6 +467,9 @@ class Stream(base.Music21Object):
 
         # experimental
         self._mutable = True
+        # InternTables of the pitches and durations shared by the Notes
+        # within this Stream; see makeImmutable()
+        self._sharedPitchesAndDurations = None
 
         # when deriving a flat stream, store a reference to the non-flat Stream
         # from which this was taken
@@ -784,11 +940,12 @@ class Stream(base.Music21Object):
         False
         '''
         #environLocal.printDebug(['calling hasElementOfClass()', className])
+        classSet = base.classFilterSet(className)
         for e in self._elements:
-            if e.isClassOrSubclass([className]):
+            if e.isClassOrSubclass(classSet):
                 return True
         for e in self._endElements:
-            if e.isClassOrSubclass([className]):
+            if e.isClassOrSubclass(classSet):
                 return True
         return False
 
@@ -843,6 +1000,8 @@ class Stream(base.Music21Object):
         >>> s1[1] is s2[1]
         True
         '''
+        if classFilterList is not None:
+            classFilterList = base.classFilterSet(classFilterList)
         for e in other._elements:
             #self.insert(other.offset, e)
             if classFilterList is not None:
@@ -1123,8 +1282,7 @@ class Stream(base.Music21Object):
         >>> len(s.notes)
         0
         '''
-        if not common.isListLike(classFilterList):
-            classFilterList = [classFilterList]
+        classFilterList = base.classFilterSet(classFilterList)
         # process main elements
         indexList = []
         count = 0
@@ -1161,8 +1319,7 @@ class Stream(base.Music21Object):
         
 
         '''
-        if not common.isListLike(classFilterList):
-            classFilterList = [classFilterList]
+        classFilterList = base.classFilterSet(classFilterList)
         # process main elements
         indexList = []
         count = 0
@@ -1199,6 +1356,27 @@ class Stream(base.Music21Object):
         # NOTE: this is a performance critical operation
 
         #environLocal.printDebug(['Stream calling __deepcopy__', self])
+        if memo is None:
+            memo = {}
+        # spanners are relinked once, by the outermost Stream being copied;
+        # Streams copied within it share its memo and leave them alone
+        isOutermostCopy = _DEEPCOPY_SPANNER_MARKER not in memo
+        if isOutermostCopy:
+            memo[_DEEPCOPY_SPANNER_MARKER] = True
+        try:
+            new = self._deepcopyAttributes(memo)
+        finally:
+            if isOutermostCopy:
+                del memo[_DEEPCOPY_SPANNER_MARKER]
+        if isOutermostCopy:
+            self._deepcopyRelinkSpanners(new)
+        return new
+
+    def _deepcopyAttributes(self, memo):
+        '''
+        Make the new Stream for __deepcopy__, copying its attributes and
+        elements but leaving spanners pointing to the original elements.
+        '''
         new = self.__class__()
         old = self
         for name in self.__dict__:
@@ -1215,11 +1393,12 @@ class Stream(base.Music21Object):
                 # do not use property: .activeSite; set to same weakref obj
                 setattr(new, name, self._activeSite)
             # attributes that require special handling
-            elif name == 'sites':
-                # this calls __deepcopy__ in Sites
-                newValue = copy.deepcopy(attrValue, memo)
-                newValue.containedById = id(new)
-                setattr(new, name, newValue)
+            elif name == '_sites':
+                if attrValue is not None: # otherwise created when needed
+                    # this calls __deepcopy__ in Sites
+                    newValue = copy.deepcopy(attrValue, memo)
+                    newValue.containedById = id(new)
+                    setattr(new, name, newValue)
             elif name == 'flattenedRepresentationOf':
                 # keep a reference, not a deepcopy
                 setattr(new, name, self.flattenedRepresentationOf)
@@ -1240,6 +1419,8 @@ class Stream(base.Music21Object):
                     #self.streamStatus.client = storedClient
             elif name == '_cache' or name == 'analysisData':
                 continue # skip for now
+            elif name == '_sharedPitchesAndDurations':
+                continue # copied Notes have their own pitches and durations
             elif name == '_elements':
                 # must manually add elements to new Stream
                 for e in self._elements:
@@ -1263,6 +1444,9 @@ class Stream(base.Music21Object):
                     new._storeAtEndCore(copy.deepcopy(e, memo))
             elif name == 'id' and type(old.id) == int:
                 pass
+            elif type(attrValue) in common.IMMUTABLE_TYPES:
+                # numbers, strings, and None are shared, not copied
+                setattr(new, name, attrValue)
             else:
                 try:
                     deeplyCopiedObject = copy.deepcopy(attrValue, memo)
@@ -1288,28 +1472,46 @@ class Stream(base.Music21Object):
         new._idLastDeepCopyOf = id(self)
         # TODO: instead of purging, have old sites become new contexts
         # have a separate option to purge contexts
+        return new
 
-        # after copying all elements
-        # get all spanners at all levels from new:
-        # these have references to old objects
-        # it is likely that this only needs to be done at the highest
-        # level of recursion, not on component Streams
-        #spannerBundle = spanner.SpannerBundle(new.flat.spanners)
-        spannerBundle = new.spannerBundle
-        # only proceed if there are spanners, otherwise creating semiFlat
-        if len(spannerBundle) > 0:
-            # iterate over complete semi-flat (need containers); find
-            # all new/old pairs
-            for e in new.semiFlat:
-                #if 'Spanner' in e.classes:
+    def _deepcopyRelinkSpanners(self, new):
+        '''
+        After a deepcopy, point the copied spanners of `new`, at all levels,
+        to the copied elements instead of the elements of this Stream.
+        '''
+        # get all spanners and all other elements (including containers)
+        # at all levels from new; the spanners have references to old objects.
+        # order does not matter here, so walk the elements rather than
+        # building (and sorting) .flat and .semiFlat
+        spanners = []
+        others = []
+        streamsToWalk = [new]
+        while streamsToWalk:
+            s = streamsToWalk.pop()
+            for e in s._elements + s._endElements:
                 if e.isSpanner:
-                    continue # we never update Spanners
+                    spanners.append(e)
+                else:
+                    others.append(e)
+                    if e.isStream:
+                        streamsToWalk.append(e)
+        # only proceed if there are spanners
+        if len(spanners) > 0:
+            # map the id of each old spanned element to the spanners holding it
+            spannersBySpannedId = {}
+            for sp in spanners:
+                for spannedId in sp.getSpannedElementIds():
+                    spannersBySpannedId.setdefault(spannedId, []).append(sp)
+            # find all new/old pairs
+            for e in others:
+                # we never update Spanners
                 # update based on id of old object, and ref to new object
                 if e.sites.hasSpannerSite():
                     #environLocal.printDebug(['Stream.__deepcopy__', 'replacing component to', e])
                     # this will clear and replace the proper locations on
                     # the SpannerStorage Stream
-                    spannerBundle.replaceSpannedElement(e._idLastDeepCopyOf, e)
+                    for sp in spannersBySpannedId.get(e._idLastDeepCopyOf, ()):
+                        sp.replaceSpannedElement(e._idLastDeepCopyOf, e)
                     # need to remove the old SpannerStorage Stream from this element; 
                     # however, all we have here is the new Spanner and new elements
                     # this must be done here, not when originally copying
@@ -1340,8 +1542,6 @@ class Stream(base.Music21Object):
 #                     variantBundle.replaceElement(e._idLastDeepCopyOf, e)
 #
 
-        return new
-
     #---------------------------------------------------------------------------
     def _addElementPreProcess(self, element, checkRedundancy=True):
         '''
@@ -2350,8 +2550,7 @@ class Stream(base.Music21Object):
 
         '''
         if classFilter is not None:
-            if not common.isListLike(classFilter):
-                classFilter = [classFilter]
+            classFilter = base.classFilterSet(classFilter)
 
         for e in self._elements:
             if classFilter is None:
@@ -2468,18 +2667,21 @@ class Stream(base.Music21Object):
             found.autoSort = self.autoSort
 
         # much faster in the most common case than calling common.isListLike
-        if not isinstance(classFilterList, (list, tuple)):
+        if not isinstance(classFilterList, (list, tuple, frozenset)):
             classFilterList = tuple([classFilterList])
 
         # if we are sure that this Stream does not have a class
         singleClassString = False
         if (len(classFilterList) == 1 and
+            not isinstance(classFilterList, frozenset) and
             isinstance(classFilterList[0], str)):
             singleClassString = True
         if singleClassString:
             if not self.hasElementOfClass(classFilterList[0]):
                 found.isSorted = self.isSorted
                 return found
+        # normalize once for all elements
+        classFilterList = base.classFilterSet(classFilterList)
 
         if ((self.isSorted is False) and (self.autoSort is True)):
             self.sort() # will set isSorted to True
@@ -2548,10 +2750,7 @@ class Stream(base.Music21Object):
         found.derivation.origin = self
         found.derivation.method = 'getElementsNotOfClass'
 
-        # much faster in the most common case than calling common.isListLike
-        if not isinstance(classFilterList, list):
-            if not isinstance(classFilterList, tuple):
-                classFilterList = [classFilterList]
+        classFilterList = base.classFilterSet(classFilterList)
 
         # appendedAlready fixes bug where if an element matches two
         # classes it was appendedTwice
@@ -4745,18 +4944,16 @@ class Stream(base.Music21Object):
         []
 
         '''
-        uniqueOffsets = []
+        uniqueOffsets = set()
         for e in self.elements:
             o = e.getOffsetBySite(self)
-            if endTimesOnly is not True and o not in uniqueOffsets:
-                uniqueOffsets.append(o)
+            if endTimesOnly is not True:
+                uniqueOffsets.add(o)
             endTime = opFrac(o + e.duration.quarterLength)
-            if offsetsOnly is not True and endTime not in uniqueOffsets:
-                uniqueOffsets.append(endTime)
-        #uniqueOffsets = sorted(uniqueOffsets)
+            if offsetsOnly is not True:
+                uniqueOffsets.add(endTime)
         # must sort do to potential overlaps
-        uniqueOffsets.sort() # might be faster in-place
-        return uniqueOffsets
+        return sorted(uniqueOffsets)
 
     def makeChords(self, minimumWindowSize=.125, includePostWindow=True,
             removeRedundantPitches=True, useExactOffsets = False,
@@ -5062,7 +5259,7 @@ class Stream(base.Music21Object):
 
     def chordify(self, addTies=True, displayTiedAccidentals=False,
         addPartIdAsGroup=False, removeRedundantPitches=True,
-        toSoundingPitch=True):
+        toSoundingPitch=True, useTimespans=False):
         '''
         Create a chordal reduction of polyphonic music, where each
         change to a new pitch results in a new chord. If a Score or
@@ -5096,6 +5293,13 @@ class Stream(base.Music21Object):
         more transpositions will be transposed to sounding pitch before chordification.
         True by default.
 
+        If `useTimespans` is True, a Score or Part of Measures is chordified
+        from a :class:`~music21.stream.timespans.TimespanCollection` of its
+        notes without deepcopying and slicing the whole Stream first.  This
+        is much faster on big scores and gives the same result; Streams it
+        cannot handle (no Measures, unpitched notes, parts to be
+        transposed...) are chordified the usual way.
+
         ::
 
             >>> s = stream.Score()
@@ -5198,6 +5402,15 @@ class Stream(base.Music21Object):
         # TODO: make chordify have an option where the Pitches are not deepcopied from the original, but
         #       are the same.
 
+        if useTimespans:
+            post = self._chordifyTimespans(addTies=addTies,
+                displayTiedAccidentals=displayTiedAccidentals,
+                addPartIdAsGroup=addPartIdAsGroup,
+                removeRedundantPitches=removeRedundantPitches,
+                toSoundingPitch=toSoundingPitch)
+            if post is not None:
+                return post
+
         # for makeChords, below        
         transferGroupsToPitches = False
         if addPartIdAsGroup:
@@ -5228,17 +5441,14 @@ class Stream(base.Music21Object):
 
         for i in range(mCount): # may be 1
             # first, collect all unique offsets for each measure
-            uniqueOffsets = []
+            uniqueOffsets = set()
             for pNum, p in enumerate(allParts):
                 if hasMeasures is True: # has measures
                     m = partsMeasureCache[pNum][i]
                 else:
                     m = p # treat the entire part as one measure
                 mFlatNotes = m.flat.notesAndRests
-                theseUniques = mFlatNotes._uniqueOffsetsAndEndTimes()
-                for t in theseUniques:
-                    if t not in uniqueOffsets:
-                        uniqueOffsets.append(t)
+                uniqueOffsets.update(mFlatNotes._uniqueOffsetsAndEndTimes())
             #environLocal.printDebug(['chordify: uniqueOffsets for all parts, m', uniqueOffsets, i])
             uniqueOffsets = sorted(uniqueOffsets)
             for pNum, p in enumerate(allParts):
@@ -5270,6 +5480,8 @@ class Stream(base.Music21Object):
         # assume we can manipulate this these measures as already have deepcopy
         # the Part may not have had any Measures;
         if len(mStream) > 0:
+            postNotes = list(post.notesAndRests)
+            postOffsets = [e.getOffsetBySite(post) for e in postNotes]
             for i, m in enumerate(mStream.getElementsByClass('Measure')):
                 # get highest time before removal
                 mQl = m.duration.quarterLength
@@ -5281,17 +5493,14 @@ class Stream(base.Music21Object):
                 mOffsetEnd = mOffsetStart + mQl
                 # not sure if this properly manages padding
 
-                # place all notes in their new location if offsets match
-                # TODO: this iterates over all notes at each iteration; can be faster
-                for e in post.notesAndRests:
-                    # these are flat offset values
-                    o = e.getOffsetBySite(post)
-                    #environLocal.printDebug(['iterating elements', o, e])
-                    if o >= mOffsetStart and o < mOffsetEnd:
-                        # get offset in relation to inside of Measure
-                        localOffset = o - mOffsetStart
-                        #environLocal.printDebug(['inserting element', e, 'at', o, 'in', m, 'localOffset', localOffset])
-                        m.insert(localOffset, e)
+                # place all notes in their new location if offsets match;
+                # the flat offsets are sorted, so only look at those in
+                # the Measure
+                for j in range(bisect.bisect_left(postOffsets, mOffsetStart),
+                        bisect.bisect_left(postOffsets, mOffsetEnd)):
+                    # get offset in relation to inside of Measure
+                    localOffset = postOffsets[j] - mOffsetStart
+                    m.insert(localOffset, postNotes[j])
                 # call for each measure
                 m._elementsChanged()
             # call this post now
@@ -5307,6 +5516,232 @@ class Stream(base.Music21Object):
         #return mStream
         #return post
 
+    def _chordifyTimespans(self, addTies=True, displayTiedAccidentals=False,
+        addPartIdAsGroup=False, removeRedundantPitches=True,
+        toSoundingPitch=True):
+        '''
+        The engine for chordify(useTimespans=True).
+
+        Instead of slicing and flattening a deepcopy of the whole Stream,
+        this walks the verticalities of a TimespanCollection of the notes
+        and rests.  Source notes are never split: for each of them the
+        offsets where `sliceAtOffsets` would have cut it are found, and the
+        pitches, ties, articulations and expressions that each piece would
+        have had go straight into the new Chords.  The Chords go in new
+        Measures with the attributes, clefs, meters, and other elements
+        (but not the notes) of the Measures of the first Part.
+
+        Returns None if the Stream has something that this does not model
+        (no Measures, Measures that do not line up between Parts, unpitched
+        notes, parts that need transposing, etc.); chordify
+        then uses the slicing method.
+
+        >>> s = corpus.parse('bwv66.6')
+        >>> cc = s._chordifyTimespans()
+        >>> cc.measure(1).show('text')
+        {0.0} <music21.chord.Chord A4 F#4 C#4 F#3>
+        {1.0} <music21.chord.Chord B4 E4 B3 G#3>
+        {2.0} <music21.chord.Chord C#5 E4 A3>
+        {3.0} <music21.chord.Chord E5 E4 B3 G#3>
+        >>> stream.Stream()._chordifyTimespans() is None
+        True
+        '''
+        if self.hasPartLikeStreams():
+            allParts = list(self.getElementsByClass('Stream'))
+        else:
+            allParts = [self]
+        if toSoundingPitch and allParts[0].atSoundingPitch == False:
+            return None
+
+        mStream = allParts[0].getElementsByClass('Measure')
+        mCount = len(mStream)
+        if mCount == 0:
+            return None
+        # check that the Measures line up and only hold what sliceAtOffsets
+        # would leave alone; also get the order in which the old .flat
+        # would have seen each note.
+        measureStarts = [] # flat offsets of the Measures of the first Part
+        containerInfo = {} # id of Measure or Voice: (part order, measure index)
+        flatOrder = {} # id of note or rest: order within its Measure
+        partOrder = {}
+        for i, e in enumerate(self._elements):
+            partOrder[id(e)] = i
+        for pNum, p in enumerate(allParts):
+            measures = p.getElementsByClass('Measure')
+            if len(measures) != mCount:
+                return None
+            if p is self:
+                pOffset = 0.0
+                pOrder = 0
+            else:
+                pOffset = p.getOffsetBySite(self)
+                pOrder = partOrder[id(p)]
+            for i, m in enumerate(measures):
+                mOffset = m.getOffsetBySite(p)
+                mStart = opFrac(pOffset + mOffset)
+                if pNum == 0:
+                    if i > 0 and mStart < (measureStarts[-1] +
+                            mStream[i - 1].duration.quarterLength):
+                        return None # overlapping Measures
+                    measureStarts.append(mStart)
+                elif mStart != measureStarts[i]:
+                    return None
+                hasVoices = False
+                hasNotes = False
+                for e in m._elements:
+                    if e.isStream:
+                        if 'Voice' not in e.classes or e.getOffsetBySite(m) != 0:
+                            return None
+                        hasVoices = True
+                        containerInfo[id(e)] = (pOrder, i, str(p.id), True)
+                        for eSub in e.elements:
+                            if eSub.isStream:
+                                return None
+                            elif 'GeneralNote' in eSub.classes:
+                                flatOrder[id(eSub)] = len(flatOrder)
+                            elif eSub.duration.quarterLength != 0:
+                                return None
+                    elif 'GeneralNote' in e.classes:
+                        hasNotes = True
+                        flatOrder[id(e)] = len(flatOrder)
+                    elif e.duration.quarterLength != 0:
+                        return None
+                if hasVoices and hasNotes:
+                    return None
+                containerInfo[id(m)] = (pOrder, i, str(p.id), False)
+
+        tree = timespans.streamToTimespanCollection(self, flatten=True,
+            classList=(note.GeneralNote,))
+        measureOffsets = [set() for unused in range(mCount)]
+        noteInfo = {} # id of Note or Chord: _ChordifyPieces
+        measureIndices = {}
+        for elementTimespan in tree:
+            e = elementTimespan.element
+            try:
+                pOrder, i, partId, inVoice = containerInfo[
+                    id(elementTimespan.parentage[0])]
+            except KeyError: # not in a Measure or Voice of a Part
+                return None
+            start = opFrac(elementTimespan.startOffset)
+            end = opFrac(elementTimespan.stopOffset)
+            measureOffsets[i].add(start)
+            measureOffsets[i].add(end)
+            if 'Rest' in e.classes:
+                continue
+            elif not (e.isNote or e.isChord):
+                return None
+            groups = list(e.groups)
+            if addPartIdAsGroup:
+                groups.append(partId)
+            noteInfo[id(e)] = _ChordifyPieces(e, start, end,
+                (e.priority, e.classSortOrder, not e.isGrace, pOrder, i,
+                flatOrder[id(e)]),
+                groups, inVoice and addPartIdAsGroup)
+            measureIndices[id(e)] = i
+        if len(noteInfo) == 0:
+            return None
+
+        for eId, info in noteInfo.items():
+            info.setCuts(sorted(o for o in measureOffsets[measureIndices[eId]]
+                if info.start < o < info.end), addTies)
+
+        # gather the notes sounding at each verticality; float offsets
+        # that opFrac to the same value are merged.
+        candidates = [] # pairs of verticality offset, list of _ChordifyPieces
+        for verticality in tree.iterateVerticalities():
+            vStart = opFrac(verticality.startOffset)
+            if not candidates or candidates[-1][0] != vStart:
+                candidates.append((vStart, []))
+            for elementTimespan in (verticality.startTimespans +
+                    verticality.overlapTimespans):
+                info = noteInfo.get(id(elementTimespan.element))
+                if info is not None:
+                    candidates[-1][1].append(info)
+
+        allOffsets = sorted(set().union(*measureOffsets))
+        for info in noteInfo.values():
+            if info.start == allOffsets[-1]: # a grace note left out by makeChords
+                return None
+        post = Stream()
+        cIndex = 0
+        for oStart, oEnd in zip(allOffsets, allOffsets[1:]):
+            while (cIndex + 1 < len(candidates) and
+                    candidates[cIndex + 1][0] <= oStart):
+                cIndex += 1
+            pieces = {}
+            for info in candidates[cIndex][1]:
+                pieceIndex = info.pieceIndexAt(oStart)
+                if pieceIndex is not None:
+                    pieces[id(info)] = (info.sortKey(pieceIndex), info, pieceIndex)
+            if len(pieces) == 0:
+                continue
+            c = chord.Chord()
+            c.duration.quarterLength = oEnd - oStart
+            tempComponents = []
+            for unused, info, pieceIndex in sorted(pieces.values()):
+                tempComponents.extend(info.components(pieceIndex,
+                    displayTiedAccidentals, addPartIdAsGroup))
+            c.pitches = [p for p, unused in tempComponents]
+            for p, tieType in tempComponents:
+                if tieType is not None:
+                    c.setTie(tieType, p)
+            for unused, info, pieceIndex in sorted(pieces.values()):
+                c.articulations += info.articulations(pieceIndex)
+            for unused, info, pieceIndex in sorted(pieces.values()):
+                c.expressions += info.expressions(pieceIndex)
+            if removeRedundantPitches:
+                c.removeRedundantPitches(inPlace=True)
+            post._insertCore(oStart, c)
+
+        # the rests go where the old flat Stream, holding everything but
+        # notes and rests, had gaps
+        flat = self.flat
+        for e in flat._elements:
+            if not isinstance(e, note.GeneralNote):
+                placeholder = base.Music21Object()
+                placeholder.duration = duration.Duration(e.duration.quarterLength)
+                post._insertCore(e.getOffsetBySite(flat), placeholder)
+        for e in flat._endElements:
+            post._storeAtEndCore(base.Music21Object())
+        post._elementsChanged()
+        post.makeRests(refStreamOrTimeRange=(flat.lowestOffset, flat.highestTime),
+            fillGaps=True, inPlace=True)
+
+        returnObj = allParts[0].__class__()
+        returnObj.derivation.origin = allParts[0]
+        returnObj.derivation.method = 'chordify'
+        newMeasures = []
+        measureEnds = []
+        for m in mStream:
+            measureEnds.append(opFrac(m.getOffsetBySite(allParts[0]) +
+                m.duration.quarterLength))
+            # copy only what the Chords do not replace, not the notes
+            mNew = m.__class__()
+            mNew.mergeAttributes(m)
+            for e in m._elements:
+                if not e.isStream and not isinstance(e, note.GeneralNote):
+                    mNew._insertCore(e.getOffsetBySite(m), copy.deepcopy(e))
+            for e in m._endElements:
+                mNew._storeAtEndCore(copy.deepcopy(e))
+            if addPartIdAsGroup:
+                for e in mNew:
+                    e.groups.append(str(allParts[0].id))
+            newMeasures.append(mNew)
+            returnObj._insertCore(m.getOffsetBySite(allParts[0]), mNew)
+        partMeasureStarts = [m.getOffsetBySite(allParts[0]) for m in mStream]
+        for e in post.notesAndRests:
+            o = e.getOffsetBySite(post)
+            i = bisect.bisect_right(partMeasureStarts, o) - 1
+            if i >= 0 and o < measureEnds[i]:
+                newMeasures[i].insert(o - partMeasureStarts[i], e)
+        for mNew in newMeasures:
+            mNew._elementsChanged()
+        returnObj._elementsChanged()
+
+        if self.metadata is not None and self.hasPartLikeStreams() is True:
+            returnObj.insert(0, copy.deepcopy(self.metadata))
+        return returnObj
+
 
     def splitByClass(self, classObj, fx):
         '''
@@ -5633,6 +6068,8 @@ class Stream(base.Music21Object):
 #             e = noteStream[i]
         for e in noteStream:
             if isinstance(e, note.Note):
+                # a Pitch shared by an immutable Stream is changed in a copy
+                e._unsharePitch()
                 e.pitch.updateAccidentalDisplay(pitchPast=pitchPast,
                     pitchPastMeasure=pitchPastMeasure,
                     alteredPitches=alteredPitches,
@@ -6875,13 +7312,60 @@ class Stream(base.Music21Object):
             restoreActiveSites=True):
             pass
 
-    def makeImmutable(self):
+    def makeImmutable(self, sharePitchesAndDurations=False):
         '''
         Clean this Stream: for self and all elements, purge all dead locations
         and remove all non-contained sites. Further, restore all active sites.
+
+        If `sharePitchesAndDurations` is True, Notes within this Stream with
+        equal pitches share one :class:`~music21.pitch.Pitch` object, and
+        Notes, Rests, and Chords with equal (simple) durations share one
+        :class:`~music21.duration.Duration` object, saving memory in large
+        Streams that are only read, as in corpus-wide analysis.  The shared
+        objects are kept by this Stream; Notes in other Streams never share
+        them.
+
+        >>> s = stream.Stream()
+        >>> s.repeatAppend(note.Note('C#4'), 3)
+        >>> s.makeImmutable(sharePitchesAndDurations=True)
+        >>> s[0].pitch is s[2].pitch
+        True
+        >>> s[0].duration is s[2].duration
+        True
+
+        A shared object is replaced by a copy when it is changed through a
+        Note (by setting `.name`, `.octave`, `.quarterLength`, and the like,
+        or `transpose(inPlace=True)`) or by Stream methods such as
+        :meth:`~music21.stream.Stream.makeAccidentals` and
+        :meth:`~music21.stream.Stream.stripTies`, and deepcopies of the Stream
+        get their own objects:
+
+        >>> s[0].octave = 5
+        >>> (s[0].nameWithOctave, s[2].nameWithOctave)
+        ('C#5', 'C#4')
+        >>> s.makeAccidentals(inPlace=True) is s
+        True
+        >>> [n.pitch.accidental.displayStatus for n in s]
+        [True, True, False]
+        >>> s[1].pitch is s[2].pitch
+        False
+
+        Changing a shared `.pitch` or `.duration` directly changes every Note
+        in this Stream that shares it; call
+        :meth:`~music21.stream.Stream.makeMutable` first, which gives every
+        element its own objects again:
+
+        >>> s.makeMutable()
+        >>> s[1].pitch is s[2].pitch
+        False
         '''
         self.sort() # must sort before making immutable
         self._mutable = False
+        if sharePitchesAndDurations:
+            if self._sharedPitchesAndDurations is None:
+                self._sharedPitchesAndDurations = (common.InternTable(),
+                                                   common.InternTable())
+            sharedPitches, sharedDurations = self._sharedPitchesAndDurations
         for e in self._yieldElementsDownward(streamsOnly=False,
             restoreActiveSites=True):
             #e.purgeLocations(rescanIsDead=True)
@@ -6891,9 +7375,40 @@ class Stream(base.Music21Object):
             if e.isStream:
                 e.sort() # sort before making immutable
                 e._mutable = False
+            elif sharePitchesAndDurations and isinstance(e, note.GeneralNote):
+                if isinstance(e, note.Note):
+                    e.pitch = sharedPitches.intern(e.pitch)
+                e.duration = sharedDurations.intern(e.duration)
 
     def makeMutable(self, recurse=True):
+        '''
+        Allow this Stream (and, if `recurse` is True, all Streams within it)
+        to be changed again after :meth:`~music21.stream.Stream.makeImmutable`,
+        giving elements their own copies of any shared pitches and durations.
+
+        The pitches and durations shared by this Stream are given back to
+        the Notes in all Streams within it, whatever `recurse` is.
+        '''
+        def unshare(e):
+            if isinstance(e, note.GeneralNote):
+                if isinstance(e, note.Note) and common.isInterned(e.pitch):
+                    e.pitch = copy.deepcopy(e.pitch)
+                if common.isInterned(e._duration):
+                    e.duration = copy.deepcopy(e._duration)
+
         self._mutable = True
+        if self._sharedPitchesAndDurations is not None:
+            for e in self._yieldElementsDownward(streamsOnly=False,
+                restoreActiveSites=False):
+                unshare(e)
+            for table in self._sharedPitchesAndDurations:
+                table.clear()
+            self._sharedPitchesAndDurations = None
+        else: # shared by a Stream containing this one
+            for e in self._elements:
+                unshare(e)
+        for e in self._endElements:
+            unshare(e)
         if recurse:
             for e in self._yieldElementsDownward(streamsOnly=True,
                 restoreActiveSites=True):
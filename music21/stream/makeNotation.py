@@ -12,6 +12,7 @@
 # License:      LGPL or BSD, see license.txt
 #------------------------------------------------------------------------------
 
+import bisect
 import copy
 import unittest
 
@@ -509,6 +510,21 @@ def makeMeasures(
         else:
             measureCount += 1
 
+    # get each measure and its start and end offsets once, rather than
+    # summing and comparing them again for every element
+    measures = []
+    measureStarts = []
+    measureEnds = []
+    lastTimeSignature = None
+    for i in range(len(post)):
+        m = post[i]
+        measures.append(m)
+        if m.timeSignature is not None:
+            lastTimeSignature = m.timeSignature
+        mStart = m.getOffsetBySite(post)
+        measureStarts.append(mStart)
+        measureEnds.append(opFrac(mStart + lastTimeSignature.barDuration.quarterLength))
+
     # populate measures with elements
     for ob in offsetMap:
         e, start, end, voiceIndex = ob
@@ -522,23 +538,11 @@ def makeMeasures(
             spannerBundleAccum.append(e)
             continue
 
-        match = False
-        lastTimeSignature = None
-        for i in range(len(post)):
-            m = post[i]
-            if m.timeSignature is not None:
-                lastTimeSignature = m.timeSignature
-            # get start and end offsets for each measure
-            # seems like should be able to use m.duration.quarterLengths
-            mStart = m.getOffsetBySite(post)
-            mEnd = mStart + lastTimeSignature.barDuration.quarterLength
-            # if elements start fits within this measure, break and use
-            # offset cannot start on end
-            if start >= mStart and start < mEnd:
-                match = True
-                #environLocal.printDebug([
-                #    'found measure match', i, mStart, mEnd, start, end, e])
-                break
+        # measures are contiguous, so the last measure starting at or
+        # before the element is the only one that can contain it;
+        # offset cannot start on end
+        i = bisect.bisect_right(measureStarts, start) - 1
+        match = i >= 0 and start < measureEnds[i]
         if not match:
             raise stream.StreamException(
                 'cannot place element %s with start/end %s/%s '
@@ -546,7 +550,8 @@ def makeMeasures(
 
         # find offset in the temporal context of this measure
         # i is the index of the measure that this element starts at
-        # mStart, mEnd are correct
+        m = measures[i]
+        mStart = measureStarts[i]
         oNew = start - mStart  # remove measure offset from element offset
 
         # insert element at this offset in the measure
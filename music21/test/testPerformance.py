@@ -15,6 +15,7 @@ This file is not run with the standard test battery presently.
 '''
 
 
+import gc
 import unittest
 
 import music21
@@ -103,6 +104,19 @@ class Test(unittest.TestCase):
             post = s.flat.getElementsByClass(['Rest', 'Note'])
             self.assertEqual(len(post), 1500)
 
+    def runFilterByClass(self):
+        '''Filtering a parsed score by class names and classes many times;
+        each element is tested against each filter
+        '''
+        from music21 import note, chord
+        s = corpus.parse('bwv66.6')
+        sFlat = s.flat
+        for i in range(200):
+            unused = sFlat.getElementsByClass(['Note', 'Chord'])
+            unused = sFlat.getElementsByClass([note.Rest, chord.Chord])
+            unused = sFlat.getElementsNotOfClass('GeneralNote')
+            for p in s.parts:
+                unused = p.getElementsByClass('Measure')
 
     def runParseBeethoven(self):
         '''Loading file: beethoven/opus59no2/movement3
@@ -174,6 +188,112 @@ class Test(unittest.TestCase):
             d.quarterLength = ql
             junk = d.quarterLength
 
+    def getAllocationStatistics(self, creator, number=10000):
+        '''
+        Call `creator` `number` times, keeping each result, and return a tuple
+        of the objects created per second and the bytes allocated per object
+        (including the object's share of the list that keeps it).  Bytes are
+        None if tracemalloc (Python 3.4+) is not available.
+        '''
+        try:
+            import tracemalloc
+        except ImportError:
+            tracemalloc = None
+
+        kept = []
+        t = common.Timer()
+        t.start()
+        for unused_i in range(number):
+            kept.append(creator())
+        t.stop()
+        perSecond = number / max(t(), 0.000001)
+
+        bytesPerObject = None
+        if tracemalloc is not None:
+            kept = []
+            tracemalloc.start()
+            before = tracemalloc.get_traced_memory()[0]
+            for unused_i in range(number):
+                kept.append(creator())
+            bytesPerObject = (tracemalloc.get_traced_memory()[0] - before) / float(number)
+            tracemalloc.stop()
+        return perSecond, bytesPerObject
+
+    def runCreateObjects(self):
+        '''
+        Creating 10000 each of Note, Chord, Pitch, and Duration objects,
+        noting objects per second and bytes per object
+        '''
+        from music21 import chord, duration, note, pitch
+        for className, creator in [
+            ('Note', lambda: note.Note('C#4')),
+            ('Chord', lambda: chord.Chord(['C4', 'E-4', 'G4'])),
+            ('Pitch', lambda: pitch.Pitch('C#4')),
+            ('Duration', lambda: duration.Duration(1.5)),
+            ]:
+            perSecond, bytesPerObject = self.getAllocationStatistics(creator)
+            environLocal.printDebug([className, 'objects per second:', int(perSecond),
+                                     'bytes per object:', bytesPerObject])
+
+    def runParseScoreMemory(self):
+        '''
+        Loading file: beethoven/opus59no2/movement3 and keeping it,
+        noting the bytes of memory held per note (including chords)
+        '''
+        try:
+            import tracemalloc
+        except ImportError:
+            tracemalloc = None
+
+        if tracemalloc is not None:
+            tracemalloc.start()
+            before = tracemalloc.get_traced_memory()[0]
+        s = corpus.parse('beethoven/opus59no2/movement3', forceSource=True)
+        if tracemalloc is not None:
+            held = tracemalloc.get_traced_memory()[0] - before
+            tracemalloc.stop()
+        numberOfNotes = len(s.flat.notes)
+        if tracemalloc is not None:
+            environLocal.printDebug(['notes:', numberOfNotes,
+                                     'bytes per note:', held / float(numberOfNotes)])
+
+    def runDeepcopyScore(self):
+        '''
+        Deepcopying beethoven/opus59no2/movement3, whole and flat, 5 times each
+        '''
+        import copy
+        s = corpus.parse('beethoven/opus59no2/movement3')
+        sFlat = s.flat
+        for unused_i in range(5):
+            unused = copy.deepcopy(s)
+            unused = copy.deepcopy(sFlat)
+
+    def runShareScorePitchesAndDurations(self):
+        '''
+        Loading file: beethoven/opus59no2/movement3, making it immutable
+        with shared Pitches and Durations, noting the bytes saved per note
+        '''
+        try:
+            import tracemalloc
+        except ImportError:
+            tracemalloc = None
+
+        if tracemalloc is not None:
+            tracemalloc.start()
+        s = corpus.parse('beethoven/opus59no2/movement3', forceSource=True)
+        numberOfNotes = len(s.flat.notesAndRests)
+        s.makeImmutable()
+        if tracemalloc is not None:
+            gc.collect()
+            before = tracemalloc.get_traced_memory()[0]
+        s.makeImmutable(sharePitchesAndDurations=True)
+        if tracemalloc is not None:
+            gc.collect()
+            saved = before - tracemalloc.get_traced_memory()[0]
+            tracemalloc.stop()
+            environLocal.printDebug(['notes and rests:', numberOfNotes,
+                                     'bytes saved per note:', saved / float(numberOfNotes)])
+
     def runCreatePitches(self):
         '''
         Creating 50000 Pitch objects
@@ -186,6 +306,219 @@ class Test(unittest.TestCase):
             p = pitch.Pitch(inputPName)
             p.transpose('p5', inPlace=True)
 
+    def runPitchPropertyAccess(self):
+        '''
+        Reading ps, midi, pitchClass, name, nameWithOctave, and frequency
+        20 times each from 5000 Pitch objects, changing the octave of each
+        before every fourth read
+        '''
+        from music21 import pitch
+        pList = [pitch.Pitch(n) for n in ['C#4', 'e-5', 'G3', 'b`2', 'F##6'] * 1000]
+        for i in range(20):
+            for p in pList:
+                if i % 4 == 0:
+                    p.octave = i // 4 + 2
+                unused = (p.ps, p.midi, p.pitchClass, p.name,
+                          p.nameWithOctave, p.frequency)
+
+
+    def runIntervalsBetweenNotes(self):
+        '''
+        Finding the Interval between each pair of adjacent notes in each part
+        of bwv66.6, and transposing each pitch by that Interval, 50 times
+        '''
+        from music21 import interval
+        s = corpus.parse('bwv66.6')
+        partNotes = [p.flat.notes.getElementsByClass('Note') for p in s.parts]
+        for unused_i in range(50):
+            for notes in partNotes:
+                for j in range(len(notes) - 1):
+                    i = interval.Interval(notes[j], notes[j + 1])
+                    unused = i.transposePitch(notes[j].pitch)
+
+
+    def runChordSetClassLookups(self):
+        '''
+        Reading the forte class, prime form, normal form, interval vector, and
+        common name of new Chords made from each chord of bwv66.6 chordified,
+        20 times
+        '''
+        from music21 import chord
+        s = corpus.parse('bwv66.6').chordify()
+        pitchLists = [c.pitches for c in s.flat.getElementsByClass('Chord')]
+        for unused_i in range(20):
+            for pitches in pitchLists:
+                c = chord.Chord(pitches)
+                unused = (c.forteClass, c.primeForm, c.normalForm,
+                          c.intervalVector, c.commonName)
+
+
+    def runAnalyzeChordifiedChorales(self):
+        '''
+        Finding the root, bass, inversion, quality, and common name, then
+        the third, fifth, and seventh, of new Chords made from each chord
+        of bwv66.6 and bwv1.6 chordified, 10 times
+        '''
+        from music21 import chord
+        pitchLists = []
+        for workName in ('bwv66.6', 'bwv1.6'):
+            s = corpus.parse(workName).chordify()
+            pitchLists.extend(c.pitches for c in s.flat.getElementsByClass('Chord'))
+        for unused_i in range(10):
+            chords = [chord.Chord(pitches) for pitches in pitchLists]
+            chord.analyzeChords(chords)
+            for c in chords:
+                unused = (c.third, c.fifth, c.seventh, c.isDominantSeventh())
+
+
+    def runMakeMeasuresTuplets(self):
+        '''
+        Appending 3000 notes of tuplet and non-tuplet quarterLengths to a
+        Stream, making measures, summing offsets and quarterLengths, and
+        getting elements by offset
+        '''
+        from music21 import note, stream
+        quarterLengths = [1/3.0, 1/5.0, 1/6.0, 0.5, 2/3.0]
+        s = stream.Stream()
+        for i in range(3000):
+            s.append(note.Note('C4', quarterLength=quarterLengths[i % 5]))
+        unused = s.makeMeasures()
+        total = 0.0
+        for n in s.notes:
+            total = common.opFrac(total + n.offset + n.quarterLength)
+        for i in range(200):
+            unused = s.getElementsByOffset(i * 2/3.0, i * 2/3.0 + 1)
+
+
+    def runChordifyTimespans(self):
+        '''
+        Chordifying Mozart k155 movement 2 and bwv66.6 from their
+        timespans, keeping the measures, 3 times
+        '''
+        scores = [corpus.parse('mozart/k155/movement2'), corpus.parse('bwv66.6')]
+        for unused_i in range(3):
+            for sc in scores:
+                unused = sc.chordify(useTimespans=True)
+
+
+    def runNGramSearch(self):
+        '''
+        Indexing the parts of ten chorales in an n-gram index and searching
+        it 50 times for the opening measures of each part, transposed
+        '''
+        from music21 import search
+        workNames = ['bwv66.6', 'bwv1.6', 'bwv164.6', 'bwv405', 'bwv245.26',
+                     'bwv269', 'bwv244.3', 'bwv197.5', 'bwv197.10', 'bwv26.6']
+        ngi = search.ngram.NGramIndex()
+        queries = []
+        for workName in workNames:
+            sc = corpus.parse(workName)
+            ngi.addStream(workName, sc)
+            for p in sc.parts:
+                q = p.measures(1, 6).transpose(2)
+                queries.append(search.translateIntervalsAndSpeeds(q.flat.notes))
+        for unused_i in range(50):
+            for q in queries:
+                unused = ngi.search(q, maxResults=5)
+
+
+    def runScoreSimilarity(self):
+        '''
+        Comparing all the segments of ten chorales with each other, 
+        keeping all results and then only results at least 0.5 similar
+        '''
+        from music21.search import segment
+        workNames = ['bwv66.6', 'bwv1.6', 'bwv164.6', 'bwv405', 'bwv245.26',
+                     'bwv269', 'bwv244.3', 'bwv197.5', 'bwv197.10', 'bwv26.6']
+        scoreDict = segment.indexScoreFilePaths(workNames)
+        unused = segment.scoreSimilarity(scoreDict, forceDifflib=True)
+        for unused in segment.iterateScoreSimilarity(scoreDict, forceDifflib=True,
+                                                     minimumSimilarity=0.5):
+            pass
+
+
+    def runDataSetProcessCached(self):
+        '''
+        Extracting all jSymbolic and native features from three chorales 
+        into a feature cache, then processing them again from the cache
+        '''
+        import shutil
+        import tempfile
+        from music21 import features
+        cacheDir = tempfile.mkdtemp()
+        try:
+            for unused_i in range(2):
+                ds = features.DataSet(classLabel='Composer')
+                ds.addFeatureExtractors(features.jSymbolic.featureExtractors + 
+                                        features.native.featureExtractors)
+                for workName in ('bwv66.6', 'bwv1.6', 'bwv164.6'):
+                    ds.addData(workName, classValue='Bach')
+                ds.process(cacheDirectory=cacheDir)
+        finally:
+            shutil.rmtree(cacheDir)
+
+
+    def runJSymbolicFeatures(self):
+        '''
+        Extracting every jSymbolic feature from a chorale and a string quartet
+        movement, one score at a time
+        '''
+        from music21 import features
+        for workName in ('bwv66.6', 'mozart/k80/movement1'):
+            s = corpus.parse(workName)
+            ds = features.DataSet(classLabel='Composer')
+            ds.addFeatureExtractors(features.jSymbolic.featureExtractors)
+            ds.addData(s, classValue='unknown')
+            ds.process()
+
+
+    def runKeyCorrelations(self):
+        '''
+        Finding the key of every span of quarter-note windows of a chorale 
+        with six key weightings, from pitch class distributions
+        '''
+        from music21.analysis import discrete, windowed
+        s = corpus.parse('bwv66.6')
+        ks = discrete.KrumhanslSchmuckler()
+        wa = windowed.WindowedAnalysis(s, ks)
+        minimum = [ks._getPitchClassDistribution(m.flat.notesAndRests)
+                   for m in wa._windowedStream]
+        distributions = []
+        for i in range(len(minimum)):
+            total = [0] * 12
+            for j in range(i, len(minimum)):
+                if minimum[j] is not None:
+                    total = [a + b for a, b in zip(total, minimum[j])]
+                distributions.append(total)
+        for analysisClass in (discrete.KrumhanslSchmuckler, discrete.KrumhanslKessler,
+                              discrete.AardenEssen, discrete.SimpleWeights, 
+                              discrete.BellmanBudge, discrete.TemperleyKostkaPayne):
+            analysisClass().processDistributions(distributions)
+
+    def runWindowedAnalysis(self):
+        '''
+        Windowed key and ambitus analysis of every window size of a chorale 
+        and of the smaller window sizes of a movement with triplets
+        '''
+        from music21.analysis import discrete, windowed
+        for workName, maxWindow in (('bwv66.6', None), ('mozart/k80/movement1', 12)):
+            s = corpus.parse(workName)
+            for p in (discrete.KrumhanslSchmuckler(), discrete.Ambitus()):
+                wa = windowed.WindowedAnalysis(s, p)
+                wa.process(1, maxWindow)
+
+    def runWindowedAnalysisCached(self):
+        '''
+        Windowed key analysis of a movement, analyzed once and then taken 
+        ten times from a result cache, as when replotting
+        '''
+        from music21.analysis import discrete, windowed
+        s = corpus.parse('mozart/k80/movement1')
+        cache = {}
+        for unused_i in range(11):
+            wa = windowed.WindowedAnalysis(s, discrete.KrumhanslSchmuckler(s))
+            wa.process(1, 12, resultCache=cache)
+
 
     def runParseABC(self):
         '''Creating loading a large multiwork abc file
@@ -194,6 +527,79 @@ class Test(unittest.TestCase):
 
 
 
+    def runTokenizeABC(self):
+        '''Tokenizing all core corpus abc files
+        '''
+        import codecs
+        from music21 import abcFormat
+        for fp in corpus.getCorePaths('abc'):
+            with codecs.open(fp, encoding='utf-8') as f:
+                ah = abcFormat.ABCHandler()
+                ah.tokenize(f.read())
+
+    def runTokenizeABCByCharacter(self):
+        '''Tokenizing all core corpus abc files one character at a time (reference)
+        '''
+        import codecs
+        from music21 import abcFormat
+        for fp in corpus.getCorePaths('abc'):
+            with codecs.open(fp, encoding='utf-8') as f:
+                ah = abcFormat.ABCHandler()
+                ah._tokenizeByCharacter(f.read())
+
+    def runParseABCOpusByNumber(self):
+        '''Loading each work of a large multiwork abc file by number
+        '''
+        from music21 import converter
+        lo = converter.LazyOpus(corpus.getWork('essenFolksong/han1'), forceSource=True)
+        for number in lo.getNumbers():
+            unused = lo.getScoreByNumber(number)
+
+    def runParseTokenFormatsCorpus(self):
+        '''Parsing a selection of core corpus abc, kern, and romanText files;
+        these share the token caches in common.TokenCache
+        '''
+        from music21 import converter
+        paths = (corpus.getCorePaths('abc')[::20] + 
+                 corpus.getCorePaths('krn')[::40] + 
+                 corpus.getCorePaths('rntxt')[::10])
+        for fp in paths:
+            try:
+                unused = converter.parse(fp, forceSource=True)
+            except UnicodeDecodeError: # a few files are not in the locale encoding
+                pass
+        environLocal.printDebug(['token caches', common.getTokenCacheStatistics()])
+
+    def runParseHumdrumTestFiles(self):
+        '''Parsing each of the humdrum test files
+        '''
+        from music21 import humdrum
+        from music21.humdrum import testFiles
+        testData = [testFiles.splitLots, testFiles.ojibway, testFiles.splitSpines,
+                    testFiles.schubert, testFiles.mazurka6, testFiles.ivesSpring,
+                    testFiles.sousaStars, testFiles.multipartSanctus]
+        for unused_i in range(5):
+            for data in testData:
+                unused = humdrum.parseData(data).stream
+
+    def runParseKernCorpus(self):
+        '''Parsing every tenth core corpus kern file
+        '''
+        from music21 import humdrum
+        for fp in corpus.getCorePaths('krn')[::10]:
+            try:
+                unused = humdrum.parseFile(fp).stream
+            except UnicodeDecodeError: # a few files are not in the locale encoding
+                pass
+
+    def runParseRomanTextCorpus(self):
+        '''Parsing every fourth core corpus romanText file; repeated figures
+        in a key share a cached parse in roman.RomanNumeral
+        '''
+        from music21 import converter
+        for fp in corpus.getCorePaths('rntxt')[::4]:
+            unused = converter.parse(fp, forceSource=True)
+
     def runGetElementsByContext(self):
         '''Test getting elements by context from a Stream
         '''
@@ -263,6 +669,126 @@ class Test(unittest.TestCase):
         # provide work and expected min/max in seconds
         for testMethod, best in [
 
+            (self.runTokenizeABC, 
+                {
+                 '2026.10.19': 15.49, 
+                }),
+
+            (self.runTokenizeABCByCharacter, 
+                {
+                 '2026.10.19': 26.53, 
+                }),
+
+            (self.runParseTokenFormatsCorpus, 
+                {
+                 '2026.10.19': 83.43, 
+                }),
+
+            (self.runParseHumdrumTestFiles, 
+                {
+                 '2026.10.19': 6.81, 
+                }),
+
+            (self.runParseKernCorpus, 
+                {
+                 '2026.10.19': 31.07, 
+                }),
+
+            (self.runCreateObjects, 
+                {
+                 '2026.10.19': 6.67, 
+                }),
+
+            (self.runParseScoreMemory,
+                {
+                 '2026.10.19': 1.77,
+                }),
+
+            (self.runDeepcopyScore,
+                {
+                 '2026.10.19': 4.96,
+                }),
+
+            (self.runShareScorePitchesAndDurations,
+                {
+                 '2026.10.19': 2.4,
+                }),
+
+            (self.runPitchPropertyAccess,
+                {
+                 '2026.10.19': 0.3,
+                }),
+
+            (self.runIntervalsBetweenNotes,
+                {
+                 '2026.10.19': 0.42,
+                }),
+
+            (self.runChordSetClassLookups,
+                {
+                 '2026.10.19': 0.36,
+                }),
+
+            (self.runAnalyzeChordifiedChorales,
+                {
+                 '2026.10.19': 1.88,
+                }),
+
+            (self.runMakeMeasuresTuplets,
+                {
+                 '2026.10.19': 2.83,
+                }),
+
+            (self.runChordifyTimespans,
+                {
+                 '2026.10.19': 4.47,
+                }),
+
+            (self.runNGramSearch,
+                {
+                 '2026.10.19': 5.46,
+                }),
+
+            (self.runScoreSimilarity,
+                {
+                 '2026.10.19': 2.35,
+                }),
+
+            (self.runDataSetProcessCached,
+                {
+                 '2026.10.19': 8.6,
+                }),
+
+            (self.runJSymbolicFeatures,
+                {
+                 '2026.10.19': 23.1,
+                }),
+
+            (self.runKeyCorrelations,
+                {
+                 '2026.10.19': 1.1,
+                }),
+
+            (self.runWindowedAnalysis,
+                {
+                 '2026.10.19': 3.9,
+                }),
+
+            (self.runWindowedAnalysisCached,
+                {
+                 '2026.10.19': 4.6,
+                }),
+
+            (self.runFilterByClass, 
+                {
+                 '2026.10.19': 0.62, 
+                }),
+
+            (self.runParseRomanTextCorpus, 
+                {
+                 '2026.10.19': 21.85, 
+                }),
+
             (self.runGetElementsByPrevious, 
                 {
                  '2011.11.29': 4.69, 
@@ -13,6 +13,7 @@
 import random
 import unittest
 import copy
+import gc
 
 from music21.stream import Stream
 from music21.stream import Voice
@@ -31,6 +32,7 @@ from music21 import metadata
 from music21 import meter
 from music21 import note
 from music21 import pitch
+from music21 import tie
 
 from music21.midi import translate as midiTranslate
 from music21.musicxml import m21ToString
@@ -6935,6 +6937,87 @@ class Test(unittest.TestCase):
         for c in chords.getElementsByClass('Chord'):
             self.assertEqual(len(c), 2)
 
+    def testChordifyTimespans(self):
+        from music21 import stream, corpus, converter, articulations, expressions
+        from music21.musicxml import testPrimitive
+
+        def describe(s):
+            post = []
+            for m in s.getElementsByClass('Measure'):
+                post.append((m.number, m.offset, [repr(e) for e in m.getElementsNotOfClass('GeneralNote')]))
+                for e in m.notesAndRests:
+                    info = [e.offset, e.quarterLength, e.classes[0]]
+                    if e.isChord:
+                        for n in e:
+                            info.append((n.pitch.nameWithOctave, n.pitch.groups,
+                                n.tie.type if n.tie is not None else None,
+                                n.pitch.accidental.displayStatus if n.pitch.accidental is not None else None))
+                        info.append([a.classes[0] for a in e.articulations])
+                        info.append([x.classes[0] for x in e.expressions])
+                    post.append(tuple(info))
+            return post
+
+        p1 = stream.Part()
+        p1.id = 'upper'
+        m = stream.Measure(number=1)
+        n = note.Note('F#4', quarterLength=3)
+        n.articulations.append(articulations.Accent())
+        n.expressions.append(expressions.Fermata())
+        m.append([n, note.Note('G4')])
+        p1.append(m)
+        m = stream.Measure(number=2)
+        v1 = stream.Voice()
+        v1.append([note.Note('A4', quarterLength=2), note.Note('B4', quarterLength=2)])
+        v2 = stream.Voice()
+        v2.append(note.Note('C#4', quarterLength=4))
+        m.insert(0, v1)
+        m.insert(0, v2)
+        p1.append(m)
+        p2 = stream.Part()
+        p2.id = 'lower'
+        m = stream.Measure(number=1)
+        g = note.Note('E3')
+        g.duration = g.duration.getGraceDuration()
+        m.append([g, note.Note('D3', quarterLength=1.5), note.Rest(quarterLength=1.5),
+            note.Note('C3')])
+        p2.append(m)
+        m = stream.Measure(number=2)
+        m.append([note.Note('B2', quarterLength=1.5), note.Note('B-2', quarterLength=2.5)])
+        p2.append(m)
+        s = stream.Score()
+        s.insert(0, p1)
+        s.insert(0, p2)
+
+        self.assertNotEqual(s._chordifyTimespans(), None)
+        for kw in ({}, {'addPartIdAsGroup': True}, {'displayTiedAccidentals': True},
+                {'addTies': False}):
+            self.assertEqual(describe(s.chordify(useTimespans=True, **kw)),
+                describe(s.chordify(**kw)))
+        # the source is left alone
+        self.assertEqual(n.quarterLength, 3.0)
+        self.assertEqual(n.tie, None)
+
+        m1 = s.chordify(useTimespans=True).getElementsByClass('Measure')[0]
+        # the grace note sorts first; only the first piece of the F# keeps the accent
+        self.assertEqual([c.pitchNames for c in m1.notes],
+            [['E', 'F#', 'D'], ['F#'], ['G', 'C']])
+        self.assertEqual([str(c.tie) for c in m1.notes],
+            ['<music21.tie.Tie start>', '<music21.tie.Tie stop>', 'None'])
+        self.assertEqual([len(c.articulations) for c in m1.notes], [1, 0, 0])
+
+        for s in (corpus.parse('bwv66.6'), corpus.parse('schoenberg/opus19/movement6'),
+                converter.parse(testPrimitive.triplets01)):
+            self.assertNotEqual(s._chordifyTimespans(), None)
+            self.assertEqual(describe(s.chordify(useTimespans=True)),
+                describe(s.chordify()))
+
+        # Streams without Measures are chordified the old way
+        s = stream.Stream()
+        s.repeatAppend(note.Note('G4', quarterLength=1/3.), 6)
+        s.insert(0, note.Note('C4', quarterLength=2))
+        self.assertEqual(s._chordifyTimespans(), None)
+        self.assertEqual(len(s.chordify(useTimespans=True).getElementsByClass('Chord')), 6)
+
 
     def testMakeVoicesA(self):
         from music21 import stream
@@ -7418,6 +7501,115 @@ class Test(unittest.TestCase):
         #s.show()
 
 
+    def testMakeImmutableSharePitchesAndDurations(self):
+        s = Stream()
+        m = Measure()
+        m.repeatAppend(note.Note('e-4', quarterLength=0.5), 4)
+        m.append(chord.Chord('C4 E4 G4'))
+        s.append(m)
+        s.append(note.Note('e-4', quarterLength=0.5))
+        s.makeImmutable(sharePitchesAndDurations=True)
+
+        notes = s.flat.getElementsByClass('Note')
+        self.assertEqual(len(notes), 5)
+        for n in notes:
+            self.assertTrue(n.pitch is notes[0].pitch)
+            self.assertTrue(n.duration is notes[0].duration)
+            self.assertTrue(common.isInterned(n.pitch))
+        # chord members keep their own pitches
+        c = s.flat.getElementsByClass('Chord')[0]
+        self.assertFalse(common.isInterned(c.pitches[0]))
+
+        # changing a Note through its own attributes copies first
+        notes[1].octave = 5
+        notes[2].quarterLength = 2.0
+        self.assertEqual(notes[0].nameWithOctave, 'E-4')
+        self.assertEqual(notes[0].quarterLength, 0.5)
+        self.assertEqual(notes[1].nameWithOctave, 'E-5')
+        self.assertEqual(notes[2].quarterLength, 2.0)
+        self.assertFalse(common.isInterned(notes[1].pitch))
+        self.assertFalse(common.isInterned(notes[2].duration))
+
+        # deepcopies never share
+        sCopy = copy.deepcopy(s)
+        notesCopy = sCopy.flat.getElementsByClass('Note')
+        self.assertFalse(common.isInterned(notesCopy[0].pitch))
+        self.assertFalse(notesCopy[0].pitch is notesCopy[3].pitch)
+        self.assertFalse(notesCopy[0].duration is notesCopy[3].duration)
+
+        s.makeMutable()
+        self.assertFalse(notes[0].pitch is notes[3].pitch)
+        self.assertFalse(notes[0].duration is notes[3].duration)
+        notes[0].pitch.octave = 3
+        self.assertEqual(notes[3].nameWithOctave, 'E-4')
+
+    def testMakeImmutableSharingIsPerStream(self):
+        gc.collect()
+        internedBefore = len(common._internedObjects)
+
+        def makeStream():
+            s = Stream()
+            m = Measure()
+            m.repeatAppend(note.Note('f4'), 3)
+            s.append(m)
+            s.makeImmutable(sharePitchesAndDurations=True)
+            return s
+
+        a = makeStream()
+        b = makeStream()
+        aNotes = a.flat.notes
+        bNotes = b.flat.notes
+        self.assertFalse(aNotes[0].pitch is bNotes[0].pitch)
+        self.assertFalse(aNotes[0].duration is bNotes[0].duration)
+
+        # changing shared objects directly changes only this Stream
+        aNotes[0].pitch.accidental = '#'
+        aNotes[1].duration.type = 'half'
+        self.assertEqual([n.name for n in aNotes], ['F#', 'F#', 'F#'])
+        self.assertEqual([n.name for n in bNotes], ['F', 'F', 'F'])
+        self.assertEqual([n.quarterLength for n in bNotes], [1.0, 1.0, 1.0])
+
+        # makeMutable() unshares the Notes of substreams, even without recursing
+        b.makeMutable(recurse=False)
+        bNotes[0].pitch.octave = 5
+        bNotes[1].duration.type = 'whole'
+        self.assertEqual([n.nameWithOctave for n in bNotes], ['F5', 'F4', 'F4'])
+        self.assertEqual([n.quarterLength for n in bNotes], [1.0, 4.0, 1.0])
+        self.assertFalse(common.isInterned(bNotes[2].pitch))
+
+        # the shared objects are forgotten with their Streams
+        del a, aNotes
+        gc.collect()
+        self.assertEqual(len(common._internedObjects), internedBefore)
+
+    def testMakeImmutableSharingInPlaceMethods(self):
+        def makePart(sharePitchesAndDurations):
+            p = Part()
+            m1 = Measure(number=1)
+            for n in ('C#4', 'C#4', 'D4'):
+                m1.append(note.Note(n))
+            m2 = Measure(number=2)
+            m2.append(note.Note('C#4'))
+            p.append([m1, m2])
+            p.makeImmutable(sharePitchesAndDurations=sharePitchesAndDurations)
+            return p
+
+        for share in (False, True):
+            p = makePart(share)
+            p.makeAccidentals(inPlace=True)
+            self.assertEqual([n.pitch.accidental.displayStatus
+                              for n in p.flat.notes if n.pitch.accidental],
+                             [True, False, True])
+
+        p = makePart(True)
+        notes = p.flat.notes
+        notes[0].tie = tie.Tie('start')
+        notes[1].tie = tie.Tie('stop')
+        p.stripTies(inPlace=True, retainContainers=True)
+        self.assertEqual([n.quarterLength for m in p for n in m.notes],
+                         [2.0, 1.0, 1.0])
+
+
 
 #------------------------------------------------------------------------------
 
@@ -88,6 +88,9 @@ from music21 import environment
 _MOD = "tinyNotation.py"
 environLocal = environment.Environment(_MOD)
 
+# note strings already parsed by TinyNotationNote._getTokenDescription
+_tokenDescriptionCache = common.TokenCache('tinyNotation.note')
+
 
 
 class TinyNotationStream(stream.Stream):
@@ -435,22 +438,20 @@ class TinyNotationNote(object):
             storedtie = tie.Tie("stop")
             storedDict['lastNoteTied'] = False
 
+        (pitchInfo, typeNum, hasTie, accidentalInfo, idString, 
+            lyric) = _tokenDescriptionCache.get((self.__class__, stringRep), 
+                                                self._getTokenDescription, stringRep)
+
         x = self.customPitchMatch(stringRep, storedDict)
        
         if x is not None:
             noteObj = x
-        elif (self.REST.match(stringRep) is not None): # rest
+        elif pitchInfo == 'rest':
             noteObj = note.Rest()
-        elif (self.OCTAVE2.match(stringRep)): # BB etc.
-            nn = self.OCTAVE2.match(stringRep)
-            noteObj = self._getPitch(nn, 3 - len(nn.group(1)))
-        elif (self.OCTAVE3.match(stringRep)):
-            noteObj = self._getPitch(self.OCTAVE3.match(stringRep), 3)
-        elif (self.OCTAVE5.match(stringRep)): # must match octave 5 then 4!
-            nn = self.OCTAVE5.match(stringRep)
-            noteObj = self._getPitch(nn, 4 + len(nn.group(2)))
-        elif (self.OCTAVE4.match(stringRep)): 
-            noteObj = self._getPitch(self.OCTAVE4.match(stringRep), 4)
+        elif pitchInfo is not None:
+            noteObj = note.Note()
+            noteObj.step = pitchInfo[0]
+            noteObj.octave = pitchInfo[1]
         else:
             raise TinyNotationException("could not get pitch information from " + str(stringRep))
 
@@ -460,8 +461,7 @@ class TinyNotationNote(object):
         ## get duration
         usedLastDuration = False
         
-        if (self.TYPE.search(stringRep)):
-            typeNum = self.TYPE.search(stringRep).group(1)
+        if typeNum is not None:
             if (typeNum == "0"): ## special case = full measure + fermata
                 if 'barDuration' in storedDict:
                     noteObj.duration = storedDict['barDuration']
@@ -481,8 +481,7 @@ class TinyNotationNote(object):
         self.getDots(stringRep, noteObj)
         
         ## get ties
-        if self.TIE.search(stringRep):
-            environLocal.printDebug('Found Tie Tie')
+        if hasTie:
             storedDict['lastNoteTied'] = True
             if noteObj.tie is None:
                 noteObj.tie = tie.Tie("start")
@@ -510,42 +509,90 @@ class TinyNotationNote(object):
         storedDict['lastDuration'] = noteObj.duration
 
         ## get accidentals
-        if (isinstance(noteObj, note.Note)):
-            if (self.EDSHARP.search(stringRep)): # must come before sharp
-                alter = len(self.EDSHARP.search(stringRep).group(1))
-                acc1 = pitch.Accidental(alter)
-                noteObj.editorial.ficta = acc1
-                noteObj.editorial.misc['pmfc-ficta'] = acc1
-            elif (self.EDFLAT.search(stringRep)): # must come before flat
-                alter = -1 * len(self.EDFLAT.search(stringRep).group(1))
+        if (isinstance(noteObj, note.Note)) and accidentalInfo is not None:
+            isEditorial, alter = accidentalInfo
+            if isEditorial:
                 acc1 = pitch.Accidental(alter)
                 noteObj.editorial.ficta = acc1
                 noteObj.editorial.misc['pmfc-ficta'] = acc1
-            elif (self.EDNAT.search(stringRep)):
-                acc1 = pitch.Accidental("natural")
-                noteObj.editorial.ficta = acc1
-                noteObj.editorial.misc['pmfc-ficta'] = acc1
-                noteObj.accidental = acc1
-            elif (self.SHARP.search(stringRep)):
-                alter = len(self.SHARP.search(stringRep).group(1))
-                noteObj.accidental = pitch.Accidental(alter)
-            elif (self.FLAT.search(stringRep)):
-                alter = -1 * len(self.FLAT.search(stringRep).group(1))
+                if alter == "natural":
+                    noteObj.accidental = acc1
+            else:
                 noteObj.accidental = pitch.Accidental(alter)
 
         self.customNotationMatch(noteObj, stringRep, storedDict)
 
-        if self.ID_EL.search(stringRep):
-            noteObj.id = self.ID_EL.search(stringRep).group(1)
+        if idString is not None:
+            noteObj.id = idString
         
-        if self.LYRIC.search(stringRep):
-            noteObj.lyric = self.LYRIC.search(stringRep).group(1)
+        if lyric is not None:
+            noteObj.lyric = lyric
             
         self._note = noteObj
         return self._note
     
     note = property(_getNote)
 
+    def _getTokenDescription(self, stringRep):
+        '''
+        Parse the parts of `stringRep` that do not depend on 
+        earlier notes into a tuple of (pitchInfo, typeNum, hasTie, 
+        accidentalInfo, idString, lyric) that can be cached.  
+        pitchInfo is 'rest', a tuple of (step, octave), or None.
+        
+        >>> tnN = tinyNotation.TinyNotationNote()
+        >>> tnN._getTokenDescription("AA-4.~=aflat_hel-")
+        (('A', 2), '4', True, (False, -1), 'aflat', 'hel-')
+        >>> tnN._getTokenDescription("d''(#)8")
+        (('D', 6), '8', False, (True, 1), None, None)
+        '''
+        if (self.REST.match(stringRep) is not None): # rest
+            pitchInfo = 'rest'
+        elif (self.OCTAVE2.match(stringRep)): # BB etc.
+            nn = self.OCTAVE2.match(stringRep)
+            pitchInfo = (nn.group(1).upper(), 3 - len(nn.group(1)))
+        elif (self.OCTAVE3.match(stringRep)):
+            pitchInfo = (self.OCTAVE3.match(stringRep).group(1).upper(), 3)
+        elif (self.OCTAVE5.match(stringRep)): # must match octave 5 then 4!
+            nn = self.OCTAVE5.match(stringRep)
+            pitchInfo = (nn.group(1).upper(), 4 + len(nn.group(2)))
+        elif (self.OCTAVE4.match(stringRep)): 
+            pitchInfo = (self.OCTAVE4.match(stringRep).group(1).upper(), 4)
+        else:
+            pitchInfo = None
+
+        typeNum = None
+        if (self.TYPE.search(stringRep)):
+            typeNum = self.TYPE.search(stringRep).group(1)
+
+        hasTie = False
+        if self.TIE.search(stringRep):
+            environLocal.printDebug('Found Tie Tie')
+            hasTie = True
+
+        # accidentals are only applied to Notes
+        accidentalInfo = None
+        if (self.EDSHARP.search(stringRep)): # must come before sharp
+            accidentalInfo = (True, len(self.EDSHARP.search(stringRep).group(1)))
+        elif (self.EDFLAT.search(stringRep)): # must come before flat
+            accidentalInfo = (True, -1 * len(self.EDFLAT.search(stringRep).group(1)))
+        elif (self.EDNAT.search(stringRep)):
+            accidentalInfo = (True, "natural")
+        elif (self.SHARP.search(stringRep)):
+            accidentalInfo = (False, len(self.SHARP.search(stringRep).group(1)))
+        elif (self.FLAT.search(stringRep)):
+            accidentalInfo = (False, -1 * len(self.FLAT.search(stringRep).group(1)))
+
+        idString = None
+        if self.ID_EL.search(stringRep):
+            idString = self.ID_EL.search(stringRep).group(1)
+
+        lyric = None
+        if self.LYRIC.search(stringRep):
+            lyric = self.LYRIC.search(stringRep).group(1)
+
+        return (pitchInfo, typeNum, hasTie, accidentalInfo, idString, lyric)
+
     def getDots(self, stringRep, noteObj):
         '''
         Subclassable method to set the dots attributes of 
@@ -563,12 +610,6 @@ class TinyNotationNote(object):
         elif (re.search(DOT, stringRep)):
             noteObj.duration.dots = 1
         
-    def _getPitch(self, matchObj, octave):
-        noteObj = note.Note()
-        noteObj.step = matchObj.group(1).upper()
-        noteObj.octave = octave
-        return noteObj
-
     def customPitchMatch(self, stringRep, storedDict):
         '''
         method to create a note object in sub classes of tiny notation.  
@@ -1803,10 +1803,11 @@ class Variant(base.Music21Object):
             # functionality duplicated from Music21Object
             if name == '_activeSite':
                 setattr(new, name, self.activeSite)
-            elif name == 'sites':
-                newValue = copy.deepcopy(part, memo)
-                newValue.containedById = id(new)
-                setattr(new, name, newValue)
+            elif name == '_sites':
+                if part is not None: # otherwise created when needed
+                    newValue = copy.deepcopy(part, memo)
+                    newValue.containedById = id(new)
+                    setattr(new, name, newValue)
             # do not deepcopy _stream, as this will copy the 
             # contained objects
             # this means that the new object is not really free of the 